@@ -0,0 +1,147 @@
+"""
+CPU latency and memory of the torch, int8 and onnx inference backends.
+
+Builds a small BART-style seq2seq model with randomly initialized weights
+and a word-level tokenizer trained on a synthetic corpus, so nothing is
+downloaded. Each backend runs in a fresh process so peak RSS is comparable.
+The model's outputs are meaningless; only speed and memory are measured.
+
+Requires torch and transformers (plus optimum[onnxruntime] for onnx).
+
+Usage:
+    python -m benchmarks.bench_backends --docs 32 --backends torch,int8,onnx
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+TOPICS = ['photosynthesis', 'mitosis', 'gravity', 'entropy', 'democracy', 'algebra', 'erosion']
+
+
+def make_corpus(docs: int):
+    """Generate lecture-like documents of varying length."""
+    return [
+        ' '.join(
+            f"Lecture {i} explains how {TOPICS[(i + j) % len(TOPICS)]} shapes topic {j}."
+            for j in range(10 + i % 30)
+        )
+        for i in range(docs)
+    ]
+
+
+def build_model(directory: str, corpus, d_model: int = 256, layers: int = 4):
+    """Save a randomly initialized BART model and a matching tokenizer."""
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors, trainers
+    from transformers import BartConfig, BartForConditionalGeneration, PreTrainedTokenizerFast
+
+    special = ['<s>', '<pad>', '</s>', '<unk>']
+    tokenizer = Tokenizer(models.WordLevel(unk_token='<unk>'))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.train_from_iterator(corpus, trainers.WordLevelTrainer(special_tokens=special))
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single='<s> $A </s>', special_tokens=[('<s>', 0), ('</s>', 2)]
+    )
+    PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        bos_token='<s>', pad_token='<pad>', eos_token='</s>', unk_token='<unk>',
+        model_max_length=512
+    ).save_pretrained(directory)
+
+    config = BartConfig(
+        vocab_size=tokenizer.get_vocab_size(),
+        d_model=d_model,
+        encoder_layers=layers,
+        decoder_layers=layers,
+        encoder_attention_heads=4,
+        decoder_attention_heads=4,
+        encoder_ffn_dim=4 * d_model,
+        decoder_ffn_dim=4 * d_model,
+        max_position_embeddings=512,
+        pad_token_id=1, bos_token_id=0, eos_token_id=2,
+        decoder_start_token_id=2, forced_eos_token_id=2
+    )
+    BartForConditionalGeneration(config).save_pretrained(directory)
+
+
+def measure(backend: str, model_dir: str, docs: int, batch_size: int) -> dict:
+    """Load one backend and time summarize_many (runs in a child process)."""
+    from src.backends import create_pipeline
+    from src.model_pool import ModelPool
+    from src.summarizer import Summarizer
+
+    start = time.perf_counter()
+    pipeline = create_pipeline(backend, model_dir, 'cpu')
+    load_seconds = time.perf_counter() - start
+
+    summarizer = Summarizer(language='en', backend=backend, model_pool=ModelPool(lambda name: pipeline))
+    texts = make_corpus(docs)
+    summarizer.summarize_many(texts[:batch_size], 0.3, batch_size=batch_size)
+
+    start = time.perf_counter()
+    summarizer.summarize_many(texts, 0.3, batch_size=batch_size)
+    seconds = time.perf_counter() - start
+    return {
+        'backend': backend,
+        'load_seconds': load_seconds,
+        'docs_per_sec': docs / seconds,
+        'ms_per_doc': 1000.0 * seconds / docs,
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+    }
+
+
+def run(backends, docs: int, batch_size: int, threads: int) -> list:
+    """
+    Benchmark each backend in its own process on the same local model.
+
+    Returns:
+        List of result dictionaries, one per backend
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        model_dir = os.path.join(workdir, 'tiny-bart')
+        build_model(model_dir, make_corpus(64))
+        # Keep ONNX exports out of the user's cache
+        os.environ['XDG_CACHE_HOME'] = os.path.join(workdir, 'cache')
+        os.environ['OMP_NUM_THREADS'] = str(threads)
+        context = multiprocessing.get_context('spawn')
+        for backend in backends:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                try:
+                    results.append(executor.submit(measure, backend, model_dir, docs, batch_size).result())
+                except Exception as e:
+                    results.append({'backend': backend, 'error': str(e)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=32)
+    parser.add_argument('--batch-size', type=int, default=8)
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--backends', default='torch,int8,onnx')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.backends.split(','), args.docs, args.batch_size, args.threads)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        if 'error' in result:
+            print(f"{result['backend']:6} error: {result['error']}")
+            continue
+        print(
+            f"{result['backend']:6} load {result['load_seconds']:6.2f}s  "
+            f"{result['ms_per_doc']:8.1f} ms/doc  peak RSS {result['peak_rss_mb']:7.1f} MB"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+DOCX extraction speed and memory: streaming parser against python-docx.
+
+Generates large .docx course packs (paragraphs with a table every few
+paragraphs) and compares FileProcessor.read_docx, which parses
+word/document.xml incrementally, with the previous implementation that
+built a python-docx Document and joined its paragraphs (and therefore
+missed table text). Each method runs in a fresh process so its peak RSS
+can be reported.
+
+Usage:
+    python -m benchmarks.bench_docx --sizes 1000000 10000000
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.corpus import make_text
+
+
+def write_course_pack(path: str, chars: int, table_every: int = 10):
+    """Save a generated text as DOCX with a 4x3 table after every ``table_every`` paragraphs."""
+    from docx import Document
+
+    document = Document()
+    for i, paragraph in enumerate(make_text('en', chars).split('\n\n'), 1):
+        document.add_paragraph(paragraph)
+        if i % table_every == 0:
+            table = document.add_table(rows=4, cols=3)
+            for row_index, row in enumerate(table.rows):
+                for column, cell in enumerate(row.cells):
+                    cell.text = f"Row {row_index} column {column} of table {i // table_every}"
+    document.save(path)
+
+
+def _python_docx(path: str) -> str:
+    """The previous read_docx implementation."""
+    from docx import Document
+
+    return '\n'.join(p.text for p in Document(path).paragraphs)
+
+
+def _streaming(path: str) -> str:
+    from src.file_processor import FileProcessor
+
+    return FileProcessor.read_docx(path)
+
+
+METHODS = {'python-docx': _python_docx, 'streaming': _streaming}
+
+
+def measure(method: str, path: str, repeat: int) -> dict:
+    """Time one extraction method (runs in a child process)."""
+    import docx  # noqa: F401  (import cost is not part of the measurement)
+    import src.file_processor  # noqa: F401
+
+    # ru_maxrss is reported in kilobytes on Linux
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = METHODS[method](path)
+        timings.append(time.perf_counter() - start)
+    return {
+        'method': method,
+        'file_mb': os.path.getsize(path) / (1024 * 1024),
+        'chars': len(text),
+        'best_ms': min(timings) * 1000,
+        'peak_rss_growth_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base_rss) / 1024.0,
+    }
+
+
+def run(sizes, repeat: int = 3) -> list:
+    """
+    Benchmark both methods on one generated file per size.
+
+    Returns:
+        List of result dictionaries
+    """
+    results = []
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            path = os.path.join(workdir, f"pack-{size}.docx")
+            write_course_pack(path, size)
+            for method in METHODS:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    row = executor.submit(measure, method, path, repeat).result()
+                results.append(dict(row, size=size))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000_000, 5_000_000],
+                        help='Characters of generated text per file')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'size':>10} {'method':<12}{'file MB':>9}{'chars':>11}{'best ms':>10}{'peak +MB':>10}")
+    for row in results:
+        print(f"{row['size']:>10} {row['method']:<12}{row['file_mb']:>9.1f}{row['chars']:>11}"
+              f"{row['best_ms']:>10.1f}{row['peak_rss_growth_mb']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Language detection latency against document length.
+
+Compares Summarizer.detect_language (sampled, script/stopword shortcuts,
+memoized) with plain langdetect over the whole document, which is what
+the tool used before.
+
+Usage:
+    python -m benchmarks.bench_language --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import src.language
+from src.language import detect_language
+
+SENTENCES = {
+    'en': "Machine learning models are trained on large amounts of data. ",
+    'ru': "Модели машинного обучения обучаются на больших объёмах данных. ",
+    'de': "Modelle des maschinellen Lernens werden mit großen Datenmengen trainiert. ",
+}
+
+
+def _time(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat
+
+
+def _uncached(text):
+    src.language._cache.clear()
+    return detect_language(text)
+
+
+def _full_langdetect(text):
+    from langdetect import DetectorFactory, detect
+    DetectorFactory.seed = 0
+    return detect(text)
+
+
+def run(sizes, repeat: int = 3, baseline: bool = True) -> list:
+    """
+    Time detection for every language and document size.
+    
+    Returns:
+        List of result dictionaries (latencies in milliseconds)
+    """
+    results = []
+    for lang, sentence in SENTENCES.items():
+        for size in sizes:
+            text = (sentence * (size // len(sentence) + 1))[:size]
+            row = {
+                'language': lang,
+                'chars': size,
+                'sampled_ms': _time(_uncached, text, repeat) * 1000,
+                'memoized_ms': _time(detect_language, text, repeat) * 1000,
+            }
+            if baseline:
+                row['full_langdetect_ms'] = _time(_full_langdetect, text, 1) * 1000
+            results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-baseline', action='store_true', help='Skip full-text langdetect')
+    args = parser.parse_args()
+    
+    print(f"{'lang':<5}{'chars':>10}{'sampled ms':>14}{'memoized ms':>14}{'langdetect ms':>16}")
+    for row in run(args.sizes, args.repeat, not args.no_baseline):
+        full = row.get('full_langdetect_ms')
+        print(f"{row['language']:<5}{row['chars']:>10}{row['sampled_ms']:>14.3f}"
+              f"{row['memoized_ms']:>14.3f}{'' if full is None else f'{full:.1f}':>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Throughput scaling and memory of the pre-fork worker pool.
+
+Loads a model once, forks pools of increasing size and reports docs/sec
+and the pool's real memory footprint (sum of PSS) next to what the same
+number of independently started processes would hold (workers x the RSS
+of one loaded process). Uses the tiny local BART model from
+bench_backends unless --model is given. Linux only (reads /proc).
+
+Usage:
+    python -m benchmarks.bench_prefork --workers 1 2 4 --docs 64
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.bench_backends import build_model, make_corpus
+
+MB = 1024 * 1024
+
+
+def run(model: str, worker_counts, docs: int, backend: str = 'torch') -> list:
+    """
+    Time a pre-fork pool for every worker count.
+
+    Returns:
+        List of result dictionaries, one per worker count
+    """
+    from src.backends import create_pipeline
+    from src.model_pool import ModelPool
+    from src.prefork import PreforkPool, process_memory
+    from src.summarizer import Summarizer
+
+    pipeline = create_pipeline(backend, model, 'cpu')
+    single_rss = process_memory(os.getpid()).get('rss', 0)
+    texts = make_corpus(docs)
+    results = []
+    for workers in worker_counts:
+        summarizer = Summarizer(
+            language='en', backend=backend, model_pool=ModelPool(lambda name: pipeline)
+        )
+        with PreforkPool(summarizer, workers=workers, languages=['en']) as pool:
+            pool.summarize_many(texts[:workers], 0.3)
+            start = time.perf_counter()
+            pool.summarize_many(texts, 0.3)
+            seconds = time.perf_counter() - start
+            memory = pool.memory_stats()
+        results.append({
+            'workers': workers,
+            'threads_per_worker': pool.threads_per_worker,
+            'docs_per_sec': docs / seconds,
+            'pool_pss_mb': memory['total_pss'] / MB,
+            'pool_rss_mb': memory['total_rss'] / MB,
+            'independent_rss_mb': (workers + 1) * single_rss / MB,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--docs', type=int, default=64)
+    parser.add_argument('--model', help='Model id or directory (default: tiny local BART)')
+    parser.add_argument('--backend', default='torch')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        model = args.model
+        if model is None:
+            model = os.path.join(workdir, 'tiny-bart')
+            build_model(model, make_corpus(64))
+        results = run(model, args.workers, args.docs, args.backend)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'workers':>8}{'docs/sec':>10}{'pool PSS MB':>13}{'independent MB':>16}")
+    for row in results:
+        print(f"{row['workers']:>8}{row['docs_per_sec']:>10.1f}"
+              f"{row['pool_pss_mb']:>13.1f}{row['independent_rss_mb']:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Latency and quality of the fast, balanced and quality decoding profiles.
+
+By default runs the tiny randomly initialized BART model from
+bench_backends (no download), which measures decoding cost only. Pass
+--model with a real checkpoint (e.g. sshleifer/distilbart-cnn-6-6) and
+--references with a JSONL file of {"text", "summary"} pairs to measure
+quality as ROUGE-1/ROUGE-2 F1; without references, the extractive
+TextRank summary of each text serves as a rough reference.
+
+Usage:
+    python -m benchmarks.bench_profiles --docs 16
+    python -m benchmarks.bench_profiles --model sshleifer/distilbart-cnn-6-6 --references refs.jsonl
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import List, Optional
+
+from benchmarks.bench_backends import build_model, make_corpus
+from src.profiles import PROFILES
+
+
+def _ngrams(text: str, n: int) -> Counter:
+    words = text.lower().split()
+    return Counter(tuple(words[i:i + n]) for i in range(len(words) - n + 1))
+
+
+def rouge_n(candidate: str, reference: str, n: int = 1) -> float:
+    """ROUGE-N F1 between a candidate and a reference summary."""
+    candidate_ngrams, reference_ngrams = _ngrams(candidate, n), _ngrams(reference, n)
+    overlap = sum((candidate_ngrams & reference_ngrams).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(candidate_ngrams.values())
+    recall = overlap / sum(reference_ngrams.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def load_references(path: str) -> List[dict]:
+    """Read {"text", "summary"} pairs from a JSONL file."""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run(model: str, texts: List[str], references: List[str], profiles, backend: str = 'torch') -> list:
+    """
+    Summarize the texts with every profile.
+
+    Returns:
+        List of result dictionaries, one per profile
+    """
+    from src.backends import create_pipeline
+    from src.model_pool import ModelPool
+    from src.summarizer import Summarizer
+
+    pipeline = create_pipeline(backend, model, 'cpu')
+    results = []
+    for profile in profiles:
+        summarizer = Summarizer(
+            language='en', backend=backend, profile=profile,
+            model_pool=ModelPool(lambda name: pipeline)
+        )
+        summarizer.summarize(texts[0], 0.3)
+
+        start = time.perf_counter()
+        summaries = [summary for summary, _ in summarizer.summarize_many(texts, 0.3)]
+        seconds = time.perf_counter() - start
+        results.append({
+            'profile': profile,
+            'ms_per_doc': 1000.0 * seconds / len(texts),
+            'mean_summary_words': sum(len(s.split()) for s in summaries) / len(summaries),
+            'rouge1': sum(rouge_n(s, r, 1) for s, r in zip(summaries, references)) / len(texts),
+            'rouge2': sum(rouge_n(s, r, 2) for s, r in zip(summaries, references)) / len(texts),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=16)
+    parser.add_argument('--model', help='Model id or directory (default: tiny local BART)')
+    parser.add_argument('--references', help='JSONL file with "text" and "summary" fields')
+    parser.add_argument('--backend', default='torch')
+    parser.add_argument('--profiles', default=','.join(PROFILES))
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if args.references:
+        pairs = load_references(args.references)[:args.docs]
+        texts, references = [p['text'] for p in pairs], [p['summary'] for p in pairs]
+    else:
+        from src.summarizer import Summarizer
+        texts = make_corpus(args.docs)
+        extractive = Summarizer(language='en', engine='extractive')
+        references = [extractive.summarize(text, 0.3)[0] for text in texts]
+
+    with tempfile.TemporaryDirectory() as workdir:
+        model: Optional[str] = args.model
+        if model is None:
+            model = os.path.join(workdir, 'tiny-bart')
+            build_model(model, make_corpus(64))
+        results = run(model, texts, references, args.profiles.split(','), args.backend)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'profile':<10}{'ms/doc':>10}{'words':>8}{'ROUGE-1':>9}{'ROUGE-2':>9}")
+    for row in results:
+        print(f"{row['profile']:<10}{row['ms_per_doc']:>10.1f}{row['mean_summary_words']:>8.1f}"
+              f"{row['rouge1']:>9.3f}{row['rouge2']:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Throughput of Summarizer.summarize_many against a per-call summarize loop.
+
+Uses a stub pipeline with a fixed per-call overhead, so the benchmark runs
+without downloading models and isolates the effect of batching.
+
+Usage:
+    python -m benchmarks.bench_summarize_many --docs 200 --batch-size 16
+"""
+
+import argparse
+import time
+
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+
+
+class LatencyPipeline:
+    """Stub pipeline that sleeps per call and per input, like a real model."""
+    
+    def __init__(self, call_overhead=0.005, item_cost=0.0005):
+        self.call_overhead = call_overhead
+        self.item_cost = item_cost
+    
+    def __call__(self, inputs, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        time.sleep(self.call_overhead + self.item_cost * len(texts))
+        max_length = kwargs.get('max_new_tokens', kwargs.get('max_length', 1024))
+        return [{'summary_text': ' '.join(t.split()[:max_length])} for t in texts]
+
+
+def make_corpus(docs: int):
+    """Generate documents of varying length."""
+    return [
+        ' '.join(f"Lecture {i} sentence {j} covers a topic." for j in range(5 + i % 20))
+        for i in range(docs)
+    ]
+
+
+def run(docs: int, batch_size: int, compression: float = 0.3) -> dict:
+    """
+    Time summarize in a loop and summarize_many on the same corpus.
+    
+    Returns:
+        Dictionary with docs/sec for both paths and the speedup
+    """
+    texts = make_corpus(docs)
+    pipeline = LatencyPipeline()
+    summarizer = Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline))
+    
+    start = time.perf_counter()
+    for text in texts:
+        summarizer.summarize(text, compression)
+    loop_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    summarizer.summarize_many(texts, compression, batch_size=batch_size)
+    batch_seconds = time.perf_counter() - start
+    
+    return {
+        'docs': docs,
+        'batch_size': batch_size,
+        'loop_docs_per_sec': docs / loop_seconds,
+        'batched_docs_per_sec': docs / batch_seconds,
+        'speedup': loop_seconds / batch_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=16)
+    args = parser.parse_args()
+    
+    result = run(args.docs, args.batch_size)
+    print(f"per-call loop:  {result['loop_docs_per_sec']:.1f} docs/sec")
+    print(f"summarize_many: {result['batched_docs_per_sec']:.1f} docs/sec")
+    print(f"speedup:        {result['speedup']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+"""
+Synthetic lecture-like corpora in English, Russian and German.
+
+Texts are assembled from per-language vocabularies with a seeded random
+generator, so every run of a benchmark sees exactly the same input.
+"""
+
+import random
+import textwrap
+from pathlib import Path
+from typing import List
+
+VOCABULARY = {
+    'en': {
+        'subjects': ['The cell', 'Photosynthesis', 'The market', 'Gravity', 'The student',
+                     'The algorithm', 'Democracy', 'Erosion', 'The theorem', 'Energy'],
+        'verbs': ['explains', 'changes', 'requires', 'produces', 'describes',
+                  'limits', 'supports', 'transforms', 'measures', 'connects'],
+        'objects': ['the structure of matter', 'a stable equilibrium', 'the flow of information',
+                    'the growth of plants', 'the rules of the system', 'a new hypothesis',
+                    'the results of the experiment', 'the history of the region'],
+        'tails': ['in most cases', 'according to the lecture', 'over a long period of time',
+                  'under normal conditions', 'as the example shows', 'for this reason'],
+    },
+    'ru': {
+        'subjects': ['Клетка', 'Фотосинтез', 'Рынок', 'Гравитация', 'Студент',
+                     'Алгоритм', 'Демократия', 'Эрозия', 'Теорема', 'Энергия'],
+        'verbs': ['объясняет', 'изменяет', 'требует', 'создаёт', 'описывает',
+                  'ограничивает', 'поддерживает', 'преобразует', 'измеряет', 'связывает'],
+        'objects': ['структуру вещества', 'устойчивое равновесие', 'поток информации',
+                    'рост растений', 'правила системы', 'новую гипотезу',
+                    'результаты эксперимента', 'историю региона'],
+        'tails': ['в большинстве случаев', 'согласно лекции', 'в течение долгого времени',
+                  'при обычных условиях', 'как показывает пример', 'по этой причине'],
+    },
+    'de': {
+        'subjects': ['Die Zelle', 'Die Photosynthese', 'Der Markt', 'Die Schwerkraft', 'Der Student',
+                     'Der Algorithmus', 'Die Demokratie', 'Die Erosion', 'Der Satz', 'Die Energie'],
+        'verbs': ['erklärt', 'verändert', 'erfordert', 'erzeugt', 'beschreibt',
+                  'begrenzt', 'unterstützt', 'verwandelt', 'misst', 'verbindet'],
+        'objects': ['die Struktur der Materie', 'ein stabiles Gleichgewicht', 'den Fluss der Information',
+                    'das Wachstum der Pflanzen', 'die Regeln des Systems', 'eine neue Hypothese',
+                    'die Ergebnisse des Experiments', 'die Geschichte der Region'],
+        'tails': ['in den meisten Fällen', 'laut der Vorlesung', 'über einen langen Zeitraum',
+                  'unter normalen Bedingungen', 'wie das Beispiel zeigt', 'aus diesem Grund'],
+    },
+}
+
+LANGUAGES = tuple(VOCABULARY)
+
+
+def make_text(language: str, chars: int, seed: int = 0, paragraph_sentences: int = 6) -> str:
+    """
+    Generate a text of about ``chars`` characters.
+
+    Args:
+        language: 'en', 'ru' or 'de'
+        chars: Approximate length of the text
+        seed: Random seed
+        paragraph_sentences: Sentences per paragraph
+
+    Returns:
+        Paragraphs of generated sentences separated by blank lines
+    """
+    words = VOCABULARY[language]
+    rng = random.Random(f"{language}-{seed}")
+    paragraphs, sentences, length = [], [], 0
+    while length < chars:
+        sentence = (
+            f"{rng.choice(words['subjects'])} {rng.choice(words['verbs'])} "
+            f"{rng.choice(words['objects'])} {rng.choice(words['tails'])}."
+        )
+        sentences.append(sentence)
+        length += len(sentence) + 1
+        if len(sentences) == paragraph_sentences:
+            paragraphs.append(' '.join(sentences))
+            sentences = []
+    if sentences:
+        paragraphs.append(' '.join(sentences))
+    return '\n\n'.join(paragraphs)
+
+
+def make_corpus(language: str, docs: int, chars: int, seed: int = 0) -> List[str]:
+    """Generate ``docs`` texts of about ``chars`` characters each."""
+    return [make_text(language, chars, seed + i) for i in range(docs)]
+
+
+def write_txt(path: Path, text: str):
+    """Save a text as UTF-8."""
+    Path(path).write_text(text, encoding='utf-8')
+
+
+def write_docx(path: Path, text: str):
+    """Save a text as a DOCX file, one paragraph per blank-line block."""
+    from docx import Document
+
+    document = Document()
+    for paragraph in text.split('\n\n'):
+        document.add_paragraph(paragraph)
+    document.save(str(path))
+
+
+def _pdf_escape(line: str) -> str:
+    # The built-in Helvetica font only covers Latin-1
+    line = line.encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path: Path, text: str, lines_per_page: int = 50, width: int = 90):
+    """
+    Save a text as a minimal PDF with one text object per line.
+
+    Characters outside Latin-1 are replaced, which keeps the extraction
+    work comparable without embedding a font.
+    """
+    lines = [line for block in text.split('\n\n') for line in textwrap.wrap(block, width) + ['']]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            ' '.join(f"{4 + 2 * i} 0 R" for i in range(len(pages))), len(pages)
+        ),
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for i, page in enumerate(pages):
+        stream = "BT /F1 10 Tf 12 TL 50 760 Td " + ' '.join(
+            f"({_pdf_escape(line)}) Tj T*" for line in page
+        ) + " ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream.encode('latin-1'))} >>\nstream\n{stream}\nendstream")
+
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode('latin-1')
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    for offset in offsets:
+        body += f"{offset:010d} 00000 n \n".encode('latin-1')
+    body += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    ).encode('latin-1')
+    Path(path).write_bytes(body)
+
+
+WRITERS = {
+    '.txt': write_txt,
+    '.docx': write_docx,
+    '.pdf': write_pdf,
+}
@@ -0,0 +1,233 @@
+"""
+Benchmark suite timing every stage of the pipeline on synthetic corpora.
+
+Stages (per language): file extraction for each supported format,
+language detection, sentence splitting, extractive summarization, key
+point extraction and summarize() with a stub pipeline (which measures the
+tool's own overhead around the model). Results are written as JSON; with
+--baseline, medians are compared against an earlier run and stages slower
+by more than --threshold are reported as regressions (exit status 1).
+
+Usage:
+    python -m benchmarks.suite --chars 50000 --output results.json
+    python -m benchmarks.suite --chars 50000 --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import src.language
+from benchmarks.corpus import LANGUAGES, WRITERS, make_text
+from src.chunking import split_sentences
+from src.file_processor import FileProcessor
+from src.language import detect_language
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+
+FORMAT_VERSION = 1
+
+STAGES = (
+    'read_file', 'detect_language', 'split_sentences',
+    'simple_summarize', 'extract_key_points', 'summarize',
+)
+
+
+class EchoPipeline:
+    """Stub pipeline returning the first ``max_length`` words of each input."""
+
+    def __init__(self):
+        self.tokenizer = None
+
+    def __call__(self, inputs, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        max_length = kwargs.get('max_new_tokens', kwargs.get('max_length', 1024))
+        return [{'summary_text': ' '.join(t.split()[:max_length])} for t in texts]
+
+
+def time_call(func: Callable[[], object], repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """
+    Time a call after one warm-up run.
+
+    Args:
+        func: Callable to time
+        repeat: Number of timed runs
+        setup: Callable run (untimed) before every run, e.g. to clear caches
+
+    Returns:
+        Dictionary with median, min and mean milliseconds and the run count
+    """
+    timings = []
+    for run in range(repeat + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        if run:
+            timings.append(elapsed)
+    return {
+        'median_ms': statistics.median(timings),
+        'min_ms': min(timings),
+        'mean_ms': statistics.mean(timings),
+        'runs': repeat,
+    }
+
+
+def _clear_language_cache():
+    src.language._cache.clear()
+
+
+def run(
+    languages=LANGUAGES,
+    chars: int = 50000,
+    repeat: int = 5,
+    stages=STAGES,
+    formats=tuple(WRITERS)
+) -> Dict:
+    """
+    Run the selected stages for every language.
+
+    Args:
+        languages: Language codes to generate corpora for
+        chars: Approximate size of each document in characters
+        repeat: Timed runs per stage
+        stages: Stage names to run
+        formats: File extensions used by the read_file stage
+
+    Returns:
+        Report dictionary with metadata and per-stage timings
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for language in languages:
+            text = make_text(language, chars)
+            extractive = Summarizer(language=language, engine='extractive')
+            stub = EchoPipeline()
+            abstractive = Summarizer(language=language, model_pool=ModelPool(lambda name: stub))
+
+            if 'read_file' in stages:
+                for extension in formats:
+                    path = Path(workdir) / f"{language}{extension}"
+                    try:
+                        WRITERS[extension](path, text)
+                        FileProcessor.read_file(path)
+                    except ImportError as e:
+                        print(f"skipping read_file{extension}: {e}", file=sys.stderr)
+                        continue
+                    results[f"read_file{extension}/{language}"] = time_call(
+                        lambda: FileProcessor.read_file(path), repeat
+                    )
+            if 'detect_language' in stages:
+                results[f"detect_language/{language}"] = time_call(
+                    lambda: detect_language(text), repeat, setup=_clear_language_cache
+                )
+            if 'split_sentences' in stages:
+                results[f"split_sentences/{language}"] = time_call(
+                    lambda: split_sentences(text), repeat
+                )
+            if 'simple_summarize' in stages:
+                results[f"simple_summarize/{language}"] = time_call(
+                    lambda: extractive._simple_summarize(text, 0.3), repeat
+                )
+            if 'extract_key_points' in stages:
+                results[f"extract_key_points/{language}"] = time_call(
+                    lambda: extractive.extract_key_points(text, 5), repeat
+                )
+            if 'summarize' in stages:
+                results[f"summarize/{language}"] = time_call(
+                    lambda: abstractive.summarize(text, 0.3, language=language), repeat
+                )
+
+    return {
+        'version': FORMAT_VERSION,
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'chars': chars,
+            'repeat': repeat,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(
+    current: Dict,
+    baseline: Dict,
+    threshold: float = 0.1,
+    min_delta_ms: float = 0.05
+) -> List[Dict]:
+    """
+    Compare median timings of two reports.
+
+    Args:
+        current: Report of this run
+        baseline: Earlier report
+        threshold: Relative slowdown flagged as a regression (0.1 = 10%)
+        min_delta_ms: Absolute slowdown below which differences are noise
+
+    Returns:
+        One row per stage present in both reports, with the ratio and flag
+    """
+    rows = []
+    for name, result in current['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None:
+            continue
+        before, after = previous['median_ms'], result['median_ms']
+        ratio = after / before if before > 0 else float('inf')
+        rows.append({
+            'stage': name,
+            'baseline_ms': before,
+            'current_ms': after,
+            'ratio': ratio,
+            'regression': ratio > 1.0 + threshold and after - before > min_delta_ms,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--languages', nargs='+', default=list(LANGUAGES), choices=LANGUAGES)
+    parser.add_argument('--chars', type=int, default=50000, help='Characters per document')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--stages', nargs='+', default=list(STAGES), choices=STAGES)
+    parser.add_argument('--formats', nargs='+', default=list(WRITERS), choices=list(WRITERS))
+    parser.add_argument('--output', '-o', help='Write the JSON report here (default: stdout)')
+    parser.add_argument('--baseline', '-b', help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    report = run(args.languages, args.chars, args.repeat, args.stages, args.formats)
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+        report['comparison'] = compare(report, baseline, args.threshold)
+        regressions = [row for row in report['comparison'] if row['regression']]
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + '\n', encoding='utf-8')
+    else:
+        print(payload)
+
+    # Human-readable summary goes to stderr so stdout stays valid JSON
+    for name, result in report['results'].items():
+        print(f"{name:<32}{result['median_ms']:>12.3f} ms", file=sys.stderr)
+    for row in report.get('comparison', []):
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['stage']:<32}{row['ratio']:>8.2f}x{flag}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
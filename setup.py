@@ -59,6 +59,9 @@ setup(
         "pdf": [
             "PyPDF2>=3.0.1",
         ],
+        "onnx": [
+            "optimum[onnxruntime]>=1.14.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,363 @@
+"""
+Persistent caches: content-addressed summaries and key points, and text
+extracted from source files.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Bump when the stored value format or key layout changes
+CACHE_VERSION = 2
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Compressed bytes of extracted text kept by ExtractionCache
+DEFAULT_EXTRACTION_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory for the tool."""
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'edu-summarizer'
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so formatting-only edits share a cache entry."""
+    return ' '.join(text.split())
+
+
+def make_key(
+    text: str,
+    language: Optional[str],
+    compression_level: Optional[float],
+    model_name: str,
+    params: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build a cache key from the content and everything that affects the output.
+
+    Args:
+        text: Input text (normalized before hashing)
+        language: Language code the text is summarized in
+        compression_level: Compression level, or None where not applicable
+        model_name: Model or method that produces the output
+        params: Generation parameters
+
+    Returns:
+        Hex digest identifying the cached value
+    """
+    text_hash = hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+    descriptor = json.dumps(
+        [CACHE_VERSION, text_hash, language, compression_level, model_name, params or {}],
+        sort_keys=True
+    )
+    return hashlib.sha256(descriptor.encode('utf-8')).hexdigest()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Open a database shared safely between threads and processes."""
+    conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+class _SqliteLRUCache:
+    """
+    SQLite table with size-bounded least-recently-used eviction.
+
+    The database runs in WAL mode with a busy timeout, so several processes
+    can share one cache directory. Subclasses name the database file and
+    table and list the table's columns besides ``key`` and ``last_access``;
+    a ``size`` column holds each entry's stored size in bytes.
+    """
+
+    FILENAME = ''
+    TABLE = ''
+    # (name, SQL type) of every column between key and last_access
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, cache_dir, max_bytes: int):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the database (defaults to the user cache dir)
+            max_bytes: Maximum total size of stored values
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / self.FILENAME
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = _connect(self.path)
+        columns = ''.join(f' {name} {kind} NOT NULL,' for name, kind in self.COLUMNS)
+        self._conn.execute(
+            f'CREATE TABLE IF NOT EXISTS {self.TABLE} ('
+            f' key TEXT PRIMARY KEY,{columns}'
+            ' last_access REAL NOT NULL)'
+        )
+        self._conn.execute(
+            f'CREATE INDEX IF NOT EXISTS {self.TABLE}_last_access ON {self.TABLE} (last_access)'
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _touch(self, key: str):
+        """Mark an entry as recently used (caller holds the lock)."""
+        self._conn.execute(
+            f'UPDATE {self.TABLE} SET last_access = ? WHERE key = ?', (time.time(), key)
+        )
+
+    def _store(self, key: str, *values):
+        """
+        Insert or replace an entry, evicting old entries over the size cap.
+
+        Args:
+            key: Entry key
+            *values: One value per column in COLUMNS, in order
+        """
+        names = ', '.join(name for name, _ in self.COLUMNS)
+        placeholders = ', '.join('?' * (len(self.COLUMNS) + 2))
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute(
+                    f'INSERT OR REPLACE INTO {self.TABLE} (key, {names}, last_access)'
+                    f' VALUES ({placeholders})',
+                    (key,) + values + (time.time(),)
+                )
+                self._evict(keep=key)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def _evict(self, keep: str):
+        """Delete least recently used entries until the cache fits max_bytes."""
+        total = self._conn.execute(f'SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            f'SELECT key, size FROM {self.TABLE} WHERE key != ? ORDER BY last_access, rowid',
+            (keep,)
+        )
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._conn.executemany(f'DELETE FROM {self.TABLE} WHERE key = ?', doomed)
+        self.evictions += len(doomed)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute(f'DELETE FROM {self.TABLE}')
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SummaryCache(_SqliteLRUCache):
+    """Cache of summaries and key points, stored as JSON."""
+
+    FILENAME = 'summaries.sqlite3'
+    TABLE = 'entries'
+    COLUMNS = (('value', 'TEXT'), ('size', 'INTEGER'))
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the database (defaults to the user cache dir)
+            max_bytes: Maximum total size of stored values
+        """
+        super().__init__(cache_dir, max_bytes)
+
+    def get(self, key: str) -> Any:
+        """
+        Look up a value and mark it as recently used.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key)
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Any):
+        """
+        Store a JSON-serializable value, evicting old entries over the size cap.
+
+        Args:
+            key: Key from make_key
+            value: Value to cache
+        """
+        payload = json.dumps(value, ensure_ascii=False)
+        self._store(key, payload, len(payload.encode('utf-8')))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entry count and size
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries'
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size,
+        }
+
+
+class ExtractionCache(_SqliteLRUCache):
+    """
+    SQLite-backed cache of text extracted from files, compressed with zlib.
+
+    Entries are keyed by the file's resolved path (and page range) and are
+    valid while the file's size and modification time are unchanged; a
+    stale entry is dropped on lookup. With ``content_hash`` the key is a
+    SHA-256 of the file contents instead, which survives renames and
+    ``touch`` at the cost of reading the file on every lookup. Least
+    recently used entries are evicted once the compressed total exceeds
+    ``max_bytes``.
+    """
+
+    FILENAME = 'extractions.sqlite3'
+    TABLE = 'extractions'
+    COLUMNS = (
+        ('file_size', 'INTEGER'),
+        ('mtime_ns', 'INTEGER'),
+        ('value', 'BLOB'),
+        ('size', 'INTEGER'),
+        ('text_size', 'INTEGER'),
+    )
+
+    def __init__(
+        self,
+        cache_dir=None,
+        max_bytes: int = DEFAULT_EXTRACTION_MAX_BYTES,
+        content_hash: bool = False
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the database (defaults to the user cache dir)
+            max_bytes: Maximum total size of compressed texts
+            content_hash: Key entries by file contents instead of path, size and mtime
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.content_hash = content_hash
+        self.invalidations = 0
+        # Source file bytes that did not have to be parsed again
+        self.bytes_saved = 0
+
+    def _key(self, file_path, page_range: Optional[Tuple[int, int]]) -> Tuple[str, int, int]:
+        """Return the entry key and the file's current size and mtime."""
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        if self.content_hash:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            identity = 'sha256:' + digest.hexdigest()
+        else:
+            identity = str(path)
+        key = json.dumps([CACHE_VERSION, identity, list(page_range) if page_range else None])
+        return key, stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path, page_range: Optional[Tuple[int, int]] = None) -> Optional[str]:
+        """
+        Look up the extracted text of a file and mark it as recently used.
+
+        Args:
+            file_path: Path of the source file
+            page_range: Page range the text was extracted with (PDF only)
+
+        Returns:
+            The cached text, or None on a miss or if the file has changed
+        """
+        key, file_size, mtime_ns = self._key(file_path, page_range)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT file_size, mtime_ns, value FROM extractions WHERE key = ?', (key,)
+            ).fetchone()
+            if row is not None and not self.content_hash and (row[0], row[1]) != (file_size, mtime_ns):
+                self._conn.execute('DELETE FROM extractions WHERE key = ?', (key,))
+                self.invalidations += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.bytes_saved += file_size
+            self._touch(key)
+        return zlib.decompress(row[2]).decode('utf-8')
+
+    def put(self, file_path, text: str, page_range: Optional[Tuple[int, int]] = None):
+        """
+        Store the extracted text of a file, evicting old entries over the size cap.
+
+        Args:
+            file_path: Path of the source file
+            text: Extracted text
+            page_range: Page range the text was extracted with (PDF only)
+        """
+        key, file_size, mtime_ns = self._key(file_path, page_range)
+        raw = text.encode('utf-8')
+        value = zlib.compress(raw, 6)
+        self._store(key, file_size, mtime_ns, value, len(value), len(raw))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dictionary with hits, misses, invalidations, evictions, source
+            bytes saved, entry count and compressed/uncompressed text size
+        """
+        with self._lock:
+            entries, size, text_size = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(text_size), 0)'
+                ' FROM extractions'
+            ).fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'evictions': self.evictions,
+            'bytes_saved': self.bytes_saved,
+            'entries': entries,
+            'bytes': size,
+            'text_bytes': text_size,
+        }
@@ -0,0 +1,178 @@
+"""
+Token-aware splitting of long documents into model-sized chunks.
+"""
+
+import re
+import zlib
+from typing import Callable, List, NamedTuple, Union
+
+from .document import Document
+
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+# On average one paragraph in ANCHOR_EVERY closes a paragraph-aligned chunk
+ANCHOR_EVERY = 8
+
+
+class Chunk(NamedTuple):
+    """A piece of a document together with its token count."""
+    text: str
+    tokens: int
+
+
+def count_words(text: str) -> int:
+    """Approximate token counter used when no tokenizer is available."""
+    return len(text.split())
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """
+    Split text on blank lines.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Non-empty paragraphs with surrounding whitespace removed
+    """
+    return [p.strip() for p in _PARAGRAPH_RE.split(text) if p.strip()]
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, keeping the terminating punctuation.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Non-empty sentences with whitespace normalized
+    """
+    return Document(text).sentences()
+
+
+def _split_oversized(sentence: str, tokens: int, max_tokens: int) -> List[str]:
+    """Break a sentence longer than the window into word-aligned pieces."""
+    words = sentence.split()
+    per_piece = max(1, int(len(words) * max_tokens / tokens))
+    return [' '.join(words[i:i + per_piece]) for i in range(0, len(words), per_piece)]
+
+
+def chunk_text(
+    text: Union[str, Document],
+    max_tokens: int,
+    count_tokens: Callable[[str], int] = count_words
+) -> List[Chunk]:
+    """
+    Pack sentences into chunks that fit a model's token window.
+
+    Chunks break on sentence boundaries and prefer paragraph boundaries;
+    every sentence is counted exactly once, so the cost is linear in the
+    length of the text.
+
+    Args:
+        text: Input text or an already segmented Document
+        max_tokens: Maximum number of tokens per chunk
+        count_tokens: Callable returning the token count of a string
+
+    Returns:
+        List of chunks in document order
+    """
+    document = Document.from_text(text)
+    # Word counts are precomputed by the document
+    word_counts = document.word_counts.tolist() if count_tokens is count_words else None
+    chunks = []
+    paragraphs = []
+    sentences = []
+    used = 0
+
+    def flush():
+        nonlocal paragraphs, sentences, used
+        if sentences:
+            paragraphs.append(' '.join(sentences))
+        if paragraphs:
+            chunks.append(Chunk('\n\n'.join(paragraphs), used))
+        paragraphs, sentences, used = [], [], 0
+
+    for paragraph in document.iter_paragraphs():
+        if sentences:
+            paragraphs.append(' '.join(sentences))
+            sentences = []
+        for index in paragraph:
+            sentence = document.sentence(index)
+            tokens = word_counts[index] if word_counts is not None else count_tokens(sentence)
+            if tokens > max_tokens:
+                flush()
+                for piece in _split_oversized(sentence, tokens, max_tokens):
+                    chunks.append(Chunk(piece, count_tokens(piece)))
+                continue
+            if used + tokens > max_tokens:
+                flush()
+            sentences.append(sentence)
+            used += tokens
+
+    flush()
+    return chunks
+
+
+def _is_anchor(paragraph: str, anchor_every: int) -> bool:
+    """Decide from a paragraph's content alone whether a chunk ends after it."""
+    return zlib.crc32(paragraph.encode('utf-8')) % anchor_every == 0
+
+
+def chunk_paragraphs(
+    text: Union[str, Document],
+    max_tokens: int,
+    count_tokens: Callable[[str], int] = count_words,
+    anchor_every: int = ANCHOR_EVERY
+) -> List[Chunk]:
+    """
+    Pack whole paragraphs into chunks with content-defined boundaries.
+
+    A chunk ends when the next paragraph would overflow the window or after
+    an anchor paragraph, chosen by a hash of its text. Editing a paragraph
+    therefore only changes the chunks up to the next anchor; all other
+    chunks stay byte-identical, so their summaries can be reused.
+    Paragraphs longer than the window are split on sentences and form
+    chunks of their own.
+
+    Args:
+        text: Input text or an already segmented Document
+        max_tokens: Maximum number of tokens per chunk
+        count_tokens: Callable returning the token count of a string
+        anchor_every: Average number of paragraphs between anchors
+
+    Returns:
+        List of chunks in document order
+    """
+    document = Document.from_text(text)
+    word_counts = document.word_counts.tolist() if count_tokens is count_words else None
+    chunks = []
+    paragraphs = []
+    used = 0
+
+    def flush():
+        nonlocal paragraphs, used
+        if paragraphs:
+            chunks.append(Chunk('\n\n'.join(paragraphs), used))
+        paragraphs, used = [], 0
+
+    for indices in document.iter_paragraphs():
+        paragraph = ' '.join(document.sentence(i) for i in indices)
+        if word_counts is not None:
+            tokens = sum(word_counts[i] for i in indices)
+        else:
+            tokens = count_tokens(paragraph)
+        if tokens > max_tokens:
+            flush()
+            chunks.extend(chunk_text(paragraph, max_tokens, count_tokens))
+            continue
+        if used + tokens > max_tokens:
+            flush()
+        paragraphs.append(paragraph)
+        used += tokens
+        if _is_anchor(paragraph, anchor_every):
+            flush()
+
+    flush()
+    return chunks
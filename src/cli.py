@@ -2,24 +2,191 @@
 Command-line interface for the summarization tool.
 """
 
+import functools
+import json
+import sys
 import click
 from pathlib import Path
+from typing import List, Optional
 from .summarizer import Summarizer
 from .file_processor import FileProcessor
+from .document import Document
+from .cache import ExtractionCache, SummaryCache, default_cache_dir
+from .metrics import Metrics, set_hook
 
+# Suffix appended to input file names for batch-mode summaries
+SUMMARY_SUFFIX = '.summary.txt'
+# Heading printed above the summary text
+SUMMARY_HEADER = f"SUMMARY:\n{'='*50}\n"
 
-@click.command()
+
+class DefaultCommandGroup(click.Group):
+    """Command group that runs ``summarize`` when no subcommand is named."""
+    
+    default_command = 'summarize'
+    
+    def parse_args(self, ctx, args):
+        if not args or (args[0] not in self.commands and args[0] != '--help'):
+            args = [self.default_command] + list(args)
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Educational Material Summarization Tool
+    
+    Automatically summarize educational materials with support for multiple languages.
+    Without a command name, arguments are passed to ``summarize``.
+    """
+
+
+def _model_options(func):
+    """
+    Add the options of every command that builds a Summarizer.
+    
+    Their values reach the command as a single ``model_options`` dictionary,
+    to be passed to _build_summarizer.
+    """
+    options = [
+        click.option(
+            '--engine', '-e',
+            type=click.Choice(['auto', 'extractive'], case_sensitive=False),
+            default='auto',
+            help='Summarization engine (auto uses transformers with fallback, extractive never loads a model)'
+        ),
+        click.option(
+            '--backend', '-b',
+            type=click.Choice(['torch', 'int8', 'onnx'], case_sensitive=False),
+            default='torch',
+            help='Inference backend (int8: quantized PyTorch on CPU, onnx: ONNX Runtime via optimum)'
+        ),
+        click.option(
+            '--profile',
+            type=click.Choice(['fast', 'balanced', 'quality'], case_sensitive=False),
+            default='balanced',
+            help='Decoding profile (fast: greedy and capped length, quality: 4-beam search)'
+        ),
+        click.option(
+            '--model-dir',
+            type=click.Path(exists=True, file_okay=False),
+            default=None,
+            help='Directory of downloaded models (<org>/<name> or <org>--<name>), used before the Hub'
+        ),
+        click.option(
+            '--offline',
+            is_flag=True,
+            help='Never download models; use --model-dir or the local Hugging Face cache only'
+        ),
+        click.option(
+            '--memory-budget',
+            type=click.IntRange(min=1),
+            default=None,
+            help='Memory budget for loaded models in MB; models that do not fit fall back to a smaller one or extractive'
+        ),
+        click.option(
+            '--idle-ttl',
+            type=click.FloatRange(min=0, min_open=True),
+            default=None,
+            help='Unload models not used for this many seconds'
+        ),
+        click.option(
+            '--cache-dir',
+            type=click.Path(file_okay=False),
+            default=None,
+            help='Directory of the persistent summary cache (default: ~/.cache/edu-summarizer)'
+        ),
+        click.option(
+            '--no-cache',
+            is_flag=True,
+            help='Bypass the summary cache'
+        ),
+    ]
+    names = ('engine', 'backend', 'profile', 'model_dir', 'offline', 'memory_budget', 'idle_ttl',
+             'cache_dir', 'no_cache')
+    
+    @functools.wraps(func)
+    def command(**kwargs):
+        model_options = {name: kwargs.pop(name) for name in names}
+        return func(model_options=model_options, **kwargs)
+    
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def _build_summarizer(model_options: dict, language: str = 'auto', **overrides) -> Summarizer:
+    """
+    Create a Summarizer from the shared model options.
+    
+    Args:
+        model_options: Values of the _model_options options
+        language: Language option of the command
+        **overrides: Other Summarizer arguments (e.g. a shared model_pool and cache)
+        
+    Returns:
+        The configured Summarizer
+    """
+    settings = dict(
+        language=language.lower(),
+        engine=model_options['engine'].lower(),
+        backend=model_options['backend'].lower(),
+        profile=model_options['profile'].lower(),
+        model_dir=model_options['model_dir'],
+        offline=model_options['offline'],
+        cache_dir=_cache_dir(model_options),
+        max_model_memory=_megabytes(model_options['memory_budget']),
+        idle_ttl=model_options['idle_ttl'],
+    )
+    settings.update(overrides)
+    if 'cache' not in settings:
+        # Only open a database when the caller does not bring its own cache
+        settings['cache'] = None if model_options['no_cache'] else SummaryCache(_cache_dir(model_options))
+    return Summarizer(**settings)
+
+
+def _extraction_cache(model_options: dict) -> Optional[ExtractionCache]:
+    """Create the extraction cache unless caching is disabled."""
+    return None if model_options['no_cache'] else ExtractionCache(_cache_dir(model_options))
+
+
+def _cache_dir(model_options: dict) -> Path:
+    """Directory of the persistent caches."""
+    return Path(model_options['cache_dir'] or default_cache_dir())
+
+
+@main.command()
+@_model_options
 @click.option(
     '--input', '-i',
-    type=click.Path(exists=True),
-    required=True,
+    type=click.Path(exists=True, dir_okay=False),
     help='Path to input file (txt, docx, or pdf)'
 )
+@click.option(
+    '--input-dir', '-d',
+    type=click.Path(exists=True, file_okay=False),
+    help='Directory of input files to summarize in batch mode'
+)
+@click.option(
+    '--pattern', '-p',
+    default=None,
+    help='Glob pattern for files in --input-dir (e.g. "**/*.pdf"; default: all supported files)'
+)
+@click.option(
+    '--pages',
+    callback=lambda ctx, param, value: _parse_page_range(value),
+    help='Page range of a PDF input to summarize, e.g. "10-25"'
+)
 @click.option(
     '--output', '-o',
     type=click.Path(),
     help='Path to output file (optional, prints to stdout if not specified)'
 )
+@click.option(
+    '--output-dir',
+    type=click.Path(file_okay=False),
+    help='Directory for per-file summaries in batch mode (default: --input-dir)'
+)
 @click.option(
     '--language', '-l',
     type=click.Choice(['en', 'ru', 'de', 'auto'], case_sensitive=False),
@@ -37,17 +204,69 @@ from .file_processor import FileProcessor
     is_flag=True,
     help='Also extract and display key points'
 )
-def main(input, output, language, compression, key_points):
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    default=4,
+    help='Number of workers reading files ahead in batch mode'
+)
+@click.option(
+    '--processes',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Worker processes for batch mode; forked after loading models so they share weights'
+)
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Re-summarize files whose summary is already up to date'
+)
+@click.option(
+    '--stream',
+    is_flag=True,
+    help='Write summary sections as they are generated (skips the final length-reducing pass)'
+)
+@click.option(
+    '--metrics-json',
+    type=click.Path(dir_okay=False),
+    default=None,
+    help='Write per-stage timings and counters to this JSON file'
+)
+def summarize(input, input_dir, pattern, pages, output, output_dir, language, compression,
+              key_points, workers, processes, force, stream, metrics_json, model_options):
     """
-    Educational Material Summarization Tool
-    
-    Automatically summarize educational materials with support for multiple languages.
+    Summarize a file or every file in a directory.
     """
+    if bool(input) == bool(input_dir):
+        raise click.UsageError("Specify exactly one of --input or --input-dir")
+    
+    if metrics_json:
+        collector = Metrics()
+        previous = set_hook(collector)
+        
+        def finish():
+            set_hook(previous)
+            _write_metrics(Path(metrics_json), collector)
+        
+        # Written when the command finishes, including on errors
+        click.get_current_context().call_on_close(finish)
+    
+    if input_dir:
+        summarizer = _build_summarizer(model_options, language)
+        failed = _summarize_directory(
+            summarizer, Path(input_dir), pattern, Path(output_dir or input_dir),
+            float(compression) / 100.0, None if language == 'auto' else language.lower(),
+            key_points, workers, force, processes, _extraction_cache(model_options)
+        )
+        if failed:
+            raise click.Abort()
+        return
+    
     try:
         # Read input file
         click.echo(f"Reading file: {input}")
         file_processor = FileProcessor()
-        text = file_processor.read_file(input)
+        text = file_processor.read_file(input, page_range=pages, cache=_extraction_cache(model_options))
         
         if not text.strip():
             click.echo("Error: Input file is empty", err=True)
@@ -56,43 +275,416 @@ def main(input, output, language, compression, key_points):
         click.echo(f"Input text length: {len(text)} characters")
         
         # Initialize summarizer
-        summarizer = Summarizer(language=language.lower())
+        summarizer = _build_summarizer(model_options, language)
         
         # Convert compression level
         compression_ratio = float(compression) / 100.0
         
         # Summarize
         click.echo(f"Summarizing with {compression}% compression...")
-        summary, detected_lang = summarizer.summarize(text, compression_ratio, language.lower() if language != 'auto' else None)
-        
-        click.echo(f"Detected language: {detected_lang}")
-        click.echo(f"Summary length: {len(summary)} characters")
-        
-        # Extract key points if requested
-        result = f"SUMMARY:\n{'='*50}\n{summary}\n\n"
-        
-        if key_points:
-            points = summarizer.extract_key_points(text, num_points=5)
-            result += f"KEY POINTS:\n{'='*50}\n"
-            for i, point in enumerate(points, 1):
-                result += f"{i}. {point}\n"
-            result += "\n"
+        # Segment once and share the document between summary and key points
+        document = Document(text)
+        target_language = language.lower() if language != 'auto' else None
+        if stream:
+            sections = summarizer.summarize_iter(document, compression_ratio, target_language)
+        else:
+            # The whole summary at once, reduced to the requested length
+            sections = [summarizer.summarize(document, compression_ratio, target_language)]
         
-        # Output result
+        # Write sections to the destination as they are produced
         if output:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(result)
-            click.echo(f"Summary saved to: {output}")
+            destination = open(output_path, 'w', encoding='utf-8')
         else:
-            click.echo("\n" + result)
+            destination = None
+        try:
+            summary_length = 0
+            for i, (section, detected_lang) in enumerate(sections):
+                if not i:
+                    click.echo(f"Detected language: {detected_lang}")
+                    _emit(destination, ("" if destination else "\n") + SUMMARY_HEADER)
+                _emit(destination, section + "\n\n")
+                summary_length += len(section) + (2 if i else 0)
+            
+            # Extract key points if requested
+            if key_points:
+                _emit(destination, _format_key_points(summarizer.extract_key_points(document, num_points=5)))
+        finally:
+            if destination is not None:
+                destination.close()
+        
+        click.echo(f"Summary length: {summary_length} characters")
+        chunks = summarizer.chunk_stats()
+        if chunks['hits']:
+            click.echo(
+                f"Reused {chunks['hits']} of {chunks['hits'] + chunks['misses']} cached chunk summaries "
+                f"({chunks['reused_fraction']:.0%} of the text)"
+            )
+        if output:
+            click.echo(f"Summary saved to: {output}")
             
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         raise click.Abort()
 
 
+@main.command()
+@_model_options
+@click.option('--host', default='127.0.0.1', help='Host to bind')
+@click.option('--port', type=int, default=8000, help='TCP port to bind')
+@click.option(
+    '--socket', 'unix_socket',
+    type=click.Path(dir_okay=False),
+    help='Listen on a Unix domain socket instead of TCP'
+)
+@click.option(
+    '--language', '-l',
+    type=click.Choice(['en', 'ru', 'de', 'auto'], case_sensitive=False),
+    default='auto',
+    help='Default language of incoming texts'
+)
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of batches processed concurrently'
+)
+@click.option(
+    '--max-batch-size',
+    type=click.IntRange(min=1),
+    default=8,
+    help='Maximum number of requests coalesced into one batch'
+)
+@click.option(
+    '--max-wait-ms',
+    type=click.FloatRange(min=0),
+    default=20.0,
+    help='Maximum time a request waits for its batch to fill'
+)
+@click.option(
+    '--max-models',
+    type=click.IntRange(min=1),
+    default=3,
+    help='Maximum number of language models kept warm'
+)
+@click.option(
+    '--preload',
+    default='',
+    help='Comma-separated languages whose models are loaded at startup (e.g. "en,ru")'
+)
+def serve(host, port, unix_socket, language, workers, max_batch_size, max_wait_ms, max_models, preload,
+          model_options):
+    """
+    Run a summarization server that keeps models warm.
+    
+    Endpoints: POST /summarize {"text", "compression", "language", "key_points"},
+    GET /health and GET /metrics.
+    """
+    from .server import MicroBatcher, create_server
+    
+    metrics = Metrics()
+    set_hook(metrics)
+    # One pool and cache shared by every worker's Summarizer
+    shared = _build_summarizer(model_options, language, max_models=max_models)
+    batcher = MicroBatcher(
+        lambda: _build_summarizer(model_options, language, model_pool=shared.model_pool, cache=shared.cache),
+        max_batch_size=max_batch_size,
+        max_wait=max_wait_ms / 1000.0,
+        workers=workers
+    )
+    languages = [lang.strip() for lang in preload.split(',') if lang.strip()]
+    if languages and shared.engine != 'extractive':
+        click.echo(f"Loading models: {', '.join(languages)}")
+        batcher.warm_up(languages)
+    
+    server = create_server(batcher, host=host, port=port, unix_socket=unix_socket, metrics=metrics)
+    click.echo(f"Serving on {unix_socket or f'http://{host}:{server.server_port}'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+@main.command()
+@_model_options
+@click.option(
+    '--input', '-i', 'input_file',
+    type=click.File('r', encoding='utf-8'),
+    default='-',
+    help='JSONL file of {"id", "text" | "path", "language", "compression"} records (default: stdin)'
+)
+@click.option(
+    '--output', '-o', 'output_file',
+    type=click.File('w', encoding='utf-8'),
+    default='-',
+    help='JSONL file receiving {"id", "summary", "language"} records (default: stdout)'
+)
+@click.option(
+    '--errors', 'errors_file',
+    type=click.File('w', encoding='utf-8'),
+    default=None,
+    help='JSONL file receiving {"id", "line", "error"} records of failed inputs (default: stderr)'
+)
+@click.option(
+    '--language', '-l',
+    type=click.Choice(['en', 'ru', 'de', 'auto'], case_sensitive=False),
+    default='auto',
+    help='Language of records without a "language" field'
+)
+@click.option(
+    '--compression', '-c',
+    type=click.Choice(['20', '30', '50'], case_sensitive=False),
+    default='30',
+    help='Compression level of records without a "compression" field'
+)
+@click.option(
+    '--key-points', '-k',
+    is_flag=True,
+    help='Also extract key points'
+)
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of records summarized concurrently'
+)
+@click.option(
+    '--window',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Maximum records read ahead of the output (default: 4 per worker)'
+)
+@click.option(
+    '--ordered/--unordered',
+    default=True,
+    help='Write results in input order (default) or as soon as they finish'
+)
+def jsonl(input_file, output_file, errors_file, language, compression, key_points, workers, window, ordered,
+          model_options):
+    """
+    Summarize JSONL records from stdin (or a file) into JSONL.
+    
+    Records are streamed through a bounded window, so memory stays flat on
+    corpora of any size. Failed records are written to the error stream and
+    the run continues; the exit status is 1 if any record failed.
+    """
+    from .jsonl import run_records
+    
+    # One pool and cache shared by every worker's Summarizer
+    shared = _build_summarizer(model_options, language)
+    results = run_records(
+        input_file,
+        lambda: _build_summarizer(model_options, language, model_pool=shared.model_pool, cache=shared.cache),
+        workers=workers,
+        window=window,
+        ordered=ordered,
+        compression_level=float(compression) / 100.0,
+        language=None if language == 'auto' else language.lower(),
+        key_points=5 if key_points else 0,
+        extraction_cache=_extraction_cache(model_options)
+    )
+    errors_file = errors_file or sys.stderr
+    done = failed = 0
+    for ok, record in results:
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        if ok:
+            done += 1
+            output_file.write(line)
+            # Downstream readers of the stream see each record as it is done
+            output_file.flush()
+        else:
+            failed += 1
+            errors_file.write(line)
+            errors_file.flush()
+    click.echo(f"Summarized {done} records, failed {failed}", err=True)
+    if failed:
+        sys.exit(1)
+
+
+def _parse_page_range(value: str):
+    """Parse a "first-last" (or single page) option into a tuple."""
+    if not value:
+        return None
+    try:
+        first, _, last = value.partition('-')
+        return int(first), int(last or first)
+    except ValueError:
+        raise click.BadParameter(f"Expected a page range like 10-25, got {value!r}")
+
+
+def _megabytes(value: Optional[int]) -> Optional[int]:
+    """Convert an optional size in MB to bytes."""
+    return None if value is None else value * 1024 * 1024
+
+
+def _write_metrics(path: Path, metrics: Metrics):
+    """Save a metrics snapshot as JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(metrics.snapshot(), indent=2) + '\n', encoding='utf-8')
+
+
+def _format_result(summary: str, points: List[str] = None) -> str:
+    """Render a summary and optional key points as the CLI output text."""
+    result = f"{SUMMARY_HEADER}{summary}\n\n"
+    if points is not None:
+        result += _format_key_points(points)
+    return result
+
+
+def _format_key_points(points: List[str]) -> str:
+    """Render the key points section of the CLI output text."""
+    result = f"KEY POINTS:\n{'='*50}\n"
+    for i, point in enumerate(points, 1):
+        result += f"{i}. {point}\n"
+    return result + "\n"
+
+
+def _emit(destination, text: str):
+    """Write output text to a file (or stdout when None) and flush it."""
+    if destination is None:
+        click.echo(text, nl=False)
+    else:
+        destination.write(text)
+        destination.flush()
+
+
+def _collect_inputs(input_dir: Path, pattern: str, output_dir: Path) -> List[Path]:
+    """List the files to summarize, skipping summaries and the output directory."""
+    if pattern:
+        candidates = input_dir.glob(pattern)
+    else:
+        candidates = (
+            p for p in input_dir.rglob('*')
+            if p.suffix.lower() in FileProcessor.SUPPORTED_EXTENSIONS
+        )
+    return sorted(
+        p for p in candidates
+        if p.is_file()
+        and not p.name.endswith(SUMMARY_SUFFIX)
+        and (output_dir == input_dir or output_dir.resolve() not in p.resolve().parents)
+    )
+
+
+def _output_path(path: Path, input_dir: Path, output_dir: Path) -> Path:
+    """Mirror an input file's location under the output directory."""
+    relative = path.relative_to(input_dir)
+    return output_dir / relative.parent / (relative.name + SUMMARY_SUFFIX)
+
+
+def _is_up_to_date(path: Path, output_path: Path) -> bool:
+    """Check whether a summary is newer than its source file."""
+    return output_path.exists() and output_path.stat().st_mtime >= path.stat().st_mtime
+
+
+def _summarize_directory(summarizer, input_dir, pattern, output_dir, compression_ratio,
+                         language, key_points, workers, force, processes=1,
+                         extraction_cache=None) -> int:
+    """
+    Summarize every matching file under a directory.
+    
+    Files are read in a worker pool that prefetches ahead of the summarizer,
+    and files whose summary is already newer than the source are skipped
+    unless ``force`` is set. With ``processes`` > 1, summaries are computed
+    by a pre-fork pool whose workers share the loaded model weights. Text
+    extracted from unchanged PDF/DOCX files is taken from
+    ``extraction_cache`` instead of being parsed again.
+    
+    Returns:
+        Number of files that failed
+    """
+    if output_dir.resolve() == input_dir.resolve():
+        output_dir = input_dir
+    inputs = _collect_inputs(input_dir, pattern, output_dir)
+    todo = [p for p in inputs if force or not _is_up_to_date(p, _output_path(p, input_dir, output_dir))]
+    skipped = len(inputs) - len(todo)
+    click.echo(f"Found {len(inputs)} files, {skipped} already up to date")
+    
+    pool = None
+    if processes > 1 and todo:
+        from .prefork import PreforkPool
+        # Models of other languages are loaded by the workers on demand
+        preload = language or summarizer.language
+        pool = PreforkPool(
+            summarizer, workers=processes, languages=['en' if preload == 'auto' else preload]
+        )
+    
+    done = failed = 0
+    pending = []
+    
+    def write(path, summary, detected_lang, points):
+        nonlocal done
+        output_path = _output_path(path, input_dir, output_dir)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(_format_result(summary, points))
+        done += 1
+        click.echo(f"[{done + failed}/{len(todo)}] {path} ({detected_lang}) -> {output_path}")
+    
+    def report_error(path, error):
+        nonlocal failed
+        failed += 1
+        click.echo(f"[{done + failed}/{len(todo)}] Error: {path}: {error}", err=True)
+    
+    def flush():
+        try:
+            outcomes = pool.summarize_many(
+                [text for _, text in pending], compression_ratio, language, 5 if key_points else 0,
+                return_errors=True
+            )
+        except Exception as e:
+            # A worker died: nothing in the batch can be trusted, and the
+            # pool refuses further batches
+            outcomes = [(False, e)] * len(pending)
+        for (path, _), (ok, value) in zip(pending, outcomes):
+            try:
+                if not ok:
+                    raise value
+                write(path, *value)
+            except Exception as e:
+                report_error(path, e)
+        pending.clear()
+    
+    try:
+        for path, text, error in FileProcessor.iter_read(
+            todo, workers=workers, prefetch=2 * workers, cache=extraction_cache
+        ):
+            try:
+                if error is not None:
+                    raise error
+                if not text.strip():
+                    raise ValueError("Input file is empty")
+                if pool is not None:
+                    if pool.broken is not None:
+                        raise RuntimeError(f"Worker pool is broken: {pool.broken}")
+                    pending.append((path, text))
+                    if len(pending) >= 2 * processes:
+                        flush()
+                    continue
+                document = Document(text)
+                summary, detected_lang = summarizer.summarize(document, compression_ratio, language)
+                points = summarizer.extract_key_points(document, num_points=5) if key_points else None
+                write(path, summary, detected_lang, points)
+            except Exception as e:
+                report_error(path, e)
+        if pending:
+            flush()
+    finally:
+        if pool is not None:
+            pool.close()
+    
+    click.echo(f"Summarized {done} files, skipped {skipped}, failed {failed}")
+    if extraction_cache is not None and extraction_cache.hits:
+        click.echo(
+            f"Reused extracted text of {extraction_cache.hits} files "
+            f"({extraction_cache.bytes_saved / (1024 * 1024):.1f} MB not parsed again)"
+        )
+    return failed
+
+
 if __name__ == '__main__':
     main()
 
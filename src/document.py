@@ -0,0 +1,155 @@
+"""
+Preprocessed document representation shared by the summarization stages.
+"""
+
+import re
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Sentence ends after terminal punctuation; blank lines end paragraphs
+_BOUNDARY_RE = re.compile(r'[.!?]+(?=\s|$)|[^\S\n]*\n\s*\n')
+_WHITESPACE_RE = re.compile(r'\s*')
+_TRAILING_WHITESPACE_RE = re.compile(r'\s+$')
+_WORD_RE = re.compile(r'\S+')
+
+
+class Document:
+    """
+    Text segmented once into sentences and paragraphs.
+
+    Sentence boundaries are stored as offset arrays into the original
+    string, so no per-sentence copies are made until a sentence is asked
+    for. Word counts and the detected language are computed on demand and
+    kept for every later stage.
+    """
+
+    __slots__ = (
+        'text', 'sentence_starts', 'sentence_ends', 'sentence_paragraphs',
+        'language', '_word_counts', '_lower'
+    )
+
+    def __init__(self, text: str, language: Optional[str] = None):
+        """
+        Segment a text.
+
+        Args:
+            text: Input text
+            language: Language code, if already known
+        """
+        self.text = text
+        self.language = language
+        self._word_counts = None
+        self._lower = None
+
+        starts, ends, paragraphs = [], [], []
+        paragraph = 0
+        position = 0
+        skip_whitespace = _WHITESPACE_RE.match
+        for match in _BOUNDARY_RE.finditer(text):
+            start = skip_whitespace(text, position).end()
+            is_paragraph_break = text[match.start()] not in '.!?'
+            end = match.start() if is_paragraph_break else match.end()
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+                paragraphs.append(paragraph)
+            if is_paragraph_break:
+                paragraph += 1
+            position = match.end()
+
+        start = skip_whitespace(text, position).end()
+        trailing = _TRAILING_WHITESPACE_RE.search(text, start)
+        end = trailing.start() if trailing else len(text)
+        if start < end:
+            starts.append(start)
+            ends.append(end)
+            paragraphs.append(paragraph)
+
+        self.sentence_starts = np.asarray(starts, dtype=np.int64)
+        self.sentence_ends = np.asarray(ends, dtype=np.int64)
+        self.sentence_paragraphs = np.asarray(paragraphs, dtype=np.int64)
+
+    @classmethod
+    def from_text(cls, text: Union[str, 'Document'], language: Optional[str] = None) -> 'Document':
+        """
+        Return a Document for a text, reusing it if it already is one.
+
+        Args:
+            text: Input text or Document
+            language: Language code, if already known
+
+        Returns:
+            Document instance
+        """
+        if isinstance(text, Document):
+            if language is not None and text.language is None:
+                text.language = language
+            return text
+        return cls(text, language)
+
+    def __len__(self) -> int:
+        return len(self.sentence_starts)
+
+    @property
+    def lower(self) -> str:
+        """Lowercased text, computed once for tokenizers."""
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def paragraph_count(self) -> int:
+        """Number of paragraphs containing at least one sentence."""
+        return len(np.unique(self.sentence_paragraphs))
+
+    @property
+    def word_counts(self) -> np.ndarray:
+        """Number of whitespace-separated words per sentence."""
+        if self._word_counts is None:
+            word_starts = np.fromiter(
+                (m.start() for m in _WORD_RE.finditer(self.text)), dtype=np.int64
+            )
+            self._word_counts = (
+                np.searchsorted(word_starts, self.sentence_ends)
+                - np.searchsorted(word_starts, self.sentence_starts)
+            )
+        return self._word_counts
+
+    @property
+    def word_count(self) -> int:
+        """Total number of words in the document's sentences."""
+        return int(self.word_counts.sum())
+
+    def sentence(self, index: int) -> str:
+        """Return one sentence with its whitespace normalized."""
+        return ' '.join(
+            self.text[self.sentence_starts[index]:self.sentence_ends[index]].split()
+        )
+
+    def sentences(self, indices: Optional[Sequence[int]] = None) -> List[str]:
+        """
+        Materialize sentences.
+
+        Args:
+            indices: Sentence indices to return (all sentences by default)
+
+        Returns:
+            Sentences with whitespace normalized
+        """
+        if indices is None:
+            indices = range(len(self))
+        return [self.sentence(i) for i in indices]
+
+    def iter_paragraphs(self) -> Iterator[List[int]]:
+        """
+        Group sentence indices by paragraph.
+
+        Yields:
+            Lists of consecutive sentence indices sharing a paragraph
+        """
+        if not len(self):
+            return
+        breaks = np.flatnonzero(np.diff(self.sentence_paragraphs)) + 1
+        for group in np.split(np.arange(len(self)), breaks):
+            yield group.tolist()
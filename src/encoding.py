@@ -0,0 +1,175 @@
+"""
+Encoding detection and single-pass decoding of text files.
+"""
+
+import codecs
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Files larger than this are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1024 * 1024
+
+# Bytes inspected by sniff_encoding, spread over the start, middle and end
+SAMPLE_SIZE = 64 * 1024
+SAMPLE_PIECES = 4
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# Invalid sequences tolerated per valid non-ASCII character in UTF-8 text
+_UTF8_ERROR_TOLERANCE = 0.01
+
+# Most frequent lowercase Russian letters; correctly decoded text is full of them
+_RUSSIAN_FREQUENT = set('оеаинтсрвлкмдпуяы')
+
+# Share of non-ASCII bytes among letters above which text is treated as Cyrillic
+_CYRILLIC_HIGH_BYTE_RATIO = 0.3
+
+
+def _sample(data, size: int = SAMPLE_SIZE, pieces: int = SAMPLE_PIECES) -> list:
+    """Take evenly spread slices of a bytes-like object."""
+    if len(data) <= size:
+        return [bytes(data)]
+    piece = size // pieces
+    step = (len(data) - piece) // (pieces - 1)
+    return [bytes(data[i * step:i * step + piece]) for i in range(pieces)]
+
+
+def _utf8_stats(piece: bytes, at_start: bool) -> tuple:
+    """
+    Decode a slice as UTF-8, tolerating characters cut at its edges.
+
+    Returns:
+        Tuple of (valid non-ASCII characters, invalid sequences)
+    """
+    if not at_start:
+        # Skip continuation bytes of a character that began before the slice
+        skip = 0
+        while skip < min(3, len(piece)) and 0x80 <= piece[skip] <= 0xBF:
+            skip += 1
+        piece = piece[skip:]
+    text = codecs.getincrementaldecoder('utf-8')(errors='replace').decode(piece, final=False)
+    errors = text.count('\ufffd')
+    return sum(1 for ch in text if ord(ch) > 0x7F) - errors, errors
+
+
+def _russian_score(sample: bytes, encoding: str) -> int:
+    """Count frequent Russian letters in a sample decoded with an encoding."""
+    text = sample.decode(encoding, errors='ignore')
+    return sum(1 for ch in text if ch in _RUSSIAN_FREQUENT)
+
+
+def sniff_encoding(data) -> str:
+    """
+    Guess the encoding of a bytes-like object from a bounded sample.
+
+    Checks for a byte order mark, then UTF-8 validity, then decides between
+    the Cyrillic single-byte encodings (cp1251, koi8-r) and cp1252/latin-1
+    from byte statistics.
+
+    Args:
+        data: Bytes, mmap or memoryview with the file contents
+
+    Returns:
+        Codec name suitable for bytes.decode
+    """
+    head = bytes(data[:4])
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+
+    pieces = _sample(data)
+    valid = errors = 0
+    for i, piece in enumerate(pieces):
+        piece_valid, piece_errors = _utf8_stats(piece, i == 0)
+        valid += piece_valid
+        errors += piece_errors
+    # A few stray bytes in otherwise valid UTF-8 are damage, not another encoding
+    if errors <= valid * _UTF8_ERROR_TOLERANCE:
+        return 'utf-8'
+
+    sample = b''.join(pieces)
+    high = sum(1 for b in sample if b >= 0x80)
+    ascii_letters = sum(1 for b in sample if 0x41 <= b <= 0x5A or 0x61 <= b <= 0x7A)
+    if high and high / (high + ascii_letters) > _CYRILLIC_HIGH_BYTE_RATIO:
+        cp1251 = _russian_score(sample, 'cp1251')
+        koi8 = _russian_score(sample, 'koi8-r')
+        return 'cp1251' if cp1251 >= koi8 else 'koi8-r'
+
+    try:
+        sample.decode('cp1252')
+        return 'cp1252'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+@contextmanager
+def _open_buffer(file_path: str):
+    """Yield the file contents as bytes (small files) or an mmap (large files)."""
+    size = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def read_text(file_path: str, encoding: Optional[str] = None) -> str:
+    """
+    Read a text file, detecting its encoding and decoding it once.
+
+    Large files are memory-mapped, so the only full copy in memory is the
+    decoded string.
+
+    Args:
+        file_path: Path to the text file
+        encoding: Encoding to use instead of detecting one
+
+    Returns:
+        Decoded file contents
+    """
+    with _open_buffer(file_path) as data:
+        encoding = encoding or sniff_encoding(data)
+        # A stray invalid byte outside the sample must not force a re-read
+        return codecs.decode(memoryview(data), encoding, errors='replace')
+
+
+def iter_text(
+    file_path: str,
+    encoding: Optional[str] = None,
+    chunk_size: int = MMAP_THRESHOLD
+) -> Iterator[str]:
+    """
+    Decode a text file incrementally.
+
+    Args:
+        file_path: Path to the text file
+        encoding: Encoding to use instead of detecting one
+        chunk_size: Number of bytes decoded per step
+
+    Yields:
+        Consecutive pieces of decoded text
+    """
+    with open(file_path, 'rb') as f:
+        if encoding is None:
+            with _open_buffer(file_path) as data:
+                encoding = sniff_encoding(data)
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            text = decoder.decode(block)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
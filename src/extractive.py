@@ -0,0 +1,241 @@
+"""
+Vectorized extractive summarization: TF-IDF sentence vectors ranked by TextRank.
+
+Sentence vectors are kept as sparse (row, term, weight) triples in NumPy
+arrays, and TextRank runs power iteration on the cosine similarity graph
+through sparse matrix-vector products, so the n x n similarity matrix is
+never materialized and cost stays linear in the number of tokens.
+"""
+
+import heapq
+import re
+from typing import List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from .document import Document
+
+_WORD_RE = re.compile(r'\w\w+')
+
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+
+# Selected sentences more similar than this to an earlier pick are skipped
+REDUNDANCY_THRESHOLD = 0.8
+
+# Highest-weighted terms of a sentence used to find near-duplicate candidates
+SIGNATURE_TERMS = 3
+
+
+class SparseRows(NamedTuple):
+    """Row-normalized TF-IDF matrix in coordinate form, sorted by row."""
+    rows: np.ndarray
+    terms: np.ndarray
+    weights: np.ndarray
+    n_rows: int
+    n_terms: int
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """Compute X @ vector for a vector over terms."""
+        return np.bincount(
+            self.rows, weights=self.weights * vector[self.terms], minlength=self.n_rows
+        )
+
+    def tdot(self, vector: np.ndarray) -> np.ndarray:
+        """Compute X.T @ vector for a vector over rows."""
+        return np.bincount(
+            self.terms, weights=self.weights * vector[self.rows], minlength=self.n_terms
+        )
+
+
+def build_tfidf(sentences: List[str]) -> SparseRows:
+    """
+    Build L2-normalized TF-IDF vectors for sentences.
+
+    Args:
+        sentences: Sentences to vectorize
+
+    Returns:
+        Sparse matrix with one row per sentence
+    """
+    return _tfidf_from_tokens([_WORD_RE.findall(sentence.lower()) for sentence in sentences])
+
+
+def build_document_tfidf(document: Document) -> SparseRows:
+    """
+    Build TF-IDF vectors for a Document's sentences without slicing them out.
+
+    Args:
+        document: Segmented document
+
+    Returns:
+        Sparse matrix with one row per sentence
+    """
+    lower, findall = document.lower, _WORD_RE.findall
+    return _tfidf_from_tokens([
+        findall(lower, start, end)
+        for start, end in zip(document.sentence_starts.tolist(), document.sentence_ends.tolist())
+    ])
+
+
+def _tfidf_from_tokens(tokenized: List[List[str]]) -> SparseRows:
+    """Vectorize per-sentence token lists."""
+    lengths = np.fromiter(map(len, tokenized), dtype=np.int64, count=len(tokenized))
+    vocabulary = {}
+    term_ids = [vocabulary.setdefault(t, len(vocabulary)) for tokens in tokenized for t in tokens]
+
+    n_rows, n_terms = len(tokenized), max(1, len(vocabulary))
+    rows = np.repeat(np.arange(n_rows, dtype=np.int64), lengths)
+    terms = np.asarray(term_ids, dtype=np.int64)
+
+    # Merge repeated (row, term) pairs into counts; keys sort by row
+    keys, counts = np.unique(rows * n_terms + terms, return_counts=True)
+    rows, terms = keys // n_terms, keys % n_terms
+
+    document_frequency = np.bincount(terms, minlength=n_terms)
+    idf = np.log((1.0 + n_rows) / (1.0 + document_frequency)) + 1.0
+    weights = (1.0 + np.log(counts)) * idf[terms]
+
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n_rows))
+    weights = weights / np.where(norms > 0, norms, 1.0)[rows]
+    return SparseRows(rows, terms, weights, n_rows, n_terms)
+
+
+def textrank_scores(matrix: SparseRows) -> np.ndarray:
+    """
+    Score sentences by PageRank centrality on the cosine similarity graph.
+
+    The graph's adjacency is S = X X^T without self-loops; products with it
+    are computed as X (X^T v) - v for unit-norm rows.
+
+    Args:
+        matrix: Row-normalized TF-IDF matrix
+
+    Returns:
+        Centrality score per sentence
+    """
+    n = matrix.n_rows
+    if n == 0:
+        return np.zeros(0)
+    has_terms = np.bincount(matrix.rows, minlength=n) > 0
+    self_similarity = has_terms.astype(float)
+
+    def similarity_dot(vector):
+        return matrix.dot(matrix.tdot(vector)) - self_similarity * vector
+
+    degree = similarity_dot(np.ones(n))
+    connected = degree > 1e-12
+    inverse_degree = np.where(connected, 1.0 / np.where(connected, degree, 1.0), 0.0)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(MAX_ITERATIONS):
+        # Sentences without neighbours spread their score uniformly
+        dangling = scores[~connected].sum() / n
+        updated = (1.0 - DAMPING) / n + DAMPING * (similarity_dot(scores * inverse_degree) + dangling)
+        if np.abs(updated - scores).sum() < TOLERANCE:
+            return updated
+        scores = updated
+    return scores
+
+
+def _row_vectors(matrix: SparseRows, indices: np.ndarray) -> List[dict]:
+    """Extract sparse rows as {term: weight} dictionaries."""
+    starts = np.searchsorted(matrix.rows, indices, side='left')
+    stops = np.searchsorted(matrix.rows, indices, side='right')
+    return [
+        dict(zip(matrix.terms[a:b].tolist(), matrix.weights[a:b].tolist()))
+        for a, b in zip(starts, stops)
+    ]
+
+
+def _cosine(a: dict, b: dict) -> float:
+    """Dot product of two unit-norm sparse vectors."""
+    if len(b) < len(a):
+        a, b = b, a
+    return sum(weight * b.get(term, 0.0) for term, weight in a.items())
+
+
+def select_sentences(
+    matrix: SparseRows,
+    scores: np.ndarray,
+    count: int,
+    redundancy_threshold: float = REDUNDANCY_THRESHOLD
+) -> List[int]:
+    """
+    Pick the highest-scoring sentences, skipping near-duplicates.
+
+    Candidates are preselected with a partial sort; earlier picks sharing
+    one of a candidate's highest-weighted terms are found through an
+    inverted index and compared by exact cosine similarity.
+
+    Args:
+        matrix: Row-normalized TF-IDF matrix
+        scores: Score per sentence
+        count: Number of sentences to select
+        redundancy_threshold: Cosine similarity above which a candidate is skipped
+
+    Returns:
+        Indices of selected sentences in document order
+    """
+    n = len(scores)
+    count = min(count, n)
+    if count <= 0:
+        return []
+
+    # Take twice as many candidates as needed to leave room for skipped duplicates
+    pool = min(n, 2 * count)
+    candidates = np.argpartition(-scores, pool - 1)[:pool] if pool < n else np.arange(n)
+    candidates = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+    selected = []
+    vectors = []
+    skipped = []
+    postings = {}
+    for index, vector in zip(candidates.tolist(), _row_vectors(matrix, candidates)):
+        # Near-duplicates share their highest-weighted (rarest) terms, so only
+        # picks with a common signature term are compared exactly
+        signature = heapq.nlargest(SIGNATURE_TERMS, vector, key=vector.get)
+        neighbours = {other for term in signature for other in postings.get(term, ())}
+        if any(_cosine(vector, vectors[other]) > redundancy_threshold for other in neighbours):
+            skipped.append(index)
+            continue
+        position = len(selected)
+        selected.append(index)
+        vectors.append(vector)
+        for term in signature:
+            postings.setdefault(term, []).append(position)
+        if len(selected) == count:
+            break
+
+    # Too many duplicates: fill up with the best of the skipped sentences
+    selected.extend(skipped[:count - len(selected)])
+    return sorted(selected)
+
+
+def rank_sentences(
+    sentences: Union[List[str], Document],
+    count: int,
+    redundancy_threshold: Optional[float] = REDUNDANCY_THRESHOLD
+) -> List[int]:
+    """
+    Choose the most central, non-redundant sentences of a document.
+
+    Args:
+        sentences: Sentences of the document, or a segmented Document
+        count: Number of sentences to select
+        redundancy_threshold: Similarity above which near-duplicates are skipped
+            (None disables the check)
+
+    Returns:
+        Indices of selected sentences in document order
+    """
+    if count >= len(sentences):
+        return list(range(len(sentences)))
+    if isinstance(sentences, Document):
+        matrix = build_document_tfidf(sentences)
+    else:
+        matrix = build_tfidf(sentences)
+    scores = textrank_scores(matrix)
+    threshold = 1.0 + 1e-9 if redundancy_threshold is None else redundancy_threshold
+    return select_sentences(matrix, scores, count, threshold)
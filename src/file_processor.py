@@ -2,32 +2,137 @@
 File processing module for handling different file formats.
 """
 
+import asyncio
 import os
-from typing import Optional
+import zipfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
+from xml.etree import ElementTree
+
+from .cache import ExtractionCache
+from .encoding import iter_text, read_text
+from .metrics import count, timed
+
+
+# WordprocessingML element names (Clark notation, as reported by ElementTree)
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_R = _W + 'r'
+_W_T = _W + 't'
+_W_BR = _W + 'br'
+_W_TYPE = _W + 'type'
+# Text equivalents of run content other than w:t (as python-docx renders them)
+_RUN_TEXT = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process."""
+    import PyPDF2
+    
+    with open(file_path, 'rb') as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        return [pdf_reader.pages[i].extract_text() or '' for i in range(start, stop)]
 
 
 class FileProcessor:
     """Handle file reading for different formats."""
     
+    # Extensions with a dedicated reader
+    SUPPORTED_EXTENSIONS = ('.txt', '.docx', '.pdf')
+    # Formats slow enough to parse that their text is worth caching
+    CACHED_EXTENSIONS = ('.docx', '.pdf')
+    
     @staticmethod
-    def read_text_file(file_path: str) -> str:
+    def read_text_file(file_path: str, encoding: Optional[str] = None) -> str:
         """
         Read a plain text file.
         
+        The encoding (BOM, UTF-8, cp1251, koi8-r or cp1252) is detected from
+        a bounded sample and the file is decoded in a single pass; large
+        files are memory-mapped.
+        
         Args:
             file_path: Path to the text file
+            encoding: Encoding to use instead of detecting one
             
         Returns:
             File contents as string
         """
+        return read_text(file_path, encoding=encoding)
+    
+    @staticmethod
+    def iter_text_file(file_path: str, encoding: Optional[str] = None) -> Iterator[str]:
+        """
+        Decode a plain text file incrementally.
+        
+        Args:
+            file_path: Path to the text file
+            encoding: Encoding to use instead of detecting one
+            
+        Yields:
+            Consecutive pieces of the decoded text
+        """
+        return iter_text(file_path, encoding=encoding)
+    
+    @staticmethod
+    def iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+        """
+        Yield the paragraphs of a DOCX file without building a document tree.
+        
+        ``word/document.xml`` is parsed incrementally straight from the zip
+        archive and every paragraph is discarded once yielded, so memory
+        stays bounded by the largest paragraph or table. Paragraphs inside
+        tables (one per cell paragraph) and content controls are included
+        in document order.
+        
+        Args:
+            file_path: Path to the DOCX file
+            
+        Yields:
+            Text of each paragraph in order
+            
+        Raises:
+            ValueError: If the file is not a Word document
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
+            archive = zipfile.ZipFile(file_path)
+        except zipfile.BadZipFile:
+            raise ValueError(f"Invalid DOCX file: {file_path}")
+        with archive:
+            try:
+                part = archive.open('word/document.xml')
+            except KeyError:
+                raise ValueError(f"Invalid DOCX file (no word/document.xml): {file_path}")
+            with part:
+                parents = []
+                # Text pieces of the open paragraphs (text boxes nest paragraphs)
+                paragraphs = []
+                for event, element in ElementTree.iterparse(part, events=('start', 'end')):
+                    if event == 'start':
+                        parents.append(element)
+                        if element.tag == _W_P:
+                            paragraphs.append([])
+                        continue
+                    parents.pop()
+                    tag = element.tag
+                    if tag == _W_P:
+                        yield ''.join(paragraphs.pop())
+                        element.clear()
+                    elif paragraphs and parents and parents[-1].tag == _W_R:
+                        if tag == _W_T:
+                            paragraphs[-1].append(element.text or '')
+                        elif tag == _W_BR:
+                            # Page and column breaks have no text equivalent
+                            if element.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                                paragraphs[-1].append('\n')
+                        elif tag in _RUN_TEXT:
+                            paragraphs[-1].append(_RUN_TEXT[tag])
+                    # Drop finished top-level blocks so the tree never grows
+                    if parents and parents[-1].tag == _W_BODY:
+                        parents[-1].remove(element)
     
     @staticmethod
     def read_docx(file_path: str) -> str:
@@ -38,45 +143,107 @@ class FileProcessor:
             file_path: Path to the DOCX file
             
         Returns:
-            Extracted text content
+            Extracted text content, one paragraph per line (table cells included)
+        """
+        return '\n'.join(FileProcessor.iter_docx_paragraphs(file_path))
+    
+    @staticmethod
+    def _pdf_page_bounds(num_pages: int, page_range: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        """Convert a 1-based inclusive page range into 0-based slice bounds."""
+        if page_range is None:
+            return 0, num_pages
+        first, last = page_range
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range: {first}-{last}")
+        return first - 1, min(last, num_pages)
+    
+    @staticmethod
+    def iter_pdf_pages(
+        file_path: str,
+        page_range: Optional[Tuple[int, int]] = None,
+        workers: int = 1,
+        pages_per_task: int = 16
+    ) -> Iterator[str]:
+        """
+        Yield the text of a PDF page by page.
+        
+        Only one page (or, with workers, a bounded number of page batches)
+        is held in memory at a time.
+        
+        Args:
+            file_path: Path to the PDF file
+            page_range: Optional 1-based inclusive (first, last) pages to extract
+            workers: Number of processes extracting page ranges in parallel
+            pages_per_task: Pages extracted by a worker per task
+            
+        Yields:
+            Text of each page in order
         """
         try:
-            from docx import Document
-            doc = Document(file_path)
-            paragraphs = [p.text for p in doc.paragraphs]
-            return '\n'.join(paragraphs)
+            import PyPDF2
         except ImportError:
-            raise ImportError("python-docx is required for DOCX support. Install it with: pip install python-docx")
+            raise ImportError("PyPDF2 is required for PDF support. Install it with: pip install PyPDF2")
+        
+        with open(file_path, 'rb') as f:
+            pdf_reader = PyPDF2.PdfReader(f)
+            start, stop = FileProcessor._pdf_page_bounds(len(pdf_reader.pages), page_range)
+            if workers <= 1:
+                for index in range(start, stop):
+                    yield pdf_reader.pages[index].extract_text() or ''
+                return
+        
+        tasks = iter(range(start, stop, pages_per_task))
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep at most two tasks per worker in flight to bound memory
+            for task_start in tasks:
+                pending.append(executor.submit(
+                    _extract_pdf_pages, file_path, task_start, min(task_start + pages_per_task, stop)
+                ))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                pages = pending.popleft().result()
+                task_start = next(tasks, None)
+                if task_start is not None:
+                    pending.append(executor.submit(
+                        _extract_pdf_pages, file_path, task_start, min(task_start + pages_per_task, stop)
+                    ))
+                yield from pages
     
     @staticmethod
-    def read_pdf(file_path: str) -> str:
+    def read_pdf(
+        file_path: str,
+        page_range: Optional[Tuple[int, int]] = None,
+        workers: int = 1
+    ) -> str:
         """
         Read a PDF file.
         
         Args:
             file_path: Path to the PDF file
+            page_range: Optional 1-based inclusive (first, last) pages to extract
+            workers: Number of processes extracting page ranges in parallel
             
         Returns:
             Extracted text content
         """
-        try:
-            import PyPDF2
-            text = ""
-            with open(file_path, 'rb') as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            return text
-        except ImportError:
-            raise ImportError("PyPDF2 is required for PDF support. Install it with: pip install PyPDF2")
+        pages = FileProcessor.iter_pdf_pages(file_path, page_range=page_range, workers=workers)
+        return ''.join(page + '\n' for page in pages)
     
     @staticmethod
-    def read_file(file_path: str) -> str:
+    def read_file(
+        file_path: str,
+        page_range: Optional[Tuple[int, int]] = None,
+        cache: Optional[ExtractionCache] = None
+    ) -> str:
         """
         Automatically detect file type and read it.
         
         Args:
             file_path: Path to the file
+            page_range: Optional 1-based inclusive (first, last) pages (PDF only)
+            cache: Extraction cache consulted for formats in CACHED_EXTENSIONS
             
         Returns:
             Extracted text content
@@ -90,17 +257,121 @@ class FileProcessor:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         extension = file_path.suffix.lower()
+        if cache is None or extension not in FileProcessor.CACHED_EXTENSIONS:
+            return FileProcessor._extract(file_path, extension, page_range)
         
-        if extension == '.txt':
-            return FileProcessor.read_text_file(str(file_path))
-        elif extension == '.docx':
-            return FileProcessor.read_docx(str(file_path))
-        elif extension == '.pdf':
-            return FileProcessor.read_pdf(str(file_path))
-        else:
-            # Try as text file
-            try:
+        text = cache.get(file_path, page_range)
+        count('extract_miss' if text is None else 'extract_hit')
+        if text is None:
+            text = FileProcessor._extract(file_path, extension, page_range)
+            cache.put(file_path, text, page_range)
+        return text
+    
+    @staticmethod
+    def _extract(file_path: Path, extension: str, page_range: Optional[Tuple[int, int]]) -> str:
+        """Dispatch to the reader for a file's extension."""
+        with timed('read' + (extension if extension in FileProcessor.SUPPORTED_EXTENSIONS else '.other')):
+            if extension == '.txt':
                 return FileProcessor.read_text_file(str(file_path))
-            except Exception:
-                raise ValueError(f"Unsupported file type: {extension}")
-
+            elif extension == '.docx':
+                return FileProcessor.read_docx(str(file_path))
+            elif extension == '.pdf':
+                return FileProcessor.read_pdf(str(file_path), page_range=page_range)
+            else:
+                # Try as text file
+                try:
+                    return FileProcessor.read_text_file(str(file_path))
+                except Exception:
+                    raise ValueError(f"Unsupported file type: {extension}")
+    
+    @staticmethod
+    async def aread_file(
+        file_path: str,
+        page_range: Optional[Tuple[int, int]] = None,
+        executor: Optional[Executor] = None
+    ) -> str:
+        """
+        Read a file without blocking the event loop.
+        
+        Args:
+            file_path: Path to the file
+            page_range: Optional 1-based inclusive (first, last) pages (PDF only)
+            executor: Thread or process pool doing the extraction
+                (the loop's default executor if None)
+            
+        Returns:
+            Extracted text content
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, FileProcessor.read_file, str(file_path), page_range
+        )
+    
+    @staticmethod
+    def iter_read(
+        file_paths: Iterable[str],
+        workers: int = 4,
+        prefetch: int = 8,
+        cache: Optional[ExtractionCache] = None
+    ) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        Read files in a worker pool, prefetching ahead of the consumer.
+        
+        Up to ``prefetch`` files are read ahead while the caller is busy with
+        the current one, so parsing overlaps with summarization. Results are
+        yielded in input order.
+        
+        Args:
+            file_paths: Paths of the files to read
+            workers: Number of pool workers
+            prefetch: Maximum number of files read ahead
+            cache: Extraction cache; it is only used from the calling thread,
+                so cached files never reach the pool
+            
+        Yields:
+            Tuples of (path, text, error); exactly one of text/error is None
+        """
+        paths = iter(file_paths)
+        pending = deque()
+        
+        def cacheable(path) -> bool:
+            return cache is not None and Path(path).suffix.lower() in FileProcessor.CACHED_EXTENSIONS
+        
+        def submit(path):
+            if cacheable(path):
+                try:
+                    text = cache.get(path)
+                except OSError:
+                    # Missing or unreadable: let the reader report it
+                    text = None
+                count('extract_miss' if text is None else 'extract_hit')
+                if text is not None:
+                    return path, None, text
+            return path, executor.submit(FileProcessor.read_file, str(path)), None
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for path in paths:
+                pending.append(submit(path))
+                if len(pending) >= max(1, prefetch):
+                    break
+            
+            while pending:
+                path, future, text = pending.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append(submit(next_path))
+                if future is None:
+                    yield path, text, None
+                    continue
+                try:
+                    text = future.result()
+                except Exception as e:
+                    yield path, None, e
+                    continue
+                if cacheable(path):
+                    try:
+                        cache.put(path, text)
+                    except OSError:
+                        # The file vanished after it was read; nothing to key on
+                        pass
+                yield path, text, None
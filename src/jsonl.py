@@ -0,0 +1,181 @@
+"""
+Streaming JSONL pipeline: summarize records read from one stream into another.
+
+Input records are ``{"id", "text" | "path", "language"?, "compression"?,
+"key_points"?}``. At most ``window`` records are in flight at a time, so
+memory stays flat however long the input is: the reader only pulls the
+next line once a slot frees up. Failures are reported per record.
+"""
+
+import json
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from .cache import ExtractionCache
+from .file_processor import FileProcessor
+from .summarizer import Summarizer
+
+
+class RecordError(Exception):
+    """A record failed; carries the details written to the error stream."""
+
+    def __init__(self, line: int, record_id: Any, message: str):
+        super().__init__(message)
+        self.line = line
+        self.record_id = record_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the error as a JSONL record."""
+        return {'id': self.record_id, 'line': self.line, 'error': str(self)}
+
+
+def parse_record(line: str) -> Dict[str, Any]:
+    """
+    Decode and validate one input line.
+
+    Args:
+        line: JSON object text
+
+    Returns:
+        The record dictionary
+
+    Raises:
+        ValueError: If the line is not a valid record
+    """
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Record must be a JSON object")
+    if ('text' in record) == ('path' in record):
+        raise ValueError("Record needs exactly one of 'text' or 'path'")
+    compression = record.get('compression')
+    if compression is not None and not 0 < float(compression) < 1:
+        raise ValueError(f"Compression must be a ratio between 0 and 1, got {compression!r}")
+    return record
+
+
+def _record_id(line: str) -> Any:
+    """Best-effort id of an invalid record (None if it is not a JSON object)."""
+    try:
+        return json.loads(line).get('id')
+    except (ValueError, AttributeError):
+        return None
+
+
+def summarize_record(
+    summarizer: Summarizer,
+    record: Dict[str, Any],
+    compression_level: float = 0.3,
+    language: Optional[str] = None,
+    key_points: int = 0,
+    extraction_cache: Optional[ExtractionCache] = None
+) -> Dict[str, Any]:
+    """
+    Summarize one record.
+
+    Args:
+        summarizer: Summarizer owned by the calling thread
+        record: Validated record (see parse_record)
+        compression_level: Compression used when the record has none
+        language: Language used when the record has none (None to detect)
+        key_points: Key points extracted when the record does not say
+        extraction_cache: Cache of text extracted from ``path`` records
+
+    Returns:
+        Output record with id, summary, language and optional key points
+    """
+    if 'path' in record:
+        text = FileProcessor.read_file(record['path'], cache=extraction_cache)
+    else:
+        text = record['text']
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("Input text is empty")
+
+    summary, detected = summarizer.summarize(
+        text,
+        float(record.get('compression') or compression_level),
+        record.get('language') or language
+    )
+    result = {'id': record.get('id'), 'summary': summary, 'language': detected}
+    points = int(record.get('key_points', key_points))
+    if points:
+        result['key_points'] = summarizer.extract_key_points(text, num_points=points)
+    return result
+
+
+def run_records(
+    lines: Iterable[str],
+    summarizer_factory: Callable[[], Summarizer],
+    workers: int = 1,
+    window: Optional[int] = None,
+    ordered: bool = True,
+    **options
+) -> Iterator[Tuple[bool, Dict[str, Any]]]:
+    """
+    Summarize JSONL records in a thread pool with a bounded in-flight window.
+
+    Args:
+        lines: Input lines (blank lines are skipped)
+        summarizer_factory: Callable returning a Summarizer per worker thread
+        workers: Number of worker threads
+        window: Maximum records read but not yet written (4 per worker by default)
+        ordered: Yield results in input order; otherwise as they complete
+        **options: Defaults passed to summarize_record (compression_level,
+            language, key_points, extraction_cache)
+
+    Yields:
+        Tuples of (ok, output record); failed records yield an error record
+        with the id, the 1-based input line number and the message
+    """
+    workers = max(1, workers)
+    window = max(1, window or 4 * workers)
+    local = threading.local()
+
+    def process(number: int, record: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            summarizer = getattr(local, 'summarizer', None)
+            if summarizer is None:
+                summarizer = local.summarizer = summarizer_factory()
+            return summarize_record(summarizer, record, **options)
+        except Exception as e:
+            raise RecordError(number, record.get('id'), str(e) or type(e).__name__)
+
+    def submit(number: int, line: str) -> Future:
+        try:
+            record = parse_record(line)
+        except (ValueError, TypeError) as e:
+            future = Future()
+            future.set_exception(RecordError(number, _record_id(line), f"Invalid record: {e}"))
+            return future
+        return executor.submit(process, number, record)
+
+    def outcome(future: Future) -> Tuple[bool, Dict[str, Any]]:
+        try:
+            return True, future.result()
+        except RecordError as e:
+            return False, e.to_dict()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque() if ordered else set()
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            if ordered:
+                pending.append(submit(number, line))
+                if len(pending) >= window:
+                    # Head-of-line wait keeps the output in input order
+                    yield outcome(pending.popleft())
+            else:
+                pending.add(submit(number, line))
+                if len(pending) >= window:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield outcome(future)
+        while pending:
+            if ordered:
+                yield outcome(pending.popleft())
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield outcome(future)
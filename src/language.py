@@ -0,0 +1,148 @@
+"""
+Fast, deterministic language detection for the supported languages.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+SUPPORTED_LANGUAGES = ('en', 'ru', 'de')
+DEFAULT_LANGUAGE = 'en'
+
+# Characters of the text inspected, taken from evenly spread windows
+SAMPLE_CHARS = 4000
+SAMPLE_PIECES = 8
+
+# Share of Cyrillic among letters above which text is Russian without langdetect
+CYRILLIC_THRESHOLD = 0.5
+
+# Stopword evidence needed to decide English vs German without langdetect
+MIN_STOPWORDS = 2
+STOPWORD_MARGIN = 2.0
+
+CACHE_SIZE = 1024
+
+ENGLISH_STOPWORDS = frozenset(
+    'the and of to is that it for with as are this was on be by which from or '
+    'have not were has these their can been its than'.split()
+)
+GERMAN_STOPWORDS = frozenset(
+    'der die das und ist nicht ein eine einen zu den von mit sich des auf für '
+    'im dem auch es werden aus sie zum dies diese sind wird bei oder wie'.split()
+)
+GERMAN_CHARS = frozenset('äöüßÄÖÜ')
+
+_WORD_RE = re.compile(r'\w+')
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_langdetect_ready = False
+
+
+def sample_text(text: str, size: int = SAMPLE_CHARS, pieces: int = SAMPLE_PIECES) -> str:
+    """
+    Take evenly spread windows of a text, aligned to whitespace.
+
+    Args:
+        text: Input text
+        size: Total number of characters to keep
+        pieces: Number of windows
+
+    Returns:
+        The whole text if it is short, otherwise the joined windows
+    """
+    if len(text) <= size:
+        return text
+    window = size // pieces
+    step = (len(text) - window) // (pieces - 1)
+    windows = []
+    for i in range(pieces):
+        start = i * step if i < pieces - 1 else len(text) - window
+        piece = text[start:start + window]
+        # Drop words cut at the window edges (the text's own edges are intact)
+        first = piece.find(' ') + 1 if i > 0 else 0
+        last = piece.rfind(' ') if i < pieces - 1 else len(piece)
+        windows.append(piece[first:last] if first < last else piece)
+    return ' '.join(windows)
+
+
+def _script_language(sample: str):
+    """Return 'ru' when the sample is mostly Cyrillic letters."""
+    cyrillic = latin = 0
+    for ch in sample:
+        if 'а' <= ch <= 'я' or 'А' <= ch <= 'Я' or ch in 'ёЁ':
+            cyrillic += 1
+        elif 'a' <= ch <= 'z' or 'A' <= ch <= 'Z':
+            latin += 1
+    letters = cyrillic + latin
+    if letters and cyrillic / letters > CYRILLIC_THRESHOLD:
+        return 'ru'
+    return None
+
+
+def _stopword_language(sample: str):
+    """Decide English vs German from stopwords and umlauts, or return None."""
+    english = german = 0
+    for word in _WORD_RE.findall(sample.lower()):
+        if word in ENGLISH_STOPWORDS:
+            english += 1
+        elif word in GERMAN_STOPWORDS:
+            german += 1
+    german += sum(1 for ch in sample if ch in GERMAN_CHARS)
+    if english >= MIN_STOPWORDS and english >= STOPWORD_MARGIN * german:
+        return 'en'
+    if german >= MIN_STOPWORDS and german >= STOPWORD_MARGIN * english:
+        return 'de'
+    return None
+
+
+def _langdetect_language(sample: str) -> str:
+    """Run seeded langdetect on the sample."""
+    global _langdetect_ready
+    from langdetect import DetectorFactory, LangDetectException, detect
+
+    if not _langdetect_ready:
+        # langdetect is randomized unless seeded
+        DetectorFactory.seed = 0
+        _langdetect_ready = True
+    try:
+        detected = detect(sample)
+    except LangDetectException:
+        return DEFAULT_LANGUAGE
+    return detected if detected in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
+
+
+def detect_language(text: str) -> str:
+    """
+    Detect the language of a text.
+
+    Works on a bounded sample: a Unicode-script pass settles Cyrillic text,
+    stopword statistics settle clear English/German text, and only
+    ambiguous samples reach langdetect. Results are memoized per hash of
+    the sample, which determines the result.
+
+    Args:
+        text: Input text to analyze
+
+    Returns:
+        Language code ('en', 'ru', 'de')
+    """
+    sample = sample_text(text)
+    key = hashlib.blake2b(sample.encode('utf-8', errors='replace'), digest_size=16).digest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    language = (
+        _script_language(sample)
+        or _stopword_language(sample)
+        or _langdetect_language(sample)
+    )
+
+    with _cache_lock:
+        _cache[key] = language
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return language
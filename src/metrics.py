@@ -0,0 +1,165 @@
+"""
+Per-stage timings and event counters with a pluggable hook.
+
+Instrumented code calls ``timed(stage)`` and ``count(event)``. While no
+hook is installed both return immediately (``timed`` hands back a shared
+no-op context manager), so instrumentation costs a global lookup per call.
+Any object with ``observe(stage, seconds)`` and ``increment(event, amount)``
+methods can be installed as the hook; ``Metrics`` is the built-in collector
+and can export JSON-friendly snapshots and Prometheus text format.
+
+Stages: ``read.<ext>``, ``detect``, ``model_load``, ``tokenize``,
+``generate``, ``extractive``, ``summarize``.
+Events: ``model_hit``, ``model_miss``, ``model_load_failure``, ``model_unavailable``,
+``model_over_budget``, ``cache_hit``, ``cache_miss``, ``chunk_hit``, ``chunk_miss``,
+``extract_hit``, ``extract_miss``, ``fallback``.
+"""
+
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional
+
+_hook = None
+_NULL_TIMER = nullcontext()
+
+
+class Metrics:
+    """Thread-safe collector of stage timings and event counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._events = {}
+
+    def observe(self, stage: str, seconds: float):
+        """Record one execution of a stage."""
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def increment(self, event: str, amount: int = 1):
+        """Add to an event counter."""
+        with self._lock:
+            self._events[event] = self._events.get(event, 0) + amount
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._stages.clear()
+            self._events.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Report recorded metrics.
+
+        Returns:
+            Dictionary with per-stage count/total/mean/max seconds and counters
+        """
+        with self._lock:
+            stages = {
+                stage: {
+                    'count': count,
+                    'total_seconds': total,
+                    'mean_seconds': total / count,
+                    'max_seconds': longest,
+                }
+                for stage, (count, total, longest) in sorted(self._stages.items())
+            }
+            events = dict(sorted(self._events.items()))
+        return {'stages': stages, 'events': events}
+
+    def to_prometheus(self, prefix: str = 'edu_summarizer') -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text ending with a newline
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage, entry in snapshot['stages'].items():
+            label = _label('stage', stage)
+            lines.append(f"{prefix}_stage_seconds_sum{label} {entry['total_seconds']:.6f}")
+            lines.append(f"{prefix}_stage_seconds_count{label} {entry['count']}")
+        lines.append(f"# HELP {prefix}_stage_seconds_max Longest execution per stage.")
+        lines.append(f"# TYPE {prefix}_stage_seconds_max gauge")
+        for stage, entry in snapshot['stages'].items():
+            lines.append(f"{prefix}_stage_seconds_max{_label('stage', stage)} {entry['max_seconds']:.6f}")
+        lines.append(f"# HELP {prefix}_events_total Pipeline events.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for event, value in snapshot['events'].items():
+            lines.append(f"{prefix}_events_total{_label('event', event)} {value}")
+        return '\n'.join(lines) + '\n'
+
+
+def _label(name: str, value: str) -> str:
+    """Format a single Prometheus label with escaping."""
+    value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return f'{{{name}="{value}"}}'
+
+
+class _Timer:
+    """Context manager reporting its duration to a hook."""
+
+    __slots__ = ('hook', 'stage', 'start')
+
+    def __init__(self, hook, stage: str):
+        self.hook = hook
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.hook.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+def set_hook(hook: Optional[Any]) -> Optional[Any]:
+    """
+    Install a metrics hook for the whole process.
+
+    Args:
+        hook: Object with observe(stage, seconds) and increment(event, amount),
+            or None to disable instrumentation
+
+    Returns:
+        The previously installed hook
+    """
+    global _hook
+    previous, _hook = _hook, hook
+    return previous
+
+
+def get_hook() -> Optional[Any]:
+    """Return the installed metrics hook (None when disabled)."""
+    return _hook
+
+
+def timed(stage: str):
+    """Return a context manager that times a stage (a no-op when disabled)."""
+    hook = _hook
+    if hook is None:
+        return _NULL_TIMER
+    return _Timer(hook, stage)
+
+
+def count(event: str, amount: int = 1):
+    """Increment an event counter (a no-op when disabled)."""
+    hook = _hook
+    if hook is not None:
+        hook.increment(event, amount)
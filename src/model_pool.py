@@ -0,0 +1,439 @@
+"""
+Pool of resident summarization pipelines with least-recently-used eviction,
+a memory budget, idle unloading and negative caching of failed loads.
+"""
+
+import gc
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+def _tensor_bytes(values) -> int:
+    """Sum the storage of tensors (or nested tuples of them), counting shared tensors once."""
+    seen = set()
+    total = 0
+    stack = list(values)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (tuple, list)):
+            # Quantized Linear layers keep their int8 weight and bias in a packed tuple
+            stack.extend(value)
+        elif hasattr(value, 'numel') and hasattr(value, 'element_size'):
+            key = value.data_ptr() if hasattr(value, 'data_ptr') else id(value)
+            if key not in seen:
+                seen.add(key)
+                total += value.numel() * value.element_size()
+    return total
+
+
+def estimate_pipeline_bytes(pipeline: Any) -> int:
+    """
+    Estimate the memory held by a pipeline's model weights.
+
+    PyTorch models (including int8 dynamically quantized ones, whose packed
+    weights are not parameters) are measured from their state dict. ONNX
+    Runtime models hold no tensors in Python, so the size of their ONNX
+    files is used instead.
+
+    Args:
+        pipeline: A transformers pipeline (or any object with a ``model``)
+
+    Returns:
+        Size of the model weights in bytes, or 0 if unknown
+    """
+    model = getattr(pipeline, 'model', None)
+    if model is None:
+        return 0
+    try:
+        if hasattr(model, 'state_dict'):
+            return _tensor_bytes(model.state_dict().values())
+        save_dir = getattr(model, 'model_save_dir', None)
+        if save_dir is not None:
+            return sum(f.stat().st_size for f in Path(save_dir).glob('*.onnx*'))
+    except Exception:
+        pass
+    return 0
+
+
+class ModelUnavailableError(RuntimeError):
+    """A model failed to load recently and is not retried until its backoff expires."""
+
+    def __init__(self, model_name: str, retry_in: float, error: str):
+        super().__init__(
+            f"Model {model_name} is unavailable (retry in {retry_in:.0f}s): {error}"
+        )
+        self.model_name = model_name
+        self.retry_in = retry_in
+        self.error = error
+
+
+class ModelBudgetError(RuntimeError):
+    """A model is not loaded because it would not fit the pool's memory budget."""
+
+    def __init__(self, model_name: str, required: int, budget: int):
+        super().__init__(
+            f"Model {model_name} needs about {required / 2 ** 20:.0f} MB, "
+            f"more than the {budget / 2 ** 20:.0f} MB memory budget"
+        )
+        self.model_name = model_name
+        self.required = required
+        self.budget = budget
+
+
+def release_memory():
+    """Return freed model memory to the system (collects cycles, empties the CUDA cache)."""
+    gc.collect()
+    # Only touch torch if a backend already imported it
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+def _reap(pool_ref: 'weakref.ref', stop: threading.Event, interval: float):
+    """Background sweep unloading idle models until the pool is closed or collected."""
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool.unload_idle()
+        del pool
+
+
+class ModelPool:
+    """
+    Keep several model pipelines loaded and evict the least recently used.
+
+    With a memory budget, a model is only loaded if its expected size (the
+    size recorded at an earlier load, else ``size_hint``) fits once least
+    recently used models are evicted; otherwise get() raises
+    ModelBudgetError without loading it. The size recorded at load time is
+    the larger of the measurement and the expected size. A model whose size
+    alone exceeds the budget is dropped right after loading and refused from then
+    on. With ``idle_ttl``, models not requested for that long are unloaded
+    by a background sweep and on every get().
+
+    Loading runs outside the pool's lock, so requests for resident models
+    are not held up by a slow load; concurrent requests for the model being
+    loaded wait for that load instead of starting their own.
+
+    A failed load is remembered per model: until its backoff expires, get()
+    raises ModelUnavailableError immediately instead of calling the loader
+    again. The backoff doubles with every consecutive failure.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Any],
+        max_models: int = 2,
+        max_memory_bytes: Optional[int] = None,
+        size_estimator: Callable[[Any], int] = estimate_pipeline_bytes,
+        size_hint: Optional[Callable[[str], Optional[int]]] = None,
+        idle_ttl: Optional[float] = None,
+        reap_interval: Optional[float] = None,
+        failure_backoff: float = 30.0,
+        max_failure_backoff: float = 600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            loader: Callable building a pipeline from a model name
+            max_models: Maximum number of resident pipelines
+            max_memory_bytes: Optional budget for resident model weights
+            size_estimator: Callable returning the memory held by a pipeline
+            size_hint: Callable returning the expected memory of a model before
+                its first load (None when unknown)
+            idle_ttl: Seconds a model may go unrequested before it is unloaded
+                (None keeps models until they are evicted)
+            reap_interval: Seconds between background sweeps for idle models
+                (idle_ttl / 2 by default; 0 leaves the sweeps to get())
+            failure_backoff: Seconds before a failed model is retried (0 retries every time)
+            max_failure_backoff: Upper bound of the doubling backoff
+            clock: Monotonic time source
+        """
+        if max_models < 1:
+            raise ValueError("max_models must be at least 1")
+        self.loader = loader
+        self.max_models = max_models
+        self.max_memory_bytes = max_memory_bytes
+        self.size_estimator = size_estimator
+        self.size_hint = size_hint
+        self.idle_ttl = idle_ttl
+        self.failure_backoff = failure_backoff
+        self.max_failure_backoff = max_failure_backoff
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._last_used = {}
+        # Sizes recorded at load time, kept after eviction for admission checks
+        self._known_sizes = {}
+        # Model name -> (consecutive failures, retry time, last error message)
+        self._failures = {}
+        # Model name -> event set when its in-flight load finishes
+        self._loading = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_failures = 0
+        self.skipped_loads = 0
+        self.evictions = 0
+        self.idle_unloads = 0
+        self.budget_rejections = 0
+        self.load_time = 0.0
+        self._stop = threading.Event()
+        if idle_ttl is not None and reap_interval != 0:
+            # The thread holds a weak reference so it never keeps the pool alive
+            threading.Thread(
+                target=_reap,
+                args=(weakref.ref(self), self._stop, reap_interval or idle_ttl / 2),
+                name='model-pool-reaper',
+                daemon=True
+            ).start()
+
+    def __contains__(self, model_name: str) -> bool:
+        return model_name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def resident_bytes(self) -> int:
+        """Total estimated memory of resident pipelines."""
+        return sum(self._sizes.values())
+
+    def get(self, model_name: str) -> Any:
+        """
+        Return the pipeline for a model, loading it on a miss.
+
+        Args:
+            model_name: Model identifier passed to the loader
+
+        Returns:
+            The loaded pipeline
+
+        Raises:
+            ModelUnavailableError: If the model failed recently and its backoff has not expired
+            ModelBudgetError: If the model does not fit the memory budget
+            Exception: Whatever the loader raises when loading fails
+        """
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._unload_idle(now, keep=model_name)
+                if model_name in self._entries:
+                    self.hits += 1
+                    self._entries.move_to_end(model_name)
+                    self._last_used[model_name] = now
+                    return self._entries[model_name]
+
+                failure = self._failures.get(model_name)
+                if failure is not None:
+                    retry_in = failure[1] - now
+                    if retry_in > 0:
+                        self.skipped_loads += 1
+                        raise ModelUnavailableError(model_name, retry_in, failure[2])
+
+                loading = self._loading.get(model_name)
+                if loading is None:
+                    self._make_room(model_name)
+                    self.misses += 1
+                    loading = self._loading[model_name] = threading.Event()
+                    break
+            # Another thread is loading this model: wait, then look again
+            loading.wait()
+
+        try:
+            return self._load(model_name)
+        finally:
+            with self._lock:
+                del self._loading[model_name]
+            loading.set()
+
+    def _load(self, model_name: str) -> Any:
+        """Run the loader without holding the lock, then admit the pipeline."""
+        start = time.perf_counter()
+        try:
+            pipeline = self.loader(model_name)
+        except Exception as e:
+            with self._lock:
+                self.load_time += time.perf_counter() - start
+                self.load_failures += 1
+                failure = self._failures.get(model_name)
+                failures = failure[0] + 1 if failure is not None else 1
+                backoff = min(self.failure_backoff * 2 ** (failures - 1), self.max_failure_backoff)
+                # Keep only the message: the exception's traceback pins the loader's frames
+                error = f"{type(e).__name__}: {e}"
+                self._failures[model_name] = (failures, self.clock() + backoff, error)
+            raise
+        # A measurement can miss memory the hint accounts for (or fail and
+        # return 0), so it may raise the expected size but never lower it
+        size = max(self.size_estimator(pipeline), self._expected_bytes(model_name) or 0)
+
+        with self._lock:
+            self.load_time += time.perf_counter() - start
+            self._failures.pop(model_name, None)
+            self.loads += 1
+            self._known_sizes[model_name] = size
+            if self.max_memory_bytes is not None and size > self.max_memory_bytes:
+                del pipeline
+                release_memory()
+                self.budget_rejections += 1
+                raise ModelBudgetError(model_name, size, self.max_memory_bytes)
+            self._entries[model_name] = pipeline
+            self._sizes[model_name] = size
+            self._last_used[model_name] = self.clock()
+            self._evict_over_budget(keep=model_name)
+            return pipeline
+
+    def _expected_bytes(self, model_name: str) -> Optional[int]:
+        """Size of a model before loading it: measured earlier, else the hint."""
+        if model_name in self._known_sizes:
+            return self._known_sizes[model_name]
+        if self.size_hint is None:
+            return None
+        return self.size_hint(model_name)
+
+    def _make_room(self, model_name: str):
+        """
+        Evict least recently used pipelines so a model fits the budget before it loads.
+
+        Raises:
+            ModelBudgetError: If the model would not fit even in an empty pool
+        """
+        if self.max_memory_bytes is None:
+            return
+        required = self._expected_bytes(model_name)
+        if not required:
+            # Unknown size: load, measure and evict afterwards
+            return
+        if required > self.max_memory_bytes:
+            self.budget_rejections += 1
+            raise ModelBudgetError(model_name, required, self.max_memory_bytes)
+        # Models being loaded by other threads will need their room too
+        required += sum(self._expected_bytes(name) or 0 for name in self._loading)
+        while self._entries and self.resident_bytes + required > self.max_memory_bytes:
+            self.evict(next(iter(self._entries)))
+
+    def _evict_over_budget(self, keep: str):
+        """Evict least recently used pipelines until the pool fits its limits."""
+        while len(self._entries) > 1:
+            over_count = len(self._entries) > self.max_models
+            over_memory = (
+                self.max_memory_bytes is not None
+                and self.resident_bytes > self.max_memory_bytes
+            )
+            if not (over_count or over_memory):
+                break
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            self.evict(oldest)
+
+    def evict(self, model_name: str) -> bool:
+        """
+        Drop a pipeline from the pool.
+
+        The memory is freed once no caller holds the pipeline any more.
+
+        Args:
+            model_name: Model identifier to evict
+
+        Returns:
+            True if the model was resident
+        """
+        with self._lock:
+            if model_name not in self._entries:
+                return False
+            del self._entries[model_name]
+            self._sizes.pop(model_name, None)
+            self._last_used.pop(model_name, None)
+            self.evictions += 1
+            release_memory()
+            return True
+
+    def unload_idle(self) -> int:
+        """
+        Unload models that have not been requested for ``idle_ttl`` seconds.
+
+        Returns:
+            Number of models unloaded
+        """
+        with self._lock:
+            return self._unload_idle(self.clock())
+
+    def _unload_idle(self, now: float, keep: Optional[str] = None) -> int:
+        """Unload idle models except ``keep`` (caller holds the lock)."""
+        if self.idle_ttl is None:
+            return 0
+        idle = [
+            name for name, used in self._last_used.items()
+            if name != keep and now - used >= self.idle_ttl
+        ]
+        for name in idle:
+            self.evict(name)
+            self.idle_unloads += 1
+        return len(idle)
+
+    def forget_failures(self, model_name: Optional[str] = None):
+        """
+        Allow failed models to be retried immediately.
+
+        Args:
+            model_name: Model to forget, or None for every model
+        """
+        with self._lock:
+            if model_name is None:
+                self._failures.clear()
+            else:
+                self._failures.pop(model_name, None)
+
+    def clear(self):
+        """Evict every resident pipeline."""
+        with self._lock:
+            for model_name in list(self._entries):
+                self.evict(model_name)
+
+    def close(self):
+        """Stop the idle sweep and evict every resident pipeline."""
+        self._stop.set()
+        self.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report pool counters.
+
+        Returns:
+            Dictionary with hit/miss/load counters, resident models with
+            their estimated bytes and idle seconds, the memory budget, and
+            failed models with the seconds until they are retried
+        """
+        with self._lock:
+            now = self.clock()
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'loads': self.loads,
+                'load_failures': self.load_failures,
+                'skipped_loads': self.skipped_loads,
+                'unavailable': {
+                    name: max(0.0, retry_at - now)
+                    for name, (_, retry_at, _) in self._failures.items()
+                },
+                'evictions': self.evictions,
+                'idle_unloads': self.idle_unloads,
+                'budget_rejections': self.budget_rejections,
+                'load_time': self.load_time,
+                'resident': list(self._entries),
+                'resident_bytes': self.resident_bytes,
+                'model_bytes': dict(self._sizes),
+                'idle_seconds': {name: now - used for name, used in self._last_used.items()},
+                'budget_bytes': self.max_memory_bytes,
+                'idle_ttl': self.idle_ttl,
+            }
@@ -0,0 +1,310 @@
+"""
+Pre-fork worker pool sharing loaded model weights copy-on-write.
+
+The parent process loads the models once and then forks the workers.
+Model weights are never written after loading, so the pages holding them
+stay shared between all processes instead of being copied N times. Each
+worker pins its torch intra-op thread count so that the pool as a whole
+does not oversubscribe the CPU.
+
+Requires the 'fork' start method (Linux, macOS). The parent must not run
+inference before forking: some OpenMP runtimes deadlock in children forked
+after their thread pool has started.
+"""
+
+import gc
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import SummaryCache
+from .profiles import pin_threads
+from .summarizer import Summarizer
+
+# Objects inherited from the parent that must stay alive (not be closed) in a worker
+_inherited = []
+
+
+def summarize_document(
+    summarizer: Summarizer,
+    text: str,
+    compression_level: float = 0.3,
+    language: Optional[str] = None,
+    key_points: int = 0
+) -> Tuple[str, str, Optional[List[str]]]:
+    """
+    Summarize one text and optionally extract key points (runs in a worker).
+
+    Returns:
+        Tuple of (summary, detected_language, key_points or None)
+    """
+    summary, detected = summarizer.summarize(text, compression_level, language)
+    points = summarizer.extract_key_points(text, num_points=key_points) if key_points else None
+    return summary, detected, points
+
+
+def _worker_main(summarizer: Summarizer, tasks, results, threads: int):
+    """Worker loop: run (task_id, func, args) tasks until a None sentinel."""
+    # Also caps profile thread settings, so generation keeps the pin
+    pin_threads(threads)
+    if summarizer.cache is not None:
+        # SQLite connections must not cross fork(); open a private one and
+        # keep the inherited one unused (closing it could disturb the parent)
+        _inherited.append(summarizer.cache)
+        summarizer.cache = SummaryCache(summarizer.cache.cache_dir, summarizer.cache.max_bytes)
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        task_id, func, args = task
+        try:
+            outcome = (True, func(summarizer, *args))
+        except Exception as e:
+            outcome = (False, e)
+        results.put((task_id, _encode(outcome)))
+
+
+def _encode(outcome: Tuple[bool, Any]) -> bytes:
+    """
+    Pickle a task outcome in the worker.
+
+    Queue.put pickles in a background feeder thread, where a failure is only
+    printed and the result never arrives; pickling here instead turns an
+    unpicklable result or exception into an error the caller receives.
+    """
+    try:
+        return pickle.dumps(outcome)
+    except Exception as e:
+        ok, value = outcome
+        if ok:
+            what = f"result of type {type(value).__name__}"
+        else:
+            what = 'exception ' + ''.join(traceback.format_exception_only(type(value), value)).strip()
+        return pickle.dumps((False, RuntimeError(f"Worker could not send back its {what}: {e}")))
+
+
+def _decode(payload: bytes) -> Tuple[bool, Any]:
+    """Unpickle a task outcome in the parent, reporting a failure as the task's error."""
+    try:
+        return pickle.loads(payload)
+    except Exception as e:
+        return False, RuntimeError(f"Could not unpickle a worker's outcome: {type(e).__name__}: {e}")
+
+
+def process_memory(pid: int) -> Dict[str, int]:
+    """
+    Read a process's memory usage from /proc (Linux).
+
+    Args:
+        pid: Process id
+
+    Returns:
+        Dictionary with rss, pss and uss in bytes (empty if unavailable).
+        PSS splits shared pages between the processes sharing them, so the
+        sum of PSS over a pool is its real footprint.
+    """
+    fields = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == 'kB':
+                    fields[name] = int(parts[0]) * 1024
+    except OSError:
+        return {}
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'uss': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+    }
+
+
+class PreforkPool:
+    """
+    Process pool whose workers inherit a warm Summarizer through fork().
+
+    Usage:
+        summarizer = Summarizer(language='auto')
+        with PreforkPool(summarizer, workers=4, languages=['en', 'ru']) as pool:
+            results = pool.summarize_many(texts, 0.3)
+    """
+
+    def __init__(
+        self,
+        summarizer: Summarizer,
+        workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        languages: Sequence[str] = ('en',)
+    ):
+        """
+        Load models in this process and fork the workers.
+
+        Args:
+            summarizer: Summarizer shared with the workers
+            workers: Number of worker processes (CPU count by default)
+            threads_per_worker: Torch threads per worker (cores / workers by default)
+            languages: Languages whose models are loaded before forking;
+                other models are loaded privately by each worker on demand
+        """
+        cpus = os.cpu_count() or 1
+        self.workers = max(1, workers or cpus)
+        self.threads_per_worker = max(1, threads_per_worker or cpus // self.workers)
+        self.summarizer = summarizer
+        if summarizer.engine != 'extractive':
+            for language in languages:
+                summarizer._load_model(language)
+
+        context = multiprocessing.get_context('fork')
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # Reason the pool stopped accepting work (a worker died), or None
+        self.broken: Optional[str] = None
+        # Objects created so far are never collected, so the collector does
+        # not write to (and un-share) their pages in the workers
+        gc.collect()
+        gc.freeze()
+        self._processes = [
+            context.Process(
+                target=_worker_main,
+                args=(summarizer, self._tasks, self._results, self.threads_per_worker),
+                daemon=True
+            )
+            for _ in range(self.workers)
+        ]
+        for process in self._processes:
+            process.start()
+        gc.unfreeze()
+
+    def map(
+        self,
+        func: Callable[..., Any],
+        arguments: Iterable[tuple],
+        return_errors: bool = False
+    ) -> List[Any]:
+        """
+        Run ``func(summarizer, *args)`` in the workers for every argument tuple.
+
+        Args:
+            func: Module-level function (sent to the workers by reference)
+            arguments: Argument tuples, one per call
+            return_errors: Return a (ok, result or exception) tuple per call
+                instead of raising the first exception
+
+        Returns:
+            Results in input order
+
+        Raises:
+            Exception: The first exception raised by a call (unless return_errors)
+            RuntimeError: If a worker process died, now or in an earlier call
+                (the pool is then broken and refuses further calls)
+        """
+        with self._lock:
+            if self.broken is not None:
+                raise RuntimeError(f"Worker pool is broken: {self.broken}")
+            first_id = self._next_id
+            count = 0
+            for args in arguments:
+                self._tasks.put((first_id + count, func, tuple(args)))
+                count += 1
+            self._next_id += count
+
+            outcomes = [None] * count
+            received = 0
+            try:
+                while received < count:
+                    task_id, payload = self._next_result()
+                    index = task_id - first_id
+                    if not 0 <= index < count:
+                        # Left over from an earlier call that was interrupted
+                        continue
+                    outcomes[index] = _decode(payload)
+                    received += 1
+            except BaseException as e:
+                # Results of this batch may still arrive; the workers can't be trusted
+                self.broken = f"{type(e).__name__}: {e}"
+                raise
+        if return_errors:
+            return outcomes
+        for ok, value in outcomes:
+            if not ok:
+                raise value
+        return [value for _, value in outcomes]
+
+    def _next_result(self) -> tuple:
+        """Wait for a result, failing instead of hanging if a worker died."""
+        while True:
+            try:
+                return self._results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [p.pid for p in self._processes if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker process(es) {dead} exited unexpectedly")
+
+    def summarize_many(
+        self,
+        texts: Sequence[str],
+        compression_level: float = 0.3,
+        language: Optional[str] = None,
+        key_points: int = 0,
+        return_errors: bool = False
+    ) -> List[Any]:
+        """
+        Summarize texts across the workers.
+
+        Args:
+            texts: Input texts
+            compression_level: Compression level (0.2, 0.3, or 0.5)
+            language: Language code or None for auto-detection
+            key_points: Number of key points per text (0 for none)
+            return_errors: Return a (ok, result or exception) tuple per text
+                instead of raising the first exception
+
+        Returns:
+            Tuples of (summary, detected_language, key_points or None) in input order
+        """
+        return self.map(
+            summarize_document,
+            ((text, compression_level, language, key_points) for text in texts),
+            return_errors
+        )
+
+    def memory_stats(self) -> Dict[str, Any]:
+        """
+        Report memory of the parent and every worker.
+
+        Returns:
+            Dictionary with per-process figures and totals; 'total_pss' is
+            the pool's real footprint and 'total_rss' what it would cost if
+            nothing were shared
+        """
+        parent = process_memory(os.getpid())
+        workers = [dict(process_memory(p.pid), pid=p.pid) for p in self._processes]
+        processes = [parent] + workers
+        return {
+            'parent': parent,
+            'workers': workers,
+            'total_rss': sum(p.get('rss', 0) for p in processes),
+            'total_pss': sum(p.get('pss', 0) for p in processes),
+        }
+
+    def close(self):
+        """Stop the workers after queued tasks finish."""
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join()
+        self._tasks.close()
+        self._results.close()
+
+    def __enter__(self) -> 'PreforkPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,143 @@
+"""
+Named decoding profiles trading summary quality for generation speed.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class GenerationProfile(NamedTuple):
+    """Decoding settings applied to every pipeline call."""
+    name: str
+    # Beam width (1 means greedy decoding)
+    num_beams: int
+    # Hard cap on generated tokens, whatever the compression target asks for
+    max_new_tokens: Optional[int]
+    # Minimum length as a fraction of the target length
+    min_length_ratio: float
+    length_penalty: float
+    no_repeat_ngram_size: int
+    # Run generation under torch.inference_mode()
+    inference_mode: bool
+    # Intra-op threads for torch (None leaves the process setting alone)
+    threads: Optional[int]
+
+
+PROFILES = {
+    'fast': GenerationProfile(
+        name='fast', num_beams=1, max_new_tokens=128, min_length_ratio=0.25,
+        length_penalty=1.0, no_repeat_ngram_size=3, inference_mode=True,
+        # Small batches decode token by token; a few threads avoid sync overhead
+        threads=min(4, os.cpu_count() or 1)
+    ),
+    'balanced': GenerationProfile(
+        name='balanced', num_beams=2, max_new_tokens=256, min_length_ratio=0.5,
+        length_penalty=1.0, no_repeat_ngram_size=3, inference_mode=True, threads=None
+    ),
+    'quality': GenerationProfile(
+        name='quality', num_beams=4, max_new_tokens=None, min_length_ratio=0.5,
+        length_penalty=2.0, no_repeat_ngram_size=3, inference_mode=True, threads=None
+    ),
+}
+
+DEFAULT_PROFILE = 'balanced'
+
+# Thread count pinned for the whole process (e.g. in a pre-fork worker);
+# profiles never raise torch above it
+_pinned_threads: Optional[int] = None
+
+
+def get_profile(name: str) -> GenerationProfile:
+    """
+    Look up a profile by name.
+
+    Args:
+        name: 'fast', 'balanced' or 'quality'
+
+    Returns:
+        The profile
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if name not in PROFILES:
+        raise ValueError(f"Unsupported profile: {name}")
+    return PROFILES[name]
+
+
+def generation_kwargs(profile: GenerationProfile, target_tokens: int) -> Dict[str, Any]:
+    """
+    Build pipeline keyword arguments for a target summary length.
+
+    Args:
+        profile: Decoding profile
+        target_tokens: Summary length asked for by the compression level
+
+    Returns:
+        Keyword arguments for a summarization pipeline call
+    """
+    max_new_tokens = max(1, target_tokens)
+    if profile.max_new_tokens is not None:
+        max_new_tokens = min(max_new_tokens, profile.max_new_tokens)
+    kwargs = {
+        'max_new_tokens': max_new_tokens,
+        'min_new_tokens': max(1, int(max_new_tokens * profile.min_length_ratio)),
+        'num_beams': profile.num_beams,
+        'length_penalty': profile.length_penalty,
+        'no_repeat_ngram_size': profile.no_repeat_ngram_size,
+        'do_sample': False,
+    }
+    if profile.num_beams > 1:
+        kwargs['early_stopping'] = True
+    return kwargs
+
+
+def pin_threads(threads: int):
+    """
+    Limit torch (and OpenMP/BLAS started later) to ``threads`` threads for good.
+
+    Profile thread settings applied afterwards are capped at this count.
+
+    Args:
+        threads: Intra-op threads for this process
+    """
+    global _pinned_threads
+    _pinned_threads = threads
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ['MKL_NUM_THREADS'] = str(threads)
+    torch = sys.modules.get('torch')
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+@contextmanager
+def inference_context(profile: GenerationProfile):
+    """
+    Apply a profile's torch settings around generation.
+
+    Does nothing unless torch has already been imported by a backend, so
+    stub pipelines and the extractive engine never pull torch in. A
+    profile's thread count never exceeds a count set by pin_threads(), and
+    the previous process-wide count is restored on exit.
+    """
+    torch = sys.modules.get('torch')
+    if torch is None:
+        yield
+        return
+    threads = profile.threads
+    if _pinned_threads is not None:
+        threads = _pinned_threads if threads is None else min(threads, _pinned_threads)
+    previous = torch.get_num_threads()
+    if threads is not None and previous != threads:
+        torch.set_num_threads(threads)
+    try:
+        if profile.inference_mode:
+            with torch.inference_mode():
+                yield
+        else:
+            yield
+    finally:
+        if torch.get_num_threads() != previous:
+            torch.set_num_threads(previous)
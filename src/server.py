@@ -0,0 +1,345 @@
+"""
+Long-running summarization server with warm models and dynamic micro-batching.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+from .document import Document
+from .language import detect_language
+from .metrics import Metrics
+from .summarizer import Summarizer
+
+
+class _Request:
+    """A queued summarization request."""
+
+    __slots__ = ('document', 'compression', 'language', 'key_points', 'future', 'arrived')
+
+    def __init__(self, document, compression, language, key_points):
+        self.document = document
+        self.compression = compression
+        self.language = language
+        self.key_points = key_points
+        self.future = Future()
+        self.arrived = time.monotonic()
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent requests into per-language micro-batches.
+
+    Requests are grouped by (language, compression level). A group is
+    dispatched as soon as it reaches ``max_batch_size`` or its oldest
+    request has waited ``max_wait`` seconds. Each worker thread owns a
+    Summarizer; all of them share one model pool, so models stay warm.
+    """
+
+    def __init__(
+        self,
+        summarizer_factory: Callable[[], Summarizer],
+        max_batch_size: int = 8,
+        max_wait: float = 0.02,
+        workers: int = 1
+    ):
+        """
+        Start the worker threads.
+
+        Args:
+            summarizer_factory: Callable returning a Summarizer per worker
+            max_batch_size: Maximum number of requests per batch
+            max_wait: Maximum seconds a request waits for its batch to fill
+            workers: Number of batches processed concurrently
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._groups = {}
+        self._condition = threading.Condition()
+        self._closing = False
+        self._stats = {
+            'requests': 0,
+            'completed': 0,
+            'errors': 0,
+            'batches': 0,
+            'batched_requests': 0,
+            'max_batch_size': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0,
+        }
+        self.summarizers = [summarizer_factory() for _ in range(max(1, workers))]
+        self._threads = [
+            threading.Thread(target=self._work, args=(summarizer,), daemon=True)
+            for summarizer in self.summarizers
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        text: str,
+        compression: float = 0.3,
+        language: Optional[str] = None,
+        key_points: int = 0
+    ) -> Future:
+        """
+        Queue a text for summarization.
+
+        Args:
+            text: Input text
+            compression: Compression level
+            language: Language code, or None for auto-detection
+            key_points: Number of key points to extract (0 for none)
+
+        Returns:
+            Future resolving to a dict with summary, language and key points
+        """
+        document = Document(text)
+        if language is None:
+            # Cheap sampled detection; it decides the batch the request joins
+            language = detect_language(text) if text.strip() else 'unknown'
+        document.language = language
+        request = _Request(document, compression, language, key_points)
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("Server is shutting down")
+            self._groups.setdefault((language, compression), []).append(request)
+            self._stats['requests'] += 1
+            self._condition.notify()
+        return request.future
+
+    def _next_batch(self) -> Optional[List[_Request]]:
+        """Block until a batch is due; return None once closed and drained."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                oldest_key, oldest = None, None
+                for key, requests in self._groups.items():
+                    if oldest is None or requests[0].arrived < oldest:
+                        oldest_key, oldest = key, requests[0].arrived
+                    if len(requests) >= self.max_batch_size:
+                        oldest_key, oldest = key, float('-inf')
+                        break
+                if oldest_key is not None and (
+                    self._closing or now - oldest >= self.max_wait
+                ):
+                    requests = self._groups[oldest_key]
+                    batch = requests[:self.max_batch_size]
+                    rest = requests[self.max_batch_size:]
+                    if rest:
+                        self._groups[oldest_key] = rest
+                    else:
+                        del self._groups[oldest_key]
+                    return batch
+                if oldest_key is None and self._closing:
+                    return None
+                timeout = None if oldest is None else self.max_wait - (now - oldest)
+                self._condition.wait(timeout)
+
+    def _work(self, summarizer: Summarizer):
+        """Worker loop: run batches through the summarizer."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._run_batch(summarizer, batch)
+
+    def _run_batch(self, summarizer: Summarizer, batch: List[_Request]):
+        """Summarize one batch and resolve its futures."""
+        language = batch[0].language
+        try:
+            results = summarizer.summarize_many(
+                [r.document for r in batch],
+                batch[0].compression,
+                batch_size=len(batch),
+                language=None if language == 'unknown' else language
+            )
+        except Exception as e:
+            with self._condition:
+                self._stats['errors'] += len(batch)
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        finished = time.monotonic()
+        failed = 0
+        for request, (summary, detected) in zip(batch, results):
+            response = {'summary': summary, 'language': detected}
+            try:
+                if request.key_points:
+                    response['key_points'] = summarizer.extract_key_points(
+                        request.document, num_points=request.key_points
+                    )
+            except Exception as e:
+                # One request's failure must not strand the rest of the batch
+                failed += 1
+                request.future.set_exception(e)
+                continue
+            request.future.set_result(response)
+
+        with self._condition:
+            stats = self._stats
+            stats['batches'] += 1
+            stats['batched_requests'] += len(batch)
+            stats['completed'] += len(batch) - failed
+            stats['errors'] += failed
+            stats['max_batch_size'] = max(stats['max_batch_size'], len(batch))
+            for request in batch:
+                latency = finished - request.arrived
+                stats['total_latency'] += latency
+                stats['max_latency'] = max(stats['max_latency'], latency)
+
+    def warm_up(self, languages: List[str]):
+        """Load the models for the given languages before serving."""
+        for language in languages:
+            self.summarizers[0]._load_model(language)
+        # The pool keeps them resident; idle unloading only frees unreferenced models
+        self.summarizers[0].release_model()
+
+    def close(self):
+        """Stop accepting requests, finish queued ones and join the workers."""
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report queue and batching counters.
+
+        Returns:
+            Dictionary with request, batch and latency metrics
+        """
+        with self._condition:
+            stats = dict(self._stats)
+            stats['queue_depth'] = sum(len(r) for r in self._groups.values())
+        stats['mean_batch_size'] = (
+            stats['batched_requests'] / stats['batches'] if stats['batches'] else 0.0
+        )
+        stats['mean_latency'] = (
+            stats.pop('total_latency') / stats['completed'] if stats['completed'] else 0.0
+        )
+        stats['models'] = self.summarizers[0].model_stats()
+        return stats
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end: POST /summarize, GET /health, GET /metrics[/prometheus]."""
+
+    batcher: MicroBatcher = None
+    metrics: Optional[Metrics] = None
+    request_timeout: float = 300.0
+
+    def address_string(self) -> str:
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, 'application/json; charset=utf-8', body)
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _prometheus(self) -> str:
+        """Stage metrics plus batcher counters in Prometheus text format."""
+        text = self.metrics.to_prometheus() if self.metrics is not None else ''
+        lines = []
+        for name, value in self.batcher.stats().items():
+            if isinstance(value, (int, float)):
+                lines.append(f"# TYPE edu_summarizer_server_{name} gauge")
+                lines.append(f"edu_summarizer_server_{name} {value}")
+        return text + '\n'.join(lines) + '\n'
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            stats = self.batcher.stats()
+            if self.metrics is not None:
+                stats['pipeline'] = self.metrics.snapshot()
+            self._send_json(200, stats)
+        elif self.path == '/metrics/prometheus':
+            body = self._prometheus().encode('utf-8')
+            self._send(200, 'text/plain; version=0.0.4; charset=utf-8', body)
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/summarize':
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+            text = payload['text']
+            compression = float(payload.get('compression', 0.3))
+            language = payload.get('language')
+            key_points = int(payload.get('key_points', 0))
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError("'text' must be a non-empty string")
+            if not 0 < compression <= 1:
+                raise ValueError("'compression' must be greater than 0 and at most 1")
+            if language is not None and not isinstance(language, str):
+                raise ValueError("'language' must be a string")
+            if key_points < 0:
+                raise ValueError("'key_points' must not be negative")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': f"Invalid request: {e}"})
+            return
+        try:
+            future = self.batcher.submit(text, compression, language, key_points)
+            self._send_json(200, future.result(timeout=self.request_timeout))
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+
+
+class _UnixHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server listening on a Unix domain socket."""
+
+    address_family = socket.AF_UNIX
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        self.socket.bind(self.server_address)
+        self.server_name, self.server_port = 'localhost', 0
+
+
+def create_server(
+    batcher: MicroBatcher,
+    host: str = '127.0.0.1',
+    port: int = 8000,
+    unix_socket: Optional[str] = None,
+    metrics: Optional[Metrics] = None
+) -> ThreadingHTTPServer:
+    """
+    Build an HTTP server bound to TCP or a Unix socket.
+
+    Args:
+        batcher: Batcher that processes requests
+        host: TCP host to bind
+        port: TCP port to bind (0 for any free port)
+        unix_socket: Path of a Unix socket to bind instead of TCP
+        metrics: Collector reported by /metrics and /metrics/prometheus
+
+    Returns:
+        Server ready for serve_forever()
+    """
+    handler = type('Handler', (_Handler,), {'batcher': batcher, 'metrics': metrics})
+    if unix_socket:
+        return _UnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((host, port), handler)
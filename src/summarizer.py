@@ -2,11 +2,25 @@
 Core summarization module with support for multiple languages and compression levels.
 """
 
-import re
-from typing import List, Tuple
-from langdetect import detect, LangDetectException
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .backends import BACKENDS, DEFAULT_BACKEND, create_pipeline, estimate_model_bytes, resolve_model_path
+from .cache import SummaryCache, make_key
+from .chunking import Chunk, chunk_paragraphs, chunk_text, count_words
+from .document import Document
+from .extractive import rank_sentences
+from .language import detect_language
+from .metrics import count, timed
+from .model_pool import ModelBudgetError, ModelPool, ModelUnavailableError
+from .profiles import DEFAULT_PROFILE, generation_kwargs, get_profile, inference_context
+
+# Every public method accepts raw text or a pre-segmented Document
+TextInput = Union[str, Document]
 
 
 class Summarizer:
@@ -19,178 +33,947 @@ class Summarizer:
         'de': 'facebook/mbart-large-50-many-to-many-mmt'
     }
     
-    def __init__(self, language: str = 'auto'):
+    # Smaller variants loaded when a language's model does not fit the memory budget
+    SMALL_MODELS = {
+        'en': 'sshleifer/distilbart-cnn-6-6'
+    }
+    
+    # Summarization engines: 'auto' uses transformers with an extractive
+    # fallback, 'extractive' never imports torch/transformers at all
+    ENGINES = ('auto', 'extractive')
+    
+    # Method name recorded in cache keys for extractive summaries
+    EXTRACTIVE_METHOD = 'extractive'
+    
+    # Token window used when the tokenizer does not report one
+    DEFAULT_MAX_TOKENS = 1024
+    # Tokens reserved in every chunk for special tokens
+    CHUNK_MARGIN = 8
+    # Number of chunks passed to the pipeline per call
+    BATCH_SIZE = 8
+    # Chunk summary targets are rounded to this many steps per doubling of
+    # the length (within 12.5%), so chunks of similar length share a batch
+    TARGET_STEPS = 4
+    # Reduce passes run while the summary exceeds target * REDUCE_TOLERANCE
+    MAX_REDUCE_PASSES = 2
+    REDUCE_TOLERANCE = 1.2
+    
+    def __init__(
+        self,
+        language: str = 'auto',
+        engine: str = 'auto',
+        backend: str = DEFAULT_BACKEND,
+        profile: str = DEFAULT_PROFILE,
+        model_dir: Optional[str] = None,
+        offline: bool = False,
+        cache_dir: Optional[str] = None,
+        max_models: int = 2,
+        max_model_memory: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+        fallback_models: Optional[Dict[str, str]] = None,
+        model_pool: Optional[ModelPool] = None,
+        cache: Optional[SummaryCache] = None,
+        executor: Optional[Executor] = None,
+        model_concurrency: int = 1
+    ):
         """
         Initialize the summarizer.
         
         Args:
             language: Target language ('en', 'ru', 'de', or 'auto' for auto-detection)
+            engine: Summarization engine ('auto' or 'extractive')
+            backend: Inference backend ('torch', 'int8' or 'onnx')
+            profile: Decoding profile ('fast', 'balanced' or 'quality')
+            model_dir: Directory of downloaded models, looked up before the Hub
+            offline: Never download models; resolve them from model_dir or the
+                local Hugging Face cache only
+            cache_dir: Directory for backend artifacts such as ONNX exports
+                (the summary cache's directory, else the tool's cache directory)
+            max_models: Maximum number of language models kept resident
+            max_model_memory: Optional memory budget for resident models, in bytes;
+                a model that would not fit is not loaded
+            idle_ttl: Seconds after which an unused model is unloaded
+            fallback_models: Language -> smaller model loaded when the language's
+                model does not fit the budget (SMALL_MODELS by default; {} to
+                go straight to the extractive fallback)
+            model_pool: Shared model pool (overrides max_models, max_model_memory
+                and idle_ttl)
+            cache: Persistent summary cache consulted before any model work
+            executor: Thread pool running the async API's blocking work
+                (a pool sized to the CPU count is created on first use)
+            model_concurrency: Maximum concurrent async inferences per model
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
         self.language = language
+        self.engine = engine
+        self.backend = backend
+        self.profile = get_profile(profile)
+        self.model_dir = model_dir
+        self.offline = offline
+        if cache_dir is None and cache is not None:
+            cache_dir = cache.cache_dir
+        self.cache_dir = cache_dir
         self.model = None
         self.tokenizer = None
         self.summarizer_pipeline = None
-        self._device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self._device = None
+        self.fallback_models = self.SMALL_MODELS if fallback_models is None else fallback_models
+        if model_pool is None:
+            model_pool = ModelPool(
+                self._create_pipeline,
+                max_models=max_models,
+                max_memory_bytes=max_model_memory,
+                size_hint=self._expected_model_bytes,
+                idle_ttl=idle_ttl
+            )
+        self.model_pool = model_pool
+        self.cache = cache
+        self.model_name = None
+        # Chunk-level cache counters for incremental re-summarization
+        self._chunk_stats = {'hits': 0, 'misses': 0, 'tokens_reused': 0, 'tokens_generated': 0}
+        self.model_concurrency = max(1, model_concurrency)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+        self._local = threading.local()
+        # Per event loop: model name -> semaphore
+        self._semaphores = weakref.WeakKeyDictionary()
     
-    def detect_language(self, text: str) -> str:
+    def detect_language(self, text: TextInput) -> str:
         """
         Detect the language of the input text.
         
         Args:
-            text: Input text to analyze
+            text: Input text or Document to analyze (a Document remembers the result)
             
         Returns:
             Detected language code ('en', 'ru', 'de')
         """
-        try:
-            detected = detect(text)
-            # Map langdetect codes to our supported languages
-            lang_map = {
-                'en': 'en',
-                'ru': 'ru',
-                'de': 'de'
-            }
-            return lang_map.get(detected, 'en')  # Default to English
-        except LangDetectException:
-            return 'en'  # Default to English if detection fails
+        if isinstance(text, Document):
+            if text.language is None:
+                with timed('detect'):
+                    text.language = detect_language(text.text)
+            return text.language
+        with timed('detect'):
+            return detect_language(text)
+    
+    def _resolve_language(self, document: Document, language: Optional[str]) -> str:
+        """Pick the explicit, configured or detected language of a document."""
+        if language is not None:
+            return language
+        if self.language != 'auto':
+            return self.language
+        return self.detect_language(document)
+    
+    def _create_pipeline(self, model_name: str) -> Any:
+        """Build a summarization pipeline for a model (used by the model pool)."""
+        # Backends import torch/transformers only when a model is needed
+        return create_pipeline(
+            self.backend, resolve_model_path(model_name, self.model_dir), self._device,
+            local_files_only=self.offline, cache_dir=self.cache_dir
+        )
+    
+    def _expected_model_bytes(self, model_name: str) -> Optional[int]:
+        """Estimate a model's memory from its downloaded weights (used by the model pool)."""
+        return estimate_model_bytes(self.backend, model_name, self.model_dir)
     
     def _load_model(self, language: str):
-        """Load the appropriate model for the specified language."""
+        """
+        Load the appropriate model for the specified language.
+        
+        If the model does not fit the memory budget, the language's smaller
+        variant from ``fallback_models`` is tried; if that does not fit
+        either, no pipeline is set and callers use the extractive method.
+        """
         model_name = self.MODELS.get(language, self.MODELS['en'])
+        candidates = [model_name]
+        smaller = self.fallback_models.get(language if language in self.MODELS else 'en')
+        if smaller and smaller != model_name:
+            candidates.append(smaller)
+        
+        self.release_model()
+        for candidate in candidates:
+            count('model_hit' if candidate in self.model_pool else 'model_miss')
+            try:
+                with timed('model_load'):
+                    self.summarizer_pipeline = self.model_pool.get(candidate)
+            except ModelBudgetError:
+                count('model_over_budget')
+                continue
+            except ModelUnavailableError:
+                # Failed recently: fall back without retrying the load (or warning again)
+                count('model_unavailable')
+                return
+            except Exception as e:
+                count('model_load_failure')
+                # Fallback to simple extraction-based method
+                print(f"Warning: Could not load model {candidate}. Using simple method. Error: {e}")
+                return
+            self.model_name = candidate
+            self.model = getattr(self.summarizer_pipeline, 'model', None)
+            self.tokenizer = getattr(self.summarizer_pipeline, 'tokenizer', None)
+            return
+    
+    def release_model(self):
+        """
+        Drop this instance's references to the loaded pipeline.
         
+        The model pool decides what stays resident: once released, a model
+        the pool has unloaded (idle or over budget) is freed.
+        """
+        self.summarizer_pipeline = None
+        self.model = None
+        self.tokenizer = None
+    
+    @contextmanager
+    def _model_scope(self):
+        """Release the pipeline when a public call finishes."""
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-            self.summarizer_pipeline = pipeline(
-                "summarization",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if self._device == 'cuda' else -1
-            )
-        except Exception as e:
-            # Fallback to simple extraction-based method
-            print(f"Warning: Could not load model {model_name}. Using simple method. Error: {e}")
-            self.summarizer_pipeline = None
+            yield
+        finally:
+            self.release_model()
+    
+    def _loaded_key(self, key: str, text: str, language: str, compression_level: float, reduce: bool) -> str:
+        """Cache key of a summary by the model actually loaded (a smaller variant may be in use)."""
+        if self.summarizer_pipeline is None or self.model_name == self.MODELS.get(language, self.MODELS['en']):
+            return key
+        return make_key(text, language, compression_level, self.model_name, self._generation_params(reduce))
+    
+    def model_stats(self) -> dict:
+        """
+        Report model pool counters.
+        
+        Returns:
+            Dictionary with hits, misses, load time, resident models and their
+            estimated memory, and the memory budget
+        """
+        return self.model_pool.stats()
+    
+    def chunk_stats(self) -> dict:
+        """
+        Report how much map work the chunk cache saved.
+        
+        Returns:
+            Dictionary with chunk hits/misses, reused/generated input tokens
+            and the fraction of input tokens that skipped the model
+        """
+        stats = dict(self._chunk_stats)
+        total = stats['tokens_reused'] + stats['tokens_generated']
+        stats['reused_fraction'] = stats['tokens_reused'] / total if total else 0.0
+        return stats
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with the loaded model's tokenizer (words as fallback)."""
+        tokenizer = getattr(self.summarizer_pipeline, 'tokenizer', None)
+        if tokenizer is None:
+            return count_words(text)
+        return len(tokenizer.encode(text, add_special_tokens=False))
+    
+    def _max_input_tokens(self) -> int:
+        """Return the number of input tokens that fit the model's window."""
+        tokenizer = getattr(self.summarizer_pipeline, 'tokenizer', None)
+        limit = getattr(tokenizer, 'model_max_length', None)
+        # Tokenizers without a known limit report a huge sentinel value
+        if not isinstance(limit, int) or limit <= 0 or limit > 100_000:
+            limit = self.DEFAULT_MAX_TOKENS
+        return max(1, limit - self.CHUNK_MARGIN)
+    
+    def _summarize_chunks(
+        self,
+        chunks: List[Chunk],
+        compression_level: float,
+        batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Summarize chunks through the pipeline in batches.
+        
+        Each chunk's target length depends only on its own token count
+        (rounded to TARGET_STEPS steps per power of two), so its summary is
+        the same whichever chunks share its batch and can be cached per
+        chunk. Chunks are sorted by length, and each batch holds chunks with
+        the same target; results are returned in the original order.
+        
+        Args:
+            chunks: Chunks that each fit the model's window
+            compression_level: Target ratio of summary to chunk tokens
+            batch_size: Number of chunks per pipeline call
+            
+        Returns:
+            Partial summaries in chunk order
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        targets = [self._chunk_target(chunk, compression_level) for chunk in chunks]
+        order = sorted(range(len(chunks)), key=lambda i: (targets[i], chunks[i].tokens))
+        batches = []
+        for i in order:
+            if batches and len(batches[-1]) < batch_size and targets[batches[-1][0]] == targets[i]:
+                batches[-1].append(i)
+            else:
+                batches.append([i])
+        summaries = [''] * len(chunks)
+        for indices in batches:
+            batch = [chunks[i] for i in indices]
+            target = targets[indices[0]]
+            with timed('generate'), inference_context(self.profile):
+                result = self.summarizer_pipeline(
+                    [c.text for c in batch],
+                    truncation=True,
+                    batch_size=len(batch),
+                    **generation_kwargs(self.profile, target)
+                )
+            for i, item in zip(indices, result):
+                if isinstance(item, list):
+                    item = item[0]
+                summaries[i] = item.get('summary_text', '').strip()
+        return summaries
+    
+    def _chunk_target(self, chunk: Chunk, compression_level: float) -> int:
+        """Summary length of a chunk, rounded to TARGET_STEPS steps per power of two."""
+        target = max(1, int(chunk.tokens * compression_level))
+        step = max(1, (1 << (target.bit_length() - 1)) // self.TARGET_STEPS)
+        return max(1, int(target / step + 0.5)) * step
     
-    def _simple_summarize(self, text: str, compression_ratio: float) -> str:
+    def _reduce(self, partials: List[str], target: int, reduce: bool) -> str:
         """
-        Simple extraction-based summarization method as fallback.
+        Join partial summaries, re-summarizing them while they overshoot.
+        
+        Args:
+            partials: Partial summaries of consecutive chunks
+            target: Target summary length in tokens
+            reduce: Whether reduce passes are allowed
+            
+        Returns:
+            Combined summary text
+        """
+        summary = ' '.join(p for p in partials if p)
+        passes = 0
+        while reduce and len(partials) > 1 and passes < self.MAX_REDUCE_PASSES:
+            current = self._count_tokens(summary)
+            if current <= target * self.REDUCE_TOLERANCE:
+                break
+            with timed('tokenize'):
+                chunks = chunk_text(summary, self._max_input_tokens(), self._count_tokens)
+            partials = self._summarize_chunks(chunks, target / current)
+            summary = ' '.join(p for p in partials if p)
+            passes += 1
+        return summary
+    
+    def _abstractive_summarize_many(
+        self,
+        texts: List[TextInput],
+        compression_level: float,
+        reduce: bool,
+        batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Map-reduce summarization of several texts with the loaded pipeline.
+        
+        Chunks of all texts share the same batches, so a group of short
+        documents costs a handful of pipeline calls instead of one per text.
+        
+        Args:
+            texts: Input texts (all in the loaded model's language)
+            compression_level: Target ratio of summary to text tokens
+            reduce: Whether to re-summarize overshooting partial summaries
+            batch_size: Number of chunks per pipeline call
+            
+        Returns:
+            Summaries in input order (empty where the model produced nothing)
+        """
+        window = self._max_input_tokens()
+        with timed('tokenize'):
+            # Paragraph-aligned, content-defined chunks stay identical across
+            # edits elsewhere in the document, so their summaries are reusable
+            doc_chunks = [chunk_paragraphs(text, window, self._count_tokens) for text in texts]
+        flat = [chunk for chunks in doc_chunks for chunk in chunks]
+        # Single-chunk documents are covered by the document-level cache
+        cacheable = [len(chunks) > 1 for chunks in doc_chunks for _ in chunks]
+        flat_partials = self._summarize_chunks_cached(flat, cacheable, compression_level, batch_size)
+        
+        summaries = []
+        position = 0
+        for chunks in doc_chunks:
+            partials = flat_partials[position:position + len(chunks)]
+            position += len(chunks)
+            target = max(1, int(sum(c.tokens for c in chunks) * compression_level))
+            summaries.append(self._reduce(partials, target, reduce))
+        return summaries
+    
+    def _chunk_key(self, chunk: Chunk, compression_level: float) -> str:
+        """Cache key of a chunk summary (independent of the surrounding document)."""
+        return make_key(
+            chunk.text, None, compression_level, self.model_name,
+            dict(self._decoding_params(), chunk=True, target_steps=self.TARGET_STEPS)
+        )
+    
+    def _summarize_chunks_cached(
+        self,
+        chunks: List[Chunk],
+        cacheable: List[bool],
+        compression_level: float,
+        batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Summarize chunks, reusing stored summaries of unchanged chunks.
+        
+        Args:
+            chunks: Chunks that each fit the model's window
+            cacheable: Per chunk, whether its summary goes through the cache
+            compression_level: Target ratio of summary to chunk tokens
+            batch_size: Number of chunks per pipeline call
+            
+        Returns:
+            Partial summaries in chunk order
+        """
+        if self.cache is None or not any(cacheable):
+            return self._summarize_chunks(chunks, compression_level, batch_size)
+        
+        summaries = [None] * len(chunks)
+        keys = {}
+        for i, chunk in enumerate(chunks):
+            if not cacheable[i]:
+                continue
+            keys[i] = self._chunk_key(chunk, compression_level)
+            cached = self.cache.get(keys[i])
+            if cached is not None:
+                summaries[i] = cached
+                self._chunk_stats['hits'] += 1
+                self._chunk_stats['tokens_reused'] += chunk.tokens
+                count('chunk_hit')
+        
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        generated = self._summarize_chunks([chunks[i] for i in missing], compression_level, batch_size)
+        for i, summary in zip(missing, generated):
+            summaries[i] = summary
+            if i in keys:
+                self._chunk_stats['misses'] += 1
+                self._chunk_stats['tokens_generated'] += chunks[i].tokens
+                count('chunk_miss')
+                if summary:
+                    self.cache.put(keys[i], summary)
+        return summaries
+    
+    def _abstractive_summarize(self, text: TextInput, compression_level: float, reduce: bool) -> str:
+        """
+        Map-reduce summarization of a single text with the loaded pipeline.
         
         Args:
             text: Input text
+            compression_level: Target ratio of summary to text tokens
+            reduce: Whether to re-summarize overshooting partial summaries
+            
+        Returns:
+            Summary text (empty if the model produced nothing)
+        """
+        return self._abstractive_summarize_many([text], compression_level, reduce)[0]
+    
+    def _cache_get(self, key: str) -> Any:
+        """Look up a cached value (None when caching is disabled or on a miss)."""
+        if self.cache is None:
+            return None
+        value = self.cache.get(key)
+        count('cache_miss' if value is None else 'cache_hit')
+        return value
+    
+    def _cache_put(self, key: str, value: Any):
+        """Store a value in the cache if caching is enabled."""
+        if self.cache is not None:
+            self.cache.put(key, value)
+    
+    def _decoding_params(self) -> dict:
+        """Settings that affect every pipeline output (part of cache keys)."""
+        return {'backend': self.backend, 'profile': self.profile.name}
+    
+    def _generation_params(self, reduce: bool) -> dict:
+        """Parameters that affect abstractive output (part of the cache key)."""
+        return dict(self._decoding_params(), reduce=reduce)
+    
+    def _extractive_summary(self, document: Document, language: str, compression_level: float) -> str:
+        """Run the extractive method, going through the cache."""
+        key = make_key(document.text, language, compression_level, self.EXTRACTIVE_METHOD)
+        summary = self._cache_get(key)
+        if summary is None:
+            with timed('extractive'):
+                summary = self._simple_summarize(document, compression_level)
+            self._cache_put(key, summary)
+        return summary
+    
+    def _simple_summarize(self, text: TextInput, compression_ratio: float) -> str:
+        """
+        Extractive summarization (TF-IDF + TextRank) used as fallback.
+        
+        Args:
+            text: Input text or Document
             compression_ratio: Target compression ratio (0.2, 0.3, 0.5)
             
         Returns:
-            Summarized text
+            Summarized text with the selected sentences in original order
         """
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        document = Document.from_text(text)
         
-        if not sentences:
-            return text
+        if not len(document):
+            return document.text
         
         # Calculate number of sentences to keep
-        num_sentences = max(1, int(len(sentences) * compression_ratio))
+        num_sentences = max(1, int(len(document) * compression_ratio))
+        selected = rank_sentences(document, num_sentences)
         
-        # Simple approach: take first N sentences
-        # In a more sophisticated version, we could score sentences
-        selected_sentences = sentences[:num_sentences]
-        
-        return '. '.join(selected_sentences) + '.'
+        return ' '.join(document.sentences(selected))
     
     def summarize(
         self,
-        text: str,
+        text: TextInput,
         compression_level: float = 0.3,
-        language: str = None
+        language: str = None,
+        reduce: bool = True
     ) -> Tuple[str, str]:
         """
         Summarize the input text.
         
+        Texts longer than the model's token window are split into chunks on
+        sentence/paragraph boundaries, summarized in batches and, if the
+        combined partial summaries overshoot the target length, reduced in a
+        second pass.
+        
         Args:
-            text: Input text to summarize
+            text: Input text or Document to summarize
             compression_level: Compression level (0.2, 0.3, or 0.5)
             language: Language code ('en', 'ru', 'de') or None for auto-detection
+            reduce: Whether to re-summarize partial summaries of long documents
             
         Returns:
             Tuple of (summarized_text, detected_language)
         """
-        if not text or not text.strip():
-            return "", "unknown"
-        
-        # Detect or use specified language
-        if language is None:
-            if self.language == 'auto':
-                detected_lang = self.detect_language(text)
-            else:
-                detected_lang = self.language
-        else:
-            detected_lang = language
-        
-        # Load model if not already loaded or language changed
-        if self.summarizer_pipeline is None or detected_lang != getattr(self, '_current_lang', None):
+        with timed('summarize'), self._model_scope():
+            if _is_blank(text):
+                return "", "unknown"
+            
+            # Segment once; every later stage reuses the document
+            document = Document.from_text(text)
+            detected_lang = self._resolve_language(document, language)
+            
+            # The extractive engine never touches the transformer stack
+            if self.engine == 'extractive':
+                return self._extractive_summary(document, detected_lang, compression_level), detected_lang
+            
+            model_name = self.MODELS.get(detected_lang, self.MODELS['en'])
+            key = make_key(
+                document.text, detected_lang, compression_level, model_name,
+                self._generation_params(reduce)
+            )
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached, detected_lang
+            
+            # Fetch the language's pipeline from the pool (loads on a miss)
             self._load_model(detected_lang)
-            self._current_lang = detected_lang
+            loaded_key = self._loaded_key(key, document.text, detected_lang, compression_level, reduce)
+            if loaded_key != key:
+                key = loaded_key
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached, detected_lang
+            
+            # Use transformer model if available
+            if self.summarizer_pipeline is not None:
+                try:
+                    summary = self._abstractive_summarize(document, compression_level, reduce)
+                    if summary:
+                        self._cache_put(key, summary)
+                        return summary, detected_lang
+                except Exception as e:
+                    print(f"Error in transformer summarization: {e}. Falling back to simple method.")
+            
+            # Fallback to simple method
+            count('fallback')
+            summary = self._extractive_summary(document, detected_lang, compression_level)
+            return summary, detected_lang
+    
+    def summarize_many(
+        self,
+        texts: List[TextInput],
+        compression_level: float = 0.3,
+        batch_size: Optional[int] = None,
+        language: str = None,
+        reduce: bool = True
+    ) -> List[Tuple[str, str]]:
+        """
+        Summarize several texts, batching pipeline calls per language.
         
-        # Calculate max and min length based on compression level
-        text_length = len(text.split())
-        max_length = int(text_length * compression_level)
-        min_length = max(1, int(max_length * 0.5))
+        Languages are detected up front and texts are grouped so that each
+        model is fetched once; within a group, chunks are sorted by length
+        and fed to the pipeline in batches.
         
-        # Use transformer model if available
-        if self.summarizer_pipeline is not None:
-            try:
-                # For some models, we need to handle differently
-                if detected_lang == 'de':
-                    # mBART requires special handling
-                    result = self.summarizer_pipeline(
-                        text,
-                        max_length=max_length,
-                        min_length=min_length,
-                        do_sample=False
-                    )
+        Args:
+            texts: Input texts or Documents to summarize
+            compression_level: Compression level (0.2, 0.3, or 0.5)
+            batch_size: Number of chunks per pipeline call
+            language: Language code applied to all texts, or None for auto-detection
+            reduce: Whether to re-summarize partial summaries of long documents
+            
+        Returns:
+            List of (summarized_text, detected_language) tuples in input order
+        """
+        with self._model_scope():
+            return self._summarize_many(texts, compression_level, batch_size, language, reduce)
+    
+    def _summarize_many(
+        self,
+        texts: List[TextInput],
+        compression_level: float,
+        batch_size: Optional[int],
+        language: Optional[str],
+        reduce: bool
+    ) -> List[Tuple[str, str]]:
+        """Body of summarize_many (runs inside the model scope)."""
+        results = [("", "unknown")] * len(texts)
+        documents = [None if _is_blank(text) else Document.from_text(text) for text in texts]
+        groups = {}
+        for index, document in enumerate(documents):
+            if document is not None:
+                lang = self._resolve_language(document, language)
+                groups.setdefault(lang, []).append(index)
+        
+        for lang, indices in groups.items():
+            if self.engine == 'extractive':
+                for i in indices:
+                    results[i] = (self._extractive_summary(documents[i], lang, compression_level), lang)
+                continue
+            
+            # Serve what we can from the cache before loading the model
+            model_name = self.MODELS.get(lang, self.MODELS['en'])
+            params = self._generation_params(reduce)
+            pending = []
+            for i in indices:
+                key = make_key(documents[i].text, lang, compression_level, model_name, params)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    results[i] = (cached, lang)
                 else:
-                    result = self.summarizer_pipeline(
-                        text,
-                        max_length=max_length,
-                        min_length=min_length,
-                        do_sample=False
+                    pending.append((i, key))
+            if not pending:
+                continue
+            
+            self._load_model(lang)
+            if self.summarizer_pipeline is not None and self.model_name != model_name:
+                # A smaller variant is loaded: its summaries have their own keys
+                rekeyed = []
+                for i, _ in pending:
+                    key = make_key(documents[i].text, lang, compression_level, self.model_name, params)
+                    cached = self._cache_get(key)
+                    if cached is not None:
+                        results[i] = (cached, lang)
+                    else:
+                        rekeyed.append((i, key))
+                pending = rekeyed
+            group_texts = [documents[i] for i, _ in pending]
+            summaries = [''] * len(pending)
+            if pending and self.summarizer_pipeline is not None:
+                try:
+                    summaries = self._abstractive_summarize_many(
+                        group_texts, compression_level, reduce, batch_size
                     )
-                
-                if isinstance(result, list) and len(result) > 0:
-                    summary = result[0].get('summary_text', '')
-                    if summary:
-                        return summary, detected_lang
-            except Exception as e:
-                print(f"Error in transformer summarization: {e}. Falling back to simple method.")
+                except Exception as e:
+                    print(f"Error in transformer summarization: {e}. Falling back to simple method.")
+            
+            for (i, key), text, summary in zip(pending, group_texts, summaries):
+                if summary:
+                    self._cache_put(key, summary)
+                else:
+                    count('fallback')
+                    summary = self._extractive_summary(text, lang, compression_level)
+                results[i] = (summary, lang)
         
-        # Fallback to simple method
-        summary = self._simple_summarize(text, compression_level)
-        return summary, detected_lang
+        return results
     
-    def extract_key_points(self, text: str, num_points: int = 5) -> List[str]:
+    def summarize_iter(
+        self,
+        text: TextInput,
+        compression_level: float = 0.3,
+        language: str = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Summarize the input text section by section as summaries are produced.
+        
+        The text is split into the same paragraph-aligned chunks as
+        summarize(); each batch of chunks is summarized and yielded before
+        the next one is generated, so the first section is available long
+        before a large document is finished. No reduce pass runs, so the
+        joined sections equal summarize(..., reduce=False), and the result
+        is cached under that key. The extractive engine, cache hits and the
+        fallback yield the whole summary as a single section. The
+        'summarize' stage timing includes time spent by the caller between
+        sections.
+        
+        Args:
+            text: Input text or Document to summarize
+            compression_level: Compression level (0.2, 0.3, or 0.5)
+            language: Language code ('en', 'ru', 'de') or None for auto-detection
+            batch_size: Number of chunks generated before their sections are yielded
+        
+        Yields:
+            Tuples of (section_summary, detected_language) in document order
+        """
+        with timed('summarize'), self._model_scope():
+            if _is_blank(text):
+                return
+            
+            document = Document.from_text(text)
+            detected_lang = self._resolve_language(document, language)
+            if self.engine == 'extractive':
+                yield self._extractive_summary(document, detected_lang, compression_level), detected_lang
+                return
+            
+            model_name = self.MODELS.get(detected_lang, self.MODELS['en'])
+            key = make_key(
+                document.text, detected_lang, compression_level, model_name,
+                self._generation_params(False)
+            )
+            cached = self._cache_get(key)
+            if cached is not None:
+                yield cached, detected_lang
+                return
+            
+            self._load_model(detected_lang)
+            loaded_key = self._loaded_key(key, document.text, detected_lang, compression_level, False)
+            if loaded_key != key:
+                key = loaded_key
+                cached = self._cache_get(key)
+                if cached is not None:
+                    yield cached, detected_lang
+                    return
+            if self.summarizer_pipeline is None:
+                count('fallback')
+                yield self._extractive_summary(document, detected_lang, compression_level), detected_lang
+                return
+            
+            with timed('tokenize'):
+                chunks = chunk_paragraphs(document, self._max_input_tokens(), self._count_tokens)
+            batch_size = batch_size or self.BATCH_SIZE
+            sections = []
+            for start in range(0, len(chunks), batch_size):
+                batch = chunks[start:start + batch_size]
+                try:
+                    partials = self._summarize_chunks_cached(
+                        batch, [len(chunks) > 1] * len(batch), compression_level, batch_size
+                    )
+                except Exception as e:
+                    print(f"Error in transformer summarization: {e}. Falling back to simple method.")
+                    partials = None
+                if not partials or not any(partials):
+                    # Summarize the rest of the text extractively in one section
+                    count('fallback')
+                    rest = '\n\n'.join(chunk.text for chunk in chunks[start:])
+                    yield self._simple_summarize(rest, compression_level), detected_lang
+                    return
+                for partial in partials:
+                    if partial:
+                        sections.append(partial)
+                        yield partial, detected_lang
+            self._cache_put(key, ' '.join(sections))
+    
+    def extract_key_points(self, text: TextInput, num_points: int = 5) -> List[str]:
         """
         Extract key points from the text.
         
         Args:
-            text: Input text
+            text: Input text or Document
             num_points: Number of key points to extract
             
         Returns:
             List of key point sentences
         """
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        document = Document.from_text(text)
+        key = make_key(document.text, None, None, 'key_points', {'num_points': num_points})
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
-        if not sentences:
+        if not len(document):
             return []
         
-        # Simple heuristic: longer sentences often contain more information
-        # In a more sophisticated version, we could use TF-IDF or other methods
-        scored_sentences = [(len(s.split()), s) for s in sentences]
-        scored_sentences.sort(reverse=True)
-        
-        key_points = [s for _, s in scored_sentences[:num_points]]
+        # The most central, non-redundant sentences, in document order
+        key_points = document.sentences(rank_sentences(document, num_points))
+        self._cache_put(key, key_points)
         return key_points
+    
+    async def asummarize(
+        self,
+        text: TextInput,
+        compression_level: float = 0.3,
+        language: str = None,
+        reduce: bool = True,
+        timeout: Optional[float] = None
+    ) -> Tuple[str, str]:
+        """
+        Summarize without blocking the event loop.
+        
+        Segmentation, language detection and inference run in the executor.
+        At most ``model_concurrency`` inferences per model run at once; a
+        request cancelled or timed out while queued never starts, and one
+        cancelled while running keeps its model slot until the worker
+        thread finishes, so cores are never oversubscribed.
+        
+        Args:
+            text: Input text or Document to summarize
+            compression_level: Compression level (0.2, 0.3, or 0.5)
+            language: Language code ('en', 'ru', 'de') or None for auto-detection
+            reduce: Whether to re-summarize partial summaries of long documents
+            timeout: Seconds to wait for the result (None waits indefinitely)
+            
+        Returns:
+            Tuple of (summarized_text, detected_language)
+            
+        Raises:
+            asyncio.TimeoutError: If the result is not ready within ``timeout``
+        """
+        return await asyncio.wait_for(
+            self._asummarize(text, compression_level, language, reduce), timeout
+        )
+    
+    async def _asummarize(
+        self,
+        text: TextInput,
+        compression_level: float,
+        language: Optional[str],
+        reduce: bool
+    ) -> Tuple[str, str]:
+        """Body of asummarize without the timeout."""
+        if _is_blank(text):
+            return "", "unknown"
+        document, detected_lang = await self._offload(None, self._prepare, text, language)
+        if self.engine == 'extractive':
+            slot = self.EXTRACTIVE_METHOD
+        else:
+            slot = self.MODELS.get(detected_lang, self.MODELS['en'])
+        return await self._offload(
+            slot, self._in_worker, 'summarize', document, compression_level, detected_lang, reduce
+        )
+    
+    async def aextract_key_points(
+        self,
+        text: TextInput,
+        num_points: int = 5,
+        timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Extract key points without blocking the event loop.
+        
+        Args:
+            text: Input text or Document
+            num_points: Number of key points to extract
+            timeout: Seconds to wait for the result (None waits indefinitely)
+            
+        Returns:
+            List of key point sentences
+            
+        Raises:
+            asyncio.TimeoutError: If the result is not ready within ``timeout``
+        """
+        return await asyncio.wait_for(
+            self._offload(self.EXTRACTIVE_METHOD, self._in_worker, 'extract_key_points', text, num_points),
+            timeout
+        )
+    
+    def _prepare(self, text: TextInput, language: Optional[str]) -> Tuple[Document, str]:
+        """Segment a text and resolve its language (runs in the executor)."""
+        document = Document.from_text(text)
+        return document, self._resolve_language(document, language)
+    
+    def _in_worker(self, method: str, *args) -> Any:
+        """
+        Call a method on this thread's Summarizer.
+        
+        The sync API keeps the loaded pipeline on the instance, so every
+        executor thread gets its own Summarizer sharing the model pool and
+        cache with this one.
+        """
+        worker = getattr(self._local, 'summarizer', None)
+        if worker is None:
+            worker = type(self)(
+                language=self.language,
+                engine=self.engine,
+                backend=self.backend,
+                profile=self.profile.name,
+                model_dir=self.model_dir,
+                offline=self.offline,
+                cache_dir=self.cache_dir,
+                fallback_models=self.fallback_models,
+                model_pool=self.model_pool,
+                cache=self.cache
+            )
+            self._local.summarizer = worker
+        return getattr(worker, method)(*args)
+    
+    def _get_executor(self) -> Executor:
+        """Return the executor, creating the default thread pool on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._owns_executor = True
+                self._executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix='summarizer'
+                )
+            return self._executor
+    
+    def _semaphore(self, loop: asyncio.AbstractEventLoop, slot: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent work on a model in a loop."""
+        semaphores = self._semaphores.setdefault(loop, {})
+        if slot not in semaphores:
+            semaphores[slot] = asyncio.Semaphore(self.model_concurrency)
+        return semaphores[slot]
+    
+    async def _offload(self, slot: Optional[str], func: Callable, *args) -> Any:
+        """
+        Run a blocking call in the executor.
+        
+        Args:
+            slot: Model whose semaphore is held for the call (None for no limit)
+            func: Blocking callable
+            *args: Arguments for the callable
+            
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = None
+        if slot is not None:
+            semaphore = self._semaphore(loop, slot)
+            await semaphore.acquire()
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        if semaphore is not None:
+            # Release once the call has really finished (or was cancelled
+            # before starting), not when the awaiting coroutine gives up
+            future.add_done_callback(lambda _: _call_soon(loop, semaphore.release))
+        # Cancelling the wrapper cancels the call if it has not started yet
+        return await asyncio.wrap_future(future)
+    
+    def close(self):
+        """Shut down the executor created by the async API."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            executor.shutdown(wait=True)
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable):
+    """Schedule a callback on a loop from any thread, ignoring closed loops."""
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        pass
+
 
+def _is_blank(text: TextInput) -> bool:
+    """Check whether a text or Document has no content."""
+    if isinstance(text, Document):
+        text = text.text
+    return not text or not text.strip()
@@ -0,0 +1,32 @@
+"""
+Lightweight stand-ins for transformers objects used across the tests.
+"""
+
+
+class StubTokenizer:
+    """Whitespace tokenizer with a configurable model window."""
+    
+    def __init__(self, model_max_length=1024):
+        self.model_max_length = model_max_length
+    
+    def encode(self, text, add_special_tokens=True):
+        return text.split()
+
+
+class StubPipeline:
+    """
+    Summarization pipeline stub that keeps the first ``max_length`` words.
+    
+    Records every call so tests can check batching and generation arguments.
+    """
+    
+    def __init__(self, name='stub', model_max_length=1024):
+        self.name = name
+        self.tokenizer = StubTokenizer(model_max_length)
+        self.calls = []
+    
+    def __call__(self, inputs, **kwargs):
+        self.calls.append((inputs, kwargs))
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        max_length = kwargs.get('max_new_tokens', kwargs.get('max_length', 1024))
+        return [{'summary_text': ' '.join(t.split()[:max_length])} for t in texts]
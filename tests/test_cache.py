@@ -0,0 +1,218 @@
+"""
+Tests for the persistent summary and extraction caches.
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+import pytest
+
+from src.cache import ExtractionCache, SummaryCache, make_key
+from src.file_processor import FileProcessor
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+
+def _write_entries(cache_dir, worker, count):
+    """Write entries from a separate process."""
+    cache = SummaryCache(cache_dir)
+    for i in range(count):
+        cache.put(f"{worker}-{i}", f"value {worker} {i}")
+    cache.close()
+
+
+@pytest.fixture(params=['summaries', 'extractions'])
+def open_cache(request, tmp_path):
+    """Open either cache behind a common put(name, text) / get(name) interface."""
+    def source(name):
+        path = tmp_path / f"{name}.pdf"
+        if not path.exists():
+            path.write_bytes(name.encode('utf-8'))
+        return path
+    
+    def open_cache(**kwargs):
+        if request.param == 'summaries':
+            cache = SummaryCache(tmp_path / "cache", **kwargs)
+            return cache, cache.put, cache.get
+        cache = ExtractionCache(tmp_path / "cache", **kwargs)
+        return (
+            cache,
+            lambda name, text: cache.put(source(name), text),
+            lambda name: cache.get(source(name))
+        )
+    
+    return open_cache
+
+
+class TestLRUCache:
+    """Test cases shared by SummaryCache and ExtractionCache."""
+    
+    def test_round_trip(self, open_cache):
+        """Test storing and loading values."""
+        cache, put, get = open_cache()
+        assert get('missing') is None
+        put('k', 'Привет, world')
+        assert get('k') == 'Привет, world'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+        cache.close()
+        
+        reopened, _, get = open_cache()
+        assert get('k') == 'Привет, world'
+        reopened.close()
+    
+    def test_lru_eviction(self, open_cache):
+        """Test that the least recently used entries are evicted."""
+        cache, put, get = open_cache()
+        put('a', 'x' * 8)
+        # Room for two entries of this size, not three
+        cache.max_bytes = cache.stats()['bytes'] * 5 // 2
+        put('b', 'x' * 8)
+        get('a')
+        put('c', 'x' * 8)
+        assert get('a') is not None
+        assert get('c') is not None
+        assert get('b') is None
+        assert cache.stats()['evictions'] == 1
+        cache.close()
+    
+    def test_clear(self, open_cache):
+        """Test that clear removes every entry."""
+        cache, put, get = open_cache()
+        put('a', 'text')
+        cache.clear()
+        assert get('a') is None
+        assert cache.stats()['entries'] == 0
+        cache.close()
+
+
+class TestSummaryCache:
+    """Test cases for SummaryCache."""
+    
+    def test_key_normalizes_whitespace(self):
+        """Test that formatting-only changes share a key."""
+        assert make_key("a  b\nc", 'en', 0.3, 'm') == make_key("a b c", 'en', 0.3, 'm')
+    
+    def test_key_depends_on_parameters(self):
+        """Test that every parameter is part of the key."""
+        base = make_key("text", 'en', 0.3, 'm', {'reduce': True})
+        assert base != make_key("text", 'ru', 0.3, 'm', {'reduce': True})
+        assert base != make_key("text", 'en', 0.5, 'm', {'reduce': True})
+        assert base != make_key("text", 'en', 0.3, 'other', {'reduce': True})
+        assert base != make_key("text", 'en', 0.3, 'm', {'reduce': False})
+    
+    def test_concurrent_processes(self):
+        """Test that several processes can write to one cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            SummaryCache(cache_dir).close()
+            workers = [
+                multiprocessing.Process(target=_write_entries, args=(cache_dir, w, 20))
+                for w in range(3)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+                assert worker.exitcode == 0
+            cache = SummaryCache(cache_dir)
+            assert cache.stats()['entries'] == 60
+            cache.close()
+    
+    def test_summarizer_uses_cache(self):
+        """Test that cached summaries skip model work."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pipeline = StubPipeline()
+            summarizer = Summarizer(
+                language='en',
+                model_pool=ModelPool(lambda name: pipeline),
+                cache=SummaryCache(cache_dir)
+            )
+            text = "Caching avoids repeated work. " * 10
+            first, _ = summarizer.summarize(text, 0.3)
+            second, _ = summarizer.summarize(text, 0.3)
+            assert first == second
+            assert len(pipeline.calls) == 1
+            assert summarizer.model_stats()['misses'] == 1
+            assert summarizer.model_stats()['hits'] == 0
+            
+            points = summarizer.extract_key_points(text, 3)
+            assert summarizer.extract_key_points(text, 3) == points
+            summarizer.cache.close()
+
+
+class TestExtractionCache:
+    """Test cases for ExtractionCache."""
+    
+    def _source(self, tmp_path, name="notes.pdf", content=b"original"):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return path
+    
+    def test_roundtrip_is_compressed(self, tmp_path):
+        """Test that stored text comes back intact and takes less space."""
+        source = self._source(tmp_path)
+        cache = ExtractionCache(tmp_path / "cache")
+        text = "Лекция о сортировке. " * 500
+        assert cache.get(source) is None
+        cache.put(source, text)
+        assert cache.get(source) == text
+        stats = cache.stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+        assert stats['bytes_saved'] == source.stat().st_size
+        assert stats['bytes'] < stats['text_bytes'] / 10
+        cache.close()
+    
+    def test_page_ranges_are_separate_entries(self, tmp_path):
+        """Test that the page range is part of the key."""
+        source = self._source(tmp_path)
+        cache = ExtractionCache(tmp_path / "cache")
+        cache.put(source, "pages 1-2", (1, 2))
+        assert cache.get(source) is None
+        assert cache.get(source, (1, 2)) == "pages 1-2"
+        cache.close()
+    
+    def test_modified_file_is_invalidated(self, tmp_path):
+        """Test that a changed size or mtime drops the entry."""
+        source = self._source(tmp_path)
+        cache = ExtractionCache(tmp_path / "cache")
+        cache.put(source, "old text")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cache.get(source) is None
+        assert cache.stats()['invalidations'] == 1
+        assert cache.stats()['entries'] == 0
+        cache.close()
+    
+    def test_content_hash_survives_touch_and_rename(self, tmp_path):
+        """Test that content-keyed entries ignore mtime and path."""
+        source = self._source(tmp_path)
+        cache = ExtractionCache(tmp_path / "cache", content_hash=True)
+        cache.put(source, "text")
+        moved = source.rename(tmp_path / "renamed.pdf")
+        os.utime(moved)
+        assert cache.get(moved) == "text"
+        moved.write_bytes(b"changed")
+        assert cache.get(moved) is None
+        cache.close()
+    
+    def test_read_file_skips_parsing_when_cached(self, tmp_path, monkeypatch):
+        """Test that FileProcessor reuses extracted text of unchanged files."""
+        docx = pytest.importorskip('docx')
+        document = docx.Document()
+        document.add_paragraph("Cached paragraph.")
+        path = tmp_path / "lecture.docx"
+        document.save(str(path))
+        cache = ExtractionCache(tmp_path / "cache")
+        text = FileProcessor.read_file(path, cache=cache)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed again")
+        
+        monkeypatch.setattr(FileProcessor, 'read_docx', staticmethod(fail))
+        assert FileProcessor.read_file(path, cache=cache) == text
+        results = list(FileProcessor.iter_read([path], workers=1, cache=cache))
+        assert results == [(path, text, None)]
+        assert cache.stats()['hits'] == 2
+        cache.close()
@@ -0,0 +1,282 @@
+"""
+Tests for token-aware chunking and long-document summarization.
+"""
+
+from click.testing import CliRunner
+
+from src.cache import SummaryCache
+from src.chunking import chunk_paragraphs, chunk_text, split_sentences, split_paragraphs
+from src.cli import main
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+
+def _lecture(paragraphs=20, sentences=10):
+    """Build a synthetic multi-paragraph lecture."""
+    return '\n\n'.join(
+        ' '.join(f"Paragraph {p} sentence {s} explains one more idea." for s in range(sentences))
+        for p in range(paragraphs)
+    )
+
+
+class TestChunking:
+    """Test cases for chunk_text."""
+    
+    def test_split_helpers(self):
+        """Test paragraph and sentence splitting."""
+        text = "First one. Second one!\n\nThird one? Fourth"
+        assert split_paragraphs(text) == ["First one. Second one!", "Third one? Fourth"]
+        assert split_sentences("First one. Second one!") == ["First one.", "Second one!"]
+    
+    def test_chunks_fit_window(self):
+        """Test that every chunk fits the token window."""
+        chunks = chunk_text(_lecture(), max_tokens=50)
+        assert len(chunks) > 1
+        assert all(c.tokens <= 50 for c in chunks)
+        assert all(c.tokens == len(c.text.split()) for c in chunks)
+    
+    def test_chunks_preserve_text(self):
+        """Test that chunking neither drops nor duplicates words."""
+        text = _lecture()
+        chunks = chunk_text(text, max_tokens=64)
+        assert ' '.join(c.text for c in chunks).split() == text.split()
+    
+    def test_chunks_break_on_sentences(self):
+        """Test that chunks end on sentence boundaries."""
+        for chunk in chunk_text(_lecture(), max_tokens=40):
+            assert chunk.text.endswith('.')
+    
+    def test_oversized_sentence_is_split(self):
+        """Test that a sentence longer than the window is broken up."""
+        text = ' '.join(['word'] * 25) + '.'
+        chunks = chunk_text(text, max_tokens=10)
+        assert len(chunks) == 3
+        assert all(c.tokens <= 10 for c in chunks)
+
+
+class TestParagraphChunking:
+    """Test cases for chunk_paragraphs."""
+    
+    def test_chunks_hold_whole_paragraphs(self):
+        """Test that chunks fit the window and never split a paragraph."""
+        text = _lecture(30, 5)
+        paragraphs = split_paragraphs(text)
+        chunks = chunk_paragraphs(text, max_tokens=200)
+        assert all(c.tokens <= 200 for c in chunks)
+        assert [p for c in chunks for p in c.text.split('\n\n')] == paragraphs
+    
+    def test_oversized_paragraph_is_split(self):
+        """Test that a paragraph longer than the window is chunked on its own."""
+        text = _lecture(1, 30) + '\n\nShort closing paragraph.'
+        chunks = chunk_paragraphs(text, max_tokens=50)
+        assert all(c.tokens <= 50 for c in chunks)
+        assert chunks[-1].text == 'Short closing paragraph.'
+    
+    def test_edit_changes_few_chunks(self):
+        """Test that editing one paragraph leaves distant chunks untouched."""
+        text = _lecture(60, 5)
+        edited = text.replace("Paragraph 30 sentence 2", "Paragraph 30 sentence two, rewritten")
+        before = {c.text for c in chunk_paragraphs(text, max_tokens=200)}
+        after = [c.text for c in chunk_paragraphs(edited, max_tokens=200)]
+        changed = [c for c in after if c not in before]
+        assert 1 <= len(changed) <= 3
+        assert len(after) > 10
+
+
+class TestIncrementalSummarization:
+    """Test cases for chunk-level caching of long documents."""
+    
+    def test_only_changed_chunks_are_regenerated(self, tmp_path):
+        """Test that re-submitting an edited document reuses chunk summaries."""
+        pipeline = StubPipeline(model_max_length=208)
+        summarizer = Summarizer(
+            language='en', model_pool=ModelPool(lambda name: pipeline), cache=SummaryCache(tmp_path)
+        )
+        text = _lecture(60, 5)
+        summarizer.summarize(text, 0.3)
+        first = summarizer.chunk_stats()
+        assert first['hits'] == 0 and first['misses'] > 10
+        
+        pipeline.calls.clear()
+        edited = text.replace("Paragraph 30 sentence 2", "Paragraph 30 sentence two, rewritten")
+        summary, _ = summarizer.summarize(edited, 0.3, reduce=False)
+        map_inputs = [item for batch, _ in pipeline.calls for item in batch]
+        assert summary
+        assert 1 <= len(map_inputs) <= 3
+        assert any("two, rewritten" in item for item in map_inputs)
+        stats = summarizer.chunk_stats()
+        assert stats['misses'] - first['misses'] == len(map_inputs)
+        assert stats['hits'] >= first['misses'] - 3
+    
+    def test_incremental_result_equals_fresh_run(self, tmp_path):
+        """Test that cached chunk summaries do not depend on the chunks they were batched with."""
+        def lecture(extra):
+            return '\n\n'.join(
+                ' '.join(f"Paragraph {p} sentence {s} explains one more idea." for s in range(n))
+                for p, n in enumerate(3 + (p * 7) % 9 + (extra if p == 5 else 0) for p in range(30))
+            )
+        
+        def summarizer(cache=None):
+            pipeline = StubPipeline(model_max_length=108)
+            return Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline), cache=cache)
+        
+        incremental = summarizer(SummaryCache(tmp_path))
+        incremental.summarize(lecture(0), 0.3, reduce=False)
+        edited = lecture(4)
+        summary, _ = incremental.summarize(edited, 0.3, reduce=False)
+        assert incremental.chunk_stats()['hits'] > 0
+        assert summary == summarizer().summarize(edited, 0.3, reduce=False)[0]
+    
+    def test_no_cache_no_chunk_stats(self):
+        """Test that chunk caching is off without a cache."""
+        pipeline = StubPipeline(model_max_length=208)
+        summarizer = Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline))
+        summarizer.summarize(_lecture(20, 5), 0.3)
+        assert summarizer.chunk_stats()['hits'] == 0
+        assert summarizer.chunk_stats()['misses'] == 0
+
+
+class TestLongDocumentSummarization:
+    """Test cases for map-reduce summarization."""
+    
+    def _summarizer(self, pipeline):
+        return Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline))
+    
+    def test_short_text_single_call(self):
+        """Test that text within the window is summarized in one call."""
+        pipeline = StubPipeline(model_max_length=1024)
+        summarizer = self._summarizer(pipeline)
+        summary, _ = summarizer.summarize(_lecture(2, 5), 0.3)
+        assert len(pipeline.calls) == 1
+        assert summary
+    
+    def test_long_text_is_chunked_and_batched(self):
+        """Test that long text is covered by batched chunk calls."""
+        pipeline = StubPipeline(model_max_length=108)
+        summarizer = self._summarizer(pipeline)
+        text = _lecture(40, 10)
+        summary, _ = summarizer.summarize(text, 0.3, reduce=False)
+        inputs = [item for batch, _ in pipeline.calls for item in batch]
+        assert sorted(' '.join(inputs).split()) == sorted(text.split())
+        assert all(len(batch) <= Summarizer.BATCH_SIZE for batch, _ in pipeline.calls)
+        assert all(kwargs['batch_size'] == len(batch) for batch, kwargs in pipeline.calls)
+        assert all(len(item.split()) <= 100 for item in inputs)
+    
+    def test_compression_respected_end_to_end(self):
+        """Test that the summary length tracks the compression ratio."""
+        pipeline = StubPipeline(model_max_length=108)
+        summarizer = self._summarizer(pipeline)
+        text = _lecture(40, 10)
+        summary, _ = summarizer.summarize(text, 0.2)
+        ratio = len(summary.split()) / len(text.split())
+        assert 0.1 <= ratio <= 0.2 * Summarizer.REDUCE_TOLERANCE
+    
+    def test_max_length_uses_tokens(self):
+        """Test that generation limits come from token counts."""
+        pipeline = StubPipeline()
+        summarizer = self._summarizer(pipeline)
+        text = _lecture(1, 10)
+        summarizer.summarize(text, 0.5)
+        _, kwargs = pipeline.calls[0]
+        assert kwargs['max_new_tokens'] == int(len(text.split()) * 0.5)
+        assert kwargs['truncation'] is True
+
+
+class TestStreamingSummarization:
+    """Test cases for section-by-section summarization."""
+    
+    def test_sections_arrive_before_the_document_is_done(self):
+        """Test that the first section is yielded after the first batch."""
+        pipeline = StubPipeline(model_max_length=108)
+        summarizer = Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline))
+        sections = summarizer.summarize_iter(_lecture(40, 10), 0.3, batch_size=2)
+        section, language = next(sections)
+        assert section and language == 'en'
+        assert len(pipeline.calls) == 1
+        rest = list(sections)
+        assert len(rest) >= 5
+        assert len(pipeline.calls) == 1 + len(rest) // 2
+    
+    def test_sections_match_unreduced_summary(self, tmp_path):
+        """Test that joined sections equal summarize(reduce=False) and are cached."""
+        pipeline = StubPipeline(model_max_length=108)
+        summarizer = Summarizer(
+            language='en', model_pool=ModelPool(lambda name: pipeline), cache=SummaryCache(tmp_path)
+        )
+        text = _lecture(40, 10)
+        streamed = ' '.join(section for section, _ in summarizer.summarize_iter(text, 0.3))
+        
+        pipeline.calls.clear()
+        summary, _ = summarizer.summarize(text, 0.3, reduce=False)
+        assert summary == streamed
+        assert not pipeline.calls
+        assert [s for s, _ in summarizer.summarize_iter(text, 0.3)] == [streamed]
+    
+    def test_blank_and_extractive(self):
+        """Test that blank input yields nothing and the extractive engine one section."""
+        summarizer = Summarizer(language='en', engine='extractive')
+        assert list(summarizer.summarize_iter("   ")) == []
+        sections = list(summarizer.summarize_iter(_lecture(5, 5), 0.3))
+        assert len(sections) == 1
+        assert sections[0][0] == summarizer.summarize(_lecture(5, 5), 0.3)[0]
+    
+    def test_failure_falls_back_for_the_rest(self):
+        """Test that a failing batch falls back to an extractive section."""
+        class FlakyPipeline(StubPipeline):
+            def __call__(self, inputs, **kwargs):
+                if self.calls:
+                    raise RuntimeError("out of memory")
+                return super().__call__(inputs, **kwargs)
+        
+        pipeline = FlakyPipeline(model_max_length=108)
+        summarizer = Summarizer(language='en', model_pool=ModelPool(lambda name: pipeline))
+        sections = list(summarizer.summarize_iter(_lecture(40, 10), 0.3, batch_size=2))
+        assert len(sections) == 3
+        assert all(section for section, _ in sections)
+    
+    def test_cli_streams_to_output_file(self, tmp_path):
+        """Test that the CLI writes the streamed summary and key points."""
+        source = tmp_path / "lecture.txt"
+        source.write_text(_lecture(5, 5), encoding='utf-8')
+        target = tmp_path / "out" / "summary.txt"
+        result = CliRunner().invoke(main, [
+            '-i', str(source), '-o', str(target), '-e', 'extractive', '-l', 'en', '--no-cache', '-k'
+        ])
+        assert result.exit_code == 0, result.output
+        written = target.read_text(encoding='utf-8')
+        assert written.startswith("SUMMARY:\n")
+        assert "KEY POINTS:" in written
+        assert "Detected language: en" in result.output
+    
+    def test_cli_keeps_compression_unless_streaming(self, tmp_path, monkeypatch):
+        """Test that the CLI reduces long inputs to the target and only --stream skips the reduce pass."""
+        from src import backends
+        
+        class VerbosePipeline(StubPipeline):
+            """Overshoots every length limit by ten words, like real models often do."""
+            
+            def __call__(self, inputs, **kwargs):
+                kwargs['max_new_tokens'] += 10
+                return super().__call__(inputs, **kwargs)
+        
+        monkeypatch.setitem(
+            backends.BACKENDS, 'torch',
+            lambda name, device, local_files_only, cache_dir: VerbosePipeline(model_max_length=108)
+        )
+        source = tmp_path / "lecture.txt"
+        text = _lecture(40, 10)
+        source.write_text(text, encoding='utf-8')
+        
+        def summary_words(*options):
+            target = tmp_path / "summary.txt"
+            result = CliRunner().invoke(main, [
+                '-i', str(source), '-o', str(target), '-l', 'en', '-c', '20', '--no-cache', *options
+            ])
+            assert result.exit_code == 0, result.output
+            written = target.read_text(encoding='utf-8')
+            return len(written[len("SUMMARY:\n") + 51:].split())
+        
+        words = len(text.split())
+        assert summary_words() <= words * 0.2 * Summarizer.REDUCE_TOLERANCE
+        assert summary_words('--stream') > words * 0.2 * Summarizer.REDUCE_TOLERANCE
@@ -0,0 +1,74 @@
+"""
+Tests for the shared Document representation.
+"""
+
+from unittest import mock
+
+import src.language
+import src.summarizer
+from src.document import Document
+from src.summarizer import Summarizer
+
+
+class TestDocument:
+    """Test cases for Document."""
+    
+    TEXT = (
+        "First sentence here. Second one!\n"
+        "Still the first paragraph?\n\n"
+        "  Second paragraph starts.   Version 2.0 is out.\n\n\n"
+        "Trailing text without punctuation  \n"
+    )
+    
+    def test_sentence_offsets(self):
+        """Test that sentences are stored as offsets into the text."""
+        document = Document(self.TEXT)
+        assert document.sentences() == [
+            "First sentence here.",
+            "Second one!",
+            "Still the first paragraph?",
+            "Second paragraph starts.",
+            "Version 2.0 is out.",
+            "Trailing text without punctuation",
+        ]
+        start, end = document.sentence_starts[1], document.sentence_ends[1]
+        assert self.TEXT[start:end] == "Second one!"
+    
+    def test_paragraphs(self):
+        """Test paragraph grouping of sentences."""
+        document = Document(self.TEXT)
+        assert list(document.iter_paragraphs()) == [[0, 1, 2], [3, 4], [5]]
+        assert document.paragraph_count == 3
+    
+    def test_word_counts(self):
+        """Test per-sentence and total word counts."""
+        document = Document(self.TEXT)
+        assert document.word_counts.tolist() == [3, 2, 4, 3, 4, 4]
+        assert document.word_count == 20
+    
+    def test_empty_text(self):
+        """Test that blank text has no sentences."""
+        document = Document("   \n\n  ")
+        assert len(document) == 0
+        assert list(document.iter_paragraphs()) == []
+    
+    def test_from_text_reuses_document(self):
+        """Test that an existing Document is passed through."""
+        document = Document("Some text.")
+        assert Document.from_text(document) is document
+        assert Document.from_text("Some text.").text == "Some text."
+    
+    def test_language_detected_once(self):
+        """Test that the Summarizer stores the detected language on the document."""
+        summarizer = Summarizer(engine='extractive')
+        document = Document("The model is trained on the data. It is evaluated on the test set.")
+        with mock.patch.object(
+            src.summarizer, 'detect_language', wraps=src.language.detect_language
+        ) as detect:
+            summary, lang = summarizer.summarize(document, 0.5)
+            summarizer.detect_language(document)
+            points = summarizer.extract_key_points(document, num_points=1)
+        assert lang == 'en'
+        assert document.language == 'en'
+        assert detect.call_count == 1
+        assert summary and points
@@ -0,0 +1,78 @@
+"""
+Tests for the TF-IDF/TextRank extractive engine.
+"""
+
+import random
+import time
+
+import numpy as np
+
+from src.extractive import build_tfidf, rank_sentences, textrank_scores
+from src.summarizer import Summarizer
+
+
+class TestExtractive:
+    """Test cases for the extractive engine."""
+    
+    def test_tfidf_rows_are_normalized(self):
+        """Test that every non-empty sentence vector has unit norm."""
+        matrix = build_tfidf(["Neural networks learn", "Networks of neurons", "Learning rates"])
+        norms = np.sqrt(np.bincount(matrix.rows, weights=matrix.weights ** 2))
+        assert np.allclose(norms, 1.0)
+    
+    def test_central_sentence_ranks_highest(self):
+        """Test that the sentence sharing most vocabulary is most central."""
+        sentences = [
+            "Neural networks learn representations from data.",
+            "Gradient descent trains neural networks on data.",
+            "Bananas are yellow.",
+            "Neural networks use gradient descent to learn from data.",
+        ]
+        scores = textrank_scores(build_tfidf(sentences))
+        assert np.isclose(scores.sum(), 1.0)
+        assert scores.argmax() == 3
+        assert scores.argmin() == 2
+    
+    def test_output_in_document_order(self):
+        """Test that selected indices are in original order."""
+        sentences = [f"Sentence {i} about topic {i % 3} and learning." for i in range(30)]
+        selected = rank_sentences(sentences, 10)
+        assert selected == sorted(selected)
+        assert len(selected) == 10
+    
+    def test_redundancy_suppression(self):
+        """Test that duplicated sentences are not selected twice."""
+        sentences = [
+            "Supervised learning uses labeled examples.",
+            "Supervised learning uses labeled examples.",
+            "Unsupervised learning finds structure in unlabeled data.",
+            "Reinforcement learning optimizes rewards through interaction.",
+        ]
+        selected = rank_sentences(sentences, 2)
+        assert selected != [0, 1]
+        assert rank_sentences(sentences, 2, redundancy_threshold=None) == [0, 1]
+    
+    def test_large_document_is_fast(self):
+        """Test that tens of thousands of sentences rank in about a second."""
+        rng = random.Random(0)
+        vocabulary = [f"term{i}" for i in range(5000)] + ["the", "and", "of"] * 200
+        sentences = [' '.join(rng.choice(vocabulary) for _ in range(15)) + '.' for _ in range(20000)]
+        start = time.perf_counter()
+        selected = rank_sentences(sentences, 100)
+        assert time.perf_counter() - start < 2.0
+        assert len(selected) == 100
+    
+    def test_summarizer_fallback_uses_engine(self):
+        """Test that extractive summaries are not just the leading sentences."""
+        summarizer = Summarizer(language='en', engine='extractive')
+        text = (
+            "Welcome to the course. "
+            "Neural networks learn from data. "
+            "Neural networks use gradient descent to learn from data. "
+            "Gradient descent updates neural network weights from data. "
+            "See you next week."
+        )
+        summary, _ = summarizer.summarize(text, compression_level=0.2)
+        assert summary == "Neural networks use gradient descent to learn from data."
+        points = summarizer.extract_key_points(text, num_points=2)
+        assert "Welcome to the course." not in points
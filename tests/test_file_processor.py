@@ -4,6 +4,7 @@ Tests for the FileProcessor class.
 
 import pytest
 import tempfile
+import codecs
 import os
 from pathlib import Path
 from src.file_processor import FileProcessor
@@ -39,6 +40,22 @@ class TestFileProcessor:
         finally:
             os.unlink(temp_path)
     
+    def test_aread_file(self):
+        """Test reading a file from a coroutine through a process pool."""
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write("Async content.")
+            temp_path = f.name
+        
+        try:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                content = asyncio.run(FileProcessor.aread_file(temp_path, executor=executor))
+            assert content == "Async content."
+        finally:
+            os.unlink(temp_path)
+    
     def test_file_not_found(self):
         """Test handling of non-existent files."""
         processor = FileProcessor()
@@ -64,3 +81,202 @@ class TestFileProcessor:
         finally:
             os.unlink(temp_path)
 
+    
+    def test_iter_read_preserves_order(self):
+        """Test prefetching reads yield files in input order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i in range(12):
+                path = Path(tmp) / f"file_{i}.txt"
+                path.write_text(f"Content of file {i}", encoding='utf-8')
+                paths.append(path)
+            
+            results = list(FileProcessor.iter_read(paths, workers=3, prefetch=4))
+            assert [p for p, _, _ in results] == paths
+            for i, (_, text, error) in enumerate(results):
+                assert error is None
+                assert text == f"Content of file {i}"
+    
+    def test_iter_read_reports_errors(self):
+        """Test that a failing file does not stop the iteration."""
+        with tempfile.TemporaryDirectory() as tmp:
+            good = Path(tmp) / "good.txt"
+            good.write_text("fine", encoding='utf-8')
+            missing = Path(tmp) / "missing.txt"
+            
+            results = list(FileProcessor.iter_read([missing, good], workers=2))
+            assert isinstance(results[0][2], FileNotFoundError)
+            assert results[1][1] == "fine"
+
+
+def _write_pdf(path, pages):
+    """Write a minimal PDF with one line of text per page."""
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            ' '.join(f"{4 + 2 * i} 0 R" for i in range(len(pages))), len(pages)
+        ),
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    
+    body = b"%PDF-1.4\n"
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode('latin-1')
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    for offset in offsets:
+        body += f"{offset:010d} 00000 n \n".encode('latin-1')
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode('latin-1')
+    Path(path).write_bytes(body)
+
+
+class TestPdfExtraction:
+    """Test cases for streaming PDF extraction."""
+    
+    @pytest.fixture
+    def pdf_path(self, tmp_path):
+        pytest.importorskip('PyPDF2')
+        path = tmp_path / "book.pdf"
+        _write_pdf(path, [f"Page number {i}" for i in range(1, 11)])
+        return str(path)
+    
+    def test_iter_pdf_pages(self, pdf_path):
+        """Test that pages are yielded in order."""
+        pages = list(FileProcessor.iter_pdf_pages(pdf_path))
+        assert len(pages) == 10
+        assert "Page number 1" in pages[0]
+        assert "Page number 10" in pages[9]
+    
+    def test_page_range(self, pdf_path):
+        """Test extracting a 1-based inclusive page range."""
+        pages = list(FileProcessor.iter_pdf_pages(pdf_path, page_range=(3, 5)))
+        assert len(pages) == 3
+        assert "Page number 3" in pages[0]
+        assert "Page number 5" in pages[2]
+        text = FileProcessor.read_file(pdf_path, page_range=(9, 20))
+        assert "Page number 9" in text and "Page number 10" in text
+        assert "Page number 8" not in text
+    
+    def test_invalid_page_range(self, pdf_path):
+        """Test that an inverted page range is rejected."""
+        with pytest.raises(ValueError):
+            list(FileProcessor.iter_pdf_pages(pdf_path, page_range=(5, 2)))
+    
+    def test_parallel_matches_serial(self, pdf_path):
+        """Test that process-pool extraction returns the same text."""
+        serial = FileProcessor.read_pdf(pdf_path)
+        parallel = FileProcessor.read_pdf(pdf_path, workers=2)
+        assert FileProcessor.read_pdf(pdf_path, workers=3) == serial
+        assert parallel == serial
+        pages = list(FileProcessor.iter_pdf_pages(pdf_path, workers=2, pages_per_task=3))
+        assert len(pages) == 10
+
+
+class TestDocxExtraction:
+    """Test cases for streaming DOCX extraction."""
+    
+    @pytest.fixture
+    def docx_path(self, tmp_path):
+        docx = pytest.importorskip('docx')
+        document = docx.Document()
+        document.add_paragraph("Introduction to the course.")
+        paragraph = document.add_paragraph("Mixed ")
+        run = paragraph.add_run("runs")
+        run.add_tab()
+        run.add_text("with a tab")
+        run.add_break()
+        paragraph.add_run("and a line break.")
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Week"
+        table.cell(0, 1).text = "Topic"
+        table.cell(1, 1).text = "Recursion"
+        document.add_paragraph("Conclusion.")
+        path = tmp_path / "course.docx"
+        document.save(str(path))
+        return str(path)
+    
+    def test_paragraphs_match_python_docx(self, docx_path):
+        """Test that body paragraphs render like python-docx's paragraph text."""
+        from docx import Document
+        expected = [p.text for p in Document(docx_path).paragraphs]
+        paragraphs = list(FileProcessor.iter_docx_paragraphs(docx_path))
+        assert [p for p in paragraphs if p in expected] == expected
+        assert expected[1] == "Mixed runs\twith a tab\nand a line break."
+    
+    def test_table_cells_in_document_order(self, docx_path):
+        """Test that table cell text is extracted between the surrounding paragraphs."""
+        text = FileProcessor.read_file(docx_path)
+        lines = text.split('\n')
+        assert lines.index("Week") < lines.index("Topic") < lines.index("Recursion")
+        assert text.index("line break.") < text.index("Week")
+        assert text.index("Recursion") < text.index("Conclusion.")
+    
+    def test_invalid_docx(self, tmp_path):
+        """Test that a file that is not a Word document is rejected."""
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip archive")
+        with pytest.raises(ValueError):
+            FileProcessor.read_docx(str(path))
+
+
+class TestTextDecoding:
+    """Test cases for encoding detection and single-pass decoding."""
+    
+    RUSSIAN = "Машинное обучение изучает алгоритмы, которые учатся на данных. " * 50
+    GERMAN = "Maschinelles Lernen für Anfänger und Fortgeschrittene, schön erklärt. " * 50
+    
+    @pytest.mark.parametrize('encoding', ['utf-8', 'cp1251', 'koi8-r'])
+    def test_russian_encodings(self, tmp_path, encoding):
+        """Test that Cyrillic lecture notes decode correctly."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(self.RUSSIAN.encode(encoding))
+        assert FileProcessor.read_text_file(str(path)) == self.RUSSIAN
+    
+    def test_sniff_encodings(self):
+        """Test detection of BOMs and Western text."""
+        from src.encoding import sniff_encoding
+        assert sniff_encoding(codecs.BOM_UTF8 + b"abc") == 'utf-8-sig'
+        assert sniff_encoding("abc".encode('utf-16')) == 'utf-16'
+        assert sniff_encoding(self.GERMAN.encode('cp1252')) == 'cp1252'
+        assert sniff_encoding(self.GERMAN.encode('utf-8')) == 'utf-8'
+    
+    def test_bom_is_stripped(self, tmp_path):
+        """Test that a UTF-8 BOM does not leak into the text."""
+        path = tmp_path / "bom.txt"
+        path.write_bytes(codecs.BOM_UTF8 + "Hello".encode('utf-8'))
+        assert FileProcessor.read_text_file(str(path)) == "Hello"
+    
+    def test_invalid_byte_at_end(self, tmp_path):
+        """Test that a stray byte at the end does not mangle the text."""
+        path = tmp_path / "stray.txt"
+        path.write_bytes(self.RUSSIAN.encode('utf-8') * 10 + b"\xff")
+        text = FileProcessor.read_text_file(str(path))
+        assert text.startswith(self.RUSSIAN)
+        assert text.endswith('�')
+    
+    def test_large_file_is_memory_mapped(self, tmp_path, monkeypatch):
+        """Test the memory-mapped path and the streaming decoder."""
+        import src.encoding
+        monkeypatch.setattr(src.encoding, 'MMAP_THRESHOLD', 1024)
+        path = tmp_path / "large.txt"
+        path.write_bytes(self.RUSSIAN.encode('cp1251') * 20)
+        assert FileProcessor.read_text_file(str(path)) == self.RUSSIAN * 20
+        pieces = list(src.encoding.iter_text(str(path), chunk_size=1000))
+        assert len(pieces) > 1
+        assert ''.join(pieces) == self.RUSSIAN * 20
+    
+    def test_streaming_splits_multibyte_characters(self, tmp_path):
+        """Test that chunk boundaries inside UTF-8 characters are handled."""
+        path = tmp_path / "utf8.txt"
+        path.write_bytes(self.RUSSIAN.encode('utf-8'))
+        pieces = list(FileProcessor.iter_text_file(str(path), encoding='utf-8'))
+        assert ''.join(pieces) == self.RUSSIAN
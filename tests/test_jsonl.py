@@ -0,0 +1,144 @@
+"""
+Tests for the streaming JSONL pipeline.
+"""
+
+import json
+import threading
+import time
+
+from click.testing import CliRunner
+
+from src.cli import main
+from src.jsonl import run_records
+from src.summarizer import Summarizer
+
+TEXT = "Sorting algorithms order data. Merge sort splits the input. Quick sort picks a pivot."
+
+
+def _extractive():
+    return Summarizer(language='en', engine='extractive')
+
+
+def _lines(count, **fields):
+    return [json.dumps(dict({'id': i, 'text': TEXT}, **fields)) for i in range(count)]
+
+
+class TestRunRecords:
+    """Test cases for run_records."""
+    
+    def test_ordered_output_with_inline_errors(self):
+        """Test that results keep input order and failures carry line numbers."""
+        lines = _lines(6)
+        lines[2] = 'not json'
+        lines[4] = json.dumps({'id': 'empty', 'text': '   '})
+        results = list(run_records(lines, _extractive, workers=3, window=2))
+        assert [ok for ok, _ in results] == [True, True, False, True, False, True]
+        assert [r['id'] for ok, r in results if ok] == [0, 1, 3, 5]
+        errors = [r for ok, r in results if not ok]
+        assert errors[0]['line'] == 3 and errors[0]['id'] is None
+        assert errors[1] == {'id': 'empty', 'line': 5, 'error': 'Input text is empty'}
+    
+    def test_unordered_returns_every_record(self):
+        """Test that unordered mode yields each record once."""
+        results = list(run_records(_lines(20), _extractive, workers=4, window=3, ordered=False))
+        assert sorted(r['id'] for _, r in results) == list(range(20))
+    
+    def test_factory_failure_is_a_record_error(self):
+        """Test that a Summarizer that cannot be built fails the records, not the run."""
+        def factory():
+            raise OSError("model not found")
+        
+        results = list(run_records(_lines(3), factory, workers=2))
+        assert [ok for ok, _ in results] == [False, False, False]
+        assert results[0][1] == {'id': 0, 'line': 1, 'error': 'model not found'}
+    
+    def test_window_bounds_read_ahead(self):
+        """Test that input is consumed at most ``window`` records ahead of the output."""
+        consumed = []
+        
+        def lines():
+            for line in _lines(30):
+                consumed.append(line)
+                yield line
+        
+        for ordered in (True, False):
+            consumed.clear()
+            for produced, _ in enumerate(run_records(lines(), _extractive, workers=2, window=4,
+                                                     ordered=ordered), 1):
+                assert len(consumed) - produced < 4
+    
+    def test_workers_run_concurrently_with_own_summarizers(self):
+        """Test that each worker thread gets its own Summarizer."""
+        created = []
+        active = [0, 0]
+        lock = threading.Lock()
+        
+        class SlowSummarizer(Summarizer):
+            def summarize(self, *args, **kwargs):
+                with lock:
+                    active[0] += 1
+                    active[1] = max(active[1], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+                return super().summarize(*args, **kwargs)
+        
+        def factory():
+            created.append(threading.get_ident())
+            return SlowSummarizer(language='en', engine='extractive')
+        
+        list(run_records(_lines(12), factory, workers=3))
+        assert len(created) == len(set(created)) <= 3
+        assert active[1] > 1
+    
+    def test_record_fields_override_defaults(self, tmp_path):
+        """Test per-record path, compression, language and key points."""
+        source = tmp_path / "lecture.txt"
+        source.write_text(TEXT, encoding='utf-8')
+        lines = [
+            json.dumps({'id': 'a', 'path': str(source), 'compression': 0.5, 'key_points': 2}),
+            json.dumps({'id': 'b', 'text': TEXT, 'language': 'de'}),
+            json.dumps({'id': 'c', 'text': TEXT, 'compression': 30}),
+        ]
+        results = list(run_records(lines, _extractive, compression_level=0.2))
+        (_, a), (_, b), (ok, c) = results
+        assert len(a['key_points']) == 2
+        assert b['language'] == 'de'
+        assert not ok and 'ratio' in c['error']
+
+
+class TestJsonlCommand:
+    """Test cases for the jsonl CLI command."""
+    
+    def test_worker_summarizers_reuse_the_shared_cache(self, tmp_path, monkeypatch):
+        """Test that only the shared Summarizer opens a cache database."""
+        import src.cli
+        opened = []
+        
+        class CountingCache(src.cli.SummaryCache):
+            def __init__(self, *args, **kwargs):
+                opened.append(self)
+                super().__init__(*args, **kwargs)
+        
+        monkeypatch.setattr(src.cli, 'SummaryCache', CountingCache)
+        result = CliRunner().invoke(main, [
+            'jsonl', '-e', 'extractive', '-l', 'en', '--cache-dir', str(tmp_path), '-w', '3'
+        ], input='\n'.join(_lines(6)) + '\n')
+        assert result.exit_code == 0
+        assert len(opened) == 1
+        opened[0].close()
+    
+    def test_streams_records_and_errors(self, tmp_path):
+        """Test that failures go to the error file without aborting the run."""
+        errors = tmp_path / "errors.jsonl"
+        lines = _lines(3)
+        lines.insert(1, json.dumps({'id': 'bad'}))
+        result = CliRunner().invoke(main, [
+            'jsonl', '-e', 'extractive', '-l', 'en', '--no-cache', '-w', '2', '--unordered',
+            '--errors', str(errors)
+        ], input='\n'.join(lines) + '\n')
+        assert result.exit_code == 1
+        output = [json.loads(line) for line in result.stdout.splitlines() if line.startswith('{')]
+        assert sorted(r['id'] for r in output) == [0, 1, 2]
+        failure = json.loads(errors.read_text(encoding='utf-8'))
+        assert failure['id'] == 'bad' and failure['line'] == 2
@@ -0,0 +1,57 @@
+"""
+Tests for sampled, script-aware language detection.
+"""
+
+from unittest import mock
+
+import src.language
+from src.language import detect_language, sample_text
+
+
+class TestLanguageDetection:
+    """Test cases for detect_language."""
+    
+    def test_sample_is_bounded(self):
+        """Test that long texts are reduced to a bounded sample."""
+        text = "word " * 100000
+        sample = sample_text(text)
+        assert len(sample) <= src.language.SAMPLE_CHARS
+        assert sample_text("short text") == "short text"
+    
+    def test_sample_covers_whole_text(self):
+        """Test that the sample includes the start and the end."""
+        text = "beginning " + "middle " * 5000 + "ending"
+        sample = sample_text(text)
+        assert sample.startswith("beginning")
+        assert sample.endswith("ending")
+    
+    def test_cyrillic_shortcut(self):
+        """Test that Cyrillic text is decided without langdetect."""
+        with mock.patch.object(src.language, '_langdetect_language') as fallback:
+            assert detect_language("Привет, это текст о машинном обучении.") == 'ru'
+            fallback.assert_not_called()
+    
+    def test_stopword_shortcut(self):
+        """Test that clear English/German text skips langdetect."""
+        with mock.patch.object(src.language, '_langdetect_language') as fallback:
+            assert detect_language("The model is trained on the data and it works.") == 'en'
+            assert detect_language("Das Modell wird mit den Daten trainiert und ist gut.") == 'de'
+            fallback.assert_not_called()
+    
+    def test_ambiguous_text_uses_langdetect(self):
+        """Test that ambiguous samples fall back to langdetect."""
+        with mock.patch.object(src.language, '_langdetect_language', return_value='de') as fallback:
+            assert detect_language("Quantenmechanik Thermodynamik Elektrodynamik") == 'de'
+            fallback.assert_called_once()
+    
+    def test_deterministic_and_memoized(self):
+        """Test that repeated calls agree and hit the memo."""
+        text = "Machine Learning Algorithmen Daten Modelle " * 3
+        first = detect_language(text)
+        with mock.patch.object(src.language, '_langdetect_language') as fallback:
+            assert detect_language(text) == first
+            fallback.assert_not_called()
+    
+    def test_empty_text_defaults_to_english(self):
+        """Test the default for text without letters."""
+        assert detect_language("12345 !!!") == 'en'
@@ -0,0 +1,96 @@
+"""
+Tests for per-stage metrics instrumentation.
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+from src import metrics
+from src.cli import main
+from src.file_processor import FileProcessor
+from src.metrics import Metrics
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+TEXT = "The heart pumps blood through the body. Arteries carry blood away from it. " * 5
+
+
+@pytest.fixture
+def collector():
+    """Install a Metrics collector for the duration of a test."""
+    collector = Metrics()
+    previous = metrics.set_hook(collector)
+    yield collector
+    metrics.set_hook(previous)
+
+
+class TestMetrics:
+    """Test cases for the metrics hook and collector."""
+    
+    def test_disabled_is_noop(self):
+        """Test that instrumentation does nothing without a hook."""
+        assert metrics.get_hook() is None
+        assert metrics.timed('a') is metrics.timed('b')
+        metrics.count('event')
+    
+    def test_summarize_stages(self, collector):
+        """Test that summarize reports every stage and model cache events."""
+        summarizer = Summarizer(model_pool=ModelPool(StubPipeline))
+        summarizer.summarize(TEXT, 0.5)
+        summarizer.summarize(TEXT, 0.3)
+        snapshot = collector.snapshot()
+        for stage in ('summarize', 'detect', 'model_load', 'tokenize', 'generate'):
+            assert snapshot['stages'][stage]['count'] >= 1
+        assert snapshot['stages']['summarize']['count'] == 2
+        assert snapshot['events']['model_miss'] == 1
+        assert snapshot['events']['model_hit'] == 1
+    
+    def test_fallback_counted(self, collector):
+        """Test that model load failures and fallbacks are counted."""
+        def failing_loader(name):
+            raise OSError("no model")
+        
+        summarizer = Summarizer(language='en', model_pool=ModelPool(failing_loader))
+        summary, _ = summarizer.summarize(TEXT, 0.3)
+        assert summary
+        snapshot = collector.snapshot()
+        assert snapshot['events']['model_load_failure'] == 1
+        assert snapshot['events']['fallback'] == 1
+        assert snapshot['stages']['extractive']['count'] == 1
+    
+    def test_read_file_stage(self, collector, tmp_path):
+        """Test that file reads are timed per format."""
+        path = tmp_path / "notes.txt"
+        path.write_text(TEXT, encoding='utf-8')
+        FileProcessor.read_file(path)
+        assert collector.snapshot()['stages']['read.txt']['count'] == 1
+    
+    def test_prometheus_format(self):
+        """Test the Prometheus text exposition output."""
+        collector = Metrics()
+        collector.observe('generate', 0.5)
+        collector.observe('generate', 1.5)
+        collector.increment('cache_hit', 3)
+        text = collector.to_prometheus()
+        assert 'edu_summarizer_stage_seconds_sum{stage="generate"} 2.000000' in text
+        assert 'edu_summarizer_stage_seconds_count{stage="generate"} 2' in text
+        assert 'edu_summarizer_stage_seconds_max{stage="generate"} 1.500000' in text
+        assert 'edu_summarizer_events_total{event="cache_hit"} 3' in text
+        assert text.endswith('\n')
+    
+    def test_cli_metrics_json(self, tmp_path):
+        """Test that --metrics-json writes a snapshot."""
+        source = tmp_path / "lecture.txt"
+        source.write_text(TEXT, encoding='utf-8')
+        report = tmp_path / "metrics.json"
+        result = CliRunner().invoke(main, [
+            '-i', str(source), '-e', 'extractive', '-l', 'en', '--no-cache',
+            '--metrics-json', str(report)
+        ])
+        assert result.exit_code == 0, result.output
+        snapshot = json.loads(report.read_text(encoding='utf-8'))
+        assert 'read.txt' in snapshot['stages']
+        assert 'summarize' in snapshot['stages']
+        assert metrics.get_hook() is None
@@ -0,0 +1,341 @@
+"""
+Tests for the ModelPool class.
+"""
+
+import threading
+import time
+
+import pytest
+from src.model_pool import ModelBudgetError, ModelPool, ModelUnavailableError, estimate_pipeline_bytes
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+
+class FakeTensor:
+    """Tensor stand-in with the size methods used by estimate_pipeline_bytes."""
+    
+    def __init__(self, numel, element_size):
+        self._numel = numel
+        self._element_size = element_size
+    
+    def numel(self):
+        return self._numel
+    
+    def element_size(self):
+        return self._element_size
+    
+    def data_ptr(self):
+        return id(self)
+
+
+class TestModelPool:
+    """Test cases for ModelPool."""
+    
+    def test_hit_and_miss_counters(self):
+        """Test that repeated requests are served from the pool."""
+        pool = ModelPool(StubPipeline, max_models=2)
+        first = pool.get('a')
+        second = pool.get('a')
+        assert first is second
+        stats = pool.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['loads'] == 1
+        assert stats['load_time'] >= 0.0
+    
+    def test_lru_eviction_by_count(self):
+        """Test that the least recently used model is evicted."""
+        pool = ModelPool(StubPipeline, max_models=2)
+        pool.get('a')
+        pool.get('b')
+        pool.get('a')
+        pool.get('c')
+        assert 'a' in pool
+        assert 'c' in pool
+        assert 'b' not in pool
+        assert pool.stats()['evictions'] == 1
+    
+    def test_eviction_by_memory_budget(self):
+        """Test that the memory budget limits resident models."""
+        pool = ModelPool(StubPipeline, max_models=10, max_memory_bytes=150,
+                         size_estimator=lambda p: 100)
+        pool.get('a')
+        pool.get('b')
+        assert len(pool) == 1
+        assert 'b' in pool
+        assert pool.resident_bytes == 100
+    
+    def test_zero_backoff_retries_every_time(self):
+        """Test that without a backoff every get() calls the loader again and propagates its error."""
+        attempts = []
+        
+        def failing_loader(name):
+            attempts.append(name)
+            raise OSError("no weights")
+        
+        pool = ModelPool(failing_loader, failure_backoff=0)
+        for _ in range(2):
+            with pytest.raises(OSError):
+                pool.get('a')
+        assert 'a' not in pool
+        assert attempts == ['a', 'a']
+        stats = pool.stats()
+        assert stats['load_failures'] == 2
+        assert stats['skipped_loads'] == 0
+    
+    def test_failed_load_backs_off(self):
+        """Test that failed models are retried only after a doubling backoff."""
+        now = [0.0]
+        attempts = []
+        
+        def flaky_loader(name):
+            attempts.append(name)
+            if len(attempts) < 3:
+                raise OSError("no network")
+            return StubPipeline(name)
+        
+        pool = ModelPool(flaky_loader, failure_backoff=10, max_failure_backoff=15, clock=lambda: now[0])
+        with pytest.raises(OSError):
+            pool.get('a')
+        with pytest.raises(ModelUnavailableError) as info:
+            pool.get('a')
+        assert 'no network' in str(info.value)
+        assert pool.stats()['unavailable'] == {'a': 10.0}
+        
+        now[0] = 10.0
+        with pytest.raises(OSError):
+            pool.get('a')
+        now[0] = 24.0
+        with pytest.raises(ModelUnavailableError):
+            pool.get('a')
+        now[0] = 25.0
+        assert pool.get('a') is pool.get('a')
+        stats = pool.stats()
+        assert len(attempts) == 3
+        assert stats['load_failures'] == 2
+        assert stats['skipped_loads'] == 2
+        assert stats['unavailable'] == {}
+    
+    def test_forget_failures(self):
+        """Test that forgetting a failure allows an immediate retry."""
+        attempts = []
+        
+        def failing_loader(name):
+            attempts.append(name)
+            raise OSError("missing weights")
+        
+        pool = ModelPool(failing_loader)
+        for _ in range(3):
+            with pytest.raises(Exception):
+                pool.get('a')
+        pool.forget_failures('a')
+        with pytest.raises(OSError):
+            pool.get('a')
+        assert attempts == ['a', 'a']
+    
+    def test_budget_refuses_model_before_loading(self):
+        """Test that a model whose expected size exceeds the budget is never loaded."""
+        loaded = []
+        pool = ModelPool(lambda name: loaded.append(name) or StubPipeline(name), max_memory_bytes=150,
+                         size_estimator=lambda p: 100, size_hint=lambda name: 200 if name == 'big' else None)
+        with pytest.raises(ModelBudgetError):
+            pool.get('big')
+        assert loaded == []
+        assert pool.stats()['budget_rejections'] == 1
+    
+    def test_budget_makes_room_before_loading(self):
+        """Test that resident models are evicted before, not after, a new load."""
+        resident_during_load = []
+        
+        def loader(name):
+            resident_during_load.append(list(pool.stats()['resident']))
+            return StubPipeline(name)
+        
+        pool = ModelPool(loader, max_models=10, max_memory_bytes=150,
+                         size_estimator=lambda p: 100, size_hint=lambda name: 100)
+        pool.get('a')
+        pool.get('b')
+        assert resident_during_load == [[], []]
+        stats = pool.stats()
+        assert stats['model_bytes'] == {'b': 100}
+        assert stats['budget_bytes'] == 150
+    
+    def test_measurement_never_lowers_the_hint(self):
+        """Test that a failed (0) or smaller measurement does not replace the expected size."""
+        pool = ModelPool(StubPipeline, max_models=10, max_memory_bytes=150,
+                         size_estimator=lambda p: 0, size_hint=lambda name: 100)
+        pool.get('a')
+        assert pool.resident_bytes == 100
+        pool.get('b')
+        assert pool.stats()['resident'] == ['b']
+        
+        pool = ModelPool(StubPipeline, max_memory_bytes=150,
+                         size_estimator=lambda p: 50 if p.name == 'a' else 300,
+                         size_hint=lambda name: 100)
+        pool.get('a')
+        assert pool.stats()['model_bytes'] == {'a': 100}
+        with pytest.raises(ModelBudgetError):
+            pool.get('b')
+    
+    def test_estimate_counts_packed_int8_weights(self):
+        """Test that quantized weights kept in packed tuples are measured, and shared tensors once."""
+        shared = FakeTensor(100, 4)
+        
+        class QuantizedModel:
+            def state_dict(self):
+                return {
+                    'embed.weight': shared,
+                    'lm_head.weight': shared,
+                    'linear._packed_params._packed_params': (FakeTensor(1000, 1), FakeTensor(10, 4)),
+                }
+        
+        pipeline = StubPipeline()
+        pipeline.model = QuantizedModel()
+        assert estimate_pipeline_bytes(pipeline) == 400 + 1000 + 40
+    
+    def test_estimate_onnx_model_from_files(self, tmp_path):
+        """Test that ONNX Runtime models are measured by the size of their ONNX files."""
+        (tmp_path / 'encoder_model.onnx').write_bytes(b'x' * 300)
+        (tmp_path / 'decoder_model.onnx_data').write_bytes(b'x' * 200)
+        (tmp_path / 'config.json').write_bytes(b'{}')
+        
+        class ORTModel:
+            model_save_dir = tmp_path
+        
+        pipeline = StubPipeline()
+        pipeline.model = ORTModel()
+        assert estimate_pipeline_bytes(pipeline) == 500
+    
+    def test_oversized_model_dropped_and_remembered(self):
+        """Test that a model measured over budget is dropped and not loaded again."""
+        loaded = []
+        pool = ModelPool(lambda name: loaded.append(name) or StubPipeline(name),
+                         max_memory_bytes=150, size_estimator=lambda p: 200)
+        for _ in range(3):
+            with pytest.raises(ModelBudgetError):
+                pool.get('a')
+        assert loaded == ['a']
+        assert 'a' not in pool
+    
+    def test_idle_models_unloaded(self):
+        """Test that models unused for idle_ttl seconds are unloaded."""
+        now = [0.0]
+        pool = ModelPool(StubPipeline, max_models=3, idle_ttl=10, reap_interval=0, clock=lambda: now[0])
+        pool.get('a')
+        now[0] = 5.0
+        pool.get('b')
+        now[0] = 12.0
+        pool.get('b')
+        assert pool.stats()['resident'] == ['b']
+        now[0] = 21.0
+        assert pool.unload_idle() == 0
+        now[0] = 22.0
+        assert pool.unload_idle() == 1
+        assert len(pool) == 0
+        assert pool.stats()['idle_unloads'] == 2
+    
+    def test_background_sweep_unloads_idle_models(self):
+        """Test that idle models are unloaded without further requests."""
+        pool = ModelPool(StubPipeline, idle_ttl=0.05, reap_interval=0.01)
+        pool.get('a')
+        deadline = time.monotonic() + 2.0
+        while 'a' in pool and time.monotonic() < deadline:
+            time.sleep(0.01)
+        pool.close()
+        assert 'a' not in pool
+    
+    def test_hits_not_blocked_by_slow_load(self):
+        """Test that a resident model is served while another model is loading."""
+        started, release = threading.Event(), threading.Event()
+        
+        def loader(name):
+            if name == 'slow':
+                started.set()
+                release.wait(5.0)
+            return StubPipeline(name)
+        
+        pool = ModelPool(loader, max_models=2)
+        fast = pool.get('fast')
+        loading = threading.Thread(target=pool.get, args=('slow',))
+        loading.start()
+        assert started.wait(5.0)
+        assert pool.get('fast') is fast
+        assert not release.is_set()
+        release.set()
+        loading.join()
+        assert 'slow' in pool
+    
+    def test_concurrent_requests_load_once(self):
+        """Test that threads requesting a model being loaded wait for that load."""
+        loads = []
+        started, release = threading.Event(), threading.Event()
+        
+        def loader(name):
+            loads.append(name)
+            started.set()
+            release.wait(5.0)
+            return StubPipeline(name)
+        
+        pool = ModelPool(loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(pool.get('a'))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5.0)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert loads == ['a']
+        assert len(results) == 4 and all(r is results[0] for r in results)
+        assert pool.stats()['misses'] == 1
+    
+    def test_waiters_see_failed_load(self):
+        """Test that threads waiting on a failing load get the backoff error, not a second load."""
+        attempts = []
+        started, release = threading.Event(), threading.Event()
+        
+        def loader(name):
+            attempts.append(name)
+            started.set()
+            release.wait(5.0)
+            raise OSError("no weights")
+        
+        pool = ModelPool(loader)
+        errors = []
+        
+        def request():
+            try:
+                pool.get('a')
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=request) for _ in range(3)]
+        threads[0].start()
+        assert started.wait(5.0)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert attempts == ['a']
+        assert sorted(type(e).__name__ for e in errors) == ['ModelUnavailableError', 'ModelUnavailableError', 'OSError']
+    
+    def test_invalid_max_models(self):
+        """Test that the pool needs room for at least one model."""
+        with pytest.raises(ValueError):
+            ModelPool(StubPipeline, max_models=0)
+    
+    def test_summarizer_mixed_languages_load_once(self):
+        """Test that a mixed-language batch loads each model only once."""
+        pool = ModelPool(StubPipeline, max_models=3)
+        summarizer = Summarizer(model_pool=pool)
+        text = "Some text to summarize. It has two sentences."
+        for lang in ['en', 'ru', 'de', 'en', 'ru', 'de']:
+            summary, detected = summarizer.summarize(text, 0.5, language=lang)
+            assert detected == lang
+            assert summary
+        stats = summarizer.model_stats()
+        assert stats['loads'] == 3
+        assert stats['hits'] == 3
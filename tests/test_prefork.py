@@ -0,0 +1,160 @@
+"""
+Tests for the pre-fork worker pool.
+"""
+
+import multiprocessing
+import os
+import pickle
+import threading
+
+import pytest
+from src.model_pool import ModelPool
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+pytestmark = pytest.mark.skipif(
+    'fork' not in multiprocessing.get_all_start_methods(), reason="requires fork()"
+)
+
+TEXT = "Rivers shape valleys over time. Glaciers carve deeper valleys. Wind moves fine sand. " * 3
+
+
+def _worker_info(summarizer):
+    return os.getpid(), os.environ.get('OMP_NUM_THREADS'), summarizer.model_stats()['loads']
+
+
+def _generation_threads(summarizer):
+    """Thread count torch is set to while generating with a 4-thread profile."""
+    import sys
+    import types
+    from src.profiles import get_profile, inference_context
+    
+    class FakeTorch(types.ModuleType):
+        threads = 16
+        
+        def get_num_threads(self):
+            return self.threads
+        
+        def set_num_threads(self, threads):
+            self.threads = threads
+    
+    torch = sys.modules['torch'] = FakeTorch('torch')
+    with inference_context(get_profile('fast')._replace(threads=4, inference_mode=False)):
+        return torch.threads
+
+
+def _fail(summarizer, message):
+    raise ValueError(message)
+
+
+def _fail_on(summarizer, message):
+    if message == "boom":
+        raise ValueError(message)
+    return message
+
+
+class TwoArgError(Exception):
+    """Exception that pickles but cannot be unpickled (its args don't match __init__)."""
+    
+    def __init__(self, a, b):
+        super().__init__(f"{a} {b}")
+
+
+def _raise_unloadable(summarizer, value):
+    if value == "bad":
+        raise TwoArgError(value, "exception")
+    return value
+
+
+def _return_lock(summarizer, value):
+    return threading.Lock() if value == "bad" else value
+
+
+def _exit(summarizer):
+    os._exit(1)
+
+
+@pytest.fixture
+def pool():
+    from src.prefork import PreforkPool
+    loads = []
+    
+    def loader(name):
+        loads.append(name)
+        return StubPipeline(name)
+    
+    summarizer = Summarizer(language='en', model_pool=ModelPool(loader))
+    pool = PreforkPool(summarizer, workers=2, threads_per_worker=1, languages=['en'])
+    pool.loads = loads
+    yield pool
+    pool.close()
+
+
+class TestPreforkPool:
+    """Test cases for PreforkPool."""
+    
+    def test_results_in_input_order(self, pool):
+        """Test that summaries come back in input order with key points."""
+        texts = [f"Document {i} is about topic {i}. " + TEXT for i in range(6)]
+        results = pool.summarize_many(texts, 0.5, key_points=2)
+        assert len(results) == 6
+        for i, (summary, lang, points) in enumerate(results):
+            assert lang == 'en'
+            assert f"Document {i} " in summary
+            assert len(points) == 2
+    
+    def test_workers_inherit_loaded_model(self, pool):
+        """Test that the model is loaded once, before forking, and threads are pinned."""
+        assert pool.loads == [Summarizer.MODELS['en']]
+        infos = pool.map(_worker_info, [()] * 8)
+        assert {pid for pid, _, _ in infos} <= {p.pid for p in pool._processes}
+        assert all(threads == '1' for _, threads, _ in infos)
+        # Workers reuse the inherited pipeline instead of loading their own
+        assert all(loads == 1 for _, _, loads in infos)
+    
+    def test_profile_threads_respect_worker_pin(self, pool):
+        """Test that a profile's thread setting does not undo the worker's pin."""
+        assert pool.map(_generation_threads, [()] * 4) == [1] * 4
+    
+    def test_errors_propagate(self, pool):
+        """Test that an exception in a worker is raised in the caller."""
+        with pytest.raises(ValueError, match="boom"):
+            pool.map(_fail, [("boom",)])
+        assert pool.summarize_many([TEXT], 0.5)[0][0]
+    
+    def test_return_errors_keeps_successful_results(self, pool):
+        """Test that one failing task does not discard the results of the others."""
+        outcomes = pool.map(_fail_on, [("ok",), ("boom",), ("fine",)], return_errors=True)
+        assert outcomes[0] == (True, "ok") and outcomes[2] == (True, "fine")
+        ok, error = outcomes[1]
+        assert not ok and isinstance(error, ValueError)
+    
+    def test_memory_stats(self, pool):
+        """Test that per-process memory is reported."""
+        stats = pool.memory_stats()
+        assert len(stats['workers']) == 2
+        if stats['parent']:
+            assert stats['total_pss'] <= stats['total_rss']
+    
+    def test_unpicklable_outcomes_become_errors(self, pool):
+        """Test that results or exceptions that can't cross processes fail only their task."""
+        for func in (_raise_unloadable, _return_lock):
+            outcomes = pool.map(func, [("a",), ("bad",), ("c",)], return_errors=True)
+            assert outcomes[0] == (True, "a") and outcomes[2] == (True, "c")
+            ok, error = outcomes[1]
+            assert not ok and isinstance(error, RuntimeError)
+        assert pool.broken is None
+        assert pool.map(_fail_on, [("next",)]) == ["next"]
+    
+    def test_stale_results_are_discarded(self, pool):
+        """Test that results left over from an interrupted call are not attributed to a new one."""
+        pool._results.put((-1, pickle.dumps((True, "stale"))))
+        assert pool.map(_fail_on, [("a",), ("b",)]) == ["a", "b"]
+    
+    def test_dead_worker_breaks_pool(self, pool):
+        """Test that after a worker dies the pool refuses further work instead of mixing up results."""
+        with pytest.raises(RuntimeError, match="exited unexpectedly"):
+            pool.map(_exit, [()])
+        assert pool.broken is not None
+        with pytest.raises(RuntimeError, match="broken"):
+            pool.map(_fail_on, [("a",)])
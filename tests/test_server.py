@@ -0,0 +1,171 @@
+"""
+Tests for the summarization server and its micro-batcher.
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import wait
+
+import pytest
+from src.model_pool import ModelPool
+from src.server import MicroBatcher, create_server
+from src.summarizer import Summarizer
+from tests.stubs import StubPipeline
+
+TEXT = ("Photosynthesis converts light energy into chemical energy. "
+        "Plants use chlorophyll to capture sunlight. "
+        "Oxygen is released as a by-product of the process. ") * 5
+
+
+@pytest.fixture
+def pipeline():
+    """Stub pipeline shared by every worker."""
+    return StubPipeline()
+
+
+@pytest.fixture
+def batcher(pipeline):
+    """Batcher whose summarizers share a stub-backed model pool."""
+    pool = ModelPool(lambda name: pipeline)
+    batcher = MicroBatcher(
+        lambda: Summarizer(language='en', model_pool=pool),
+        max_batch_size=4,
+        max_wait=0.05
+    )
+    yield batcher
+    batcher.close()
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher."""
+    
+    def test_concurrent_requests_are_coalesced(self, batcher, pipeline):
+        """Test that requests arriving together share pipeline calls."""
+        futures = [batcher.submit(TEXT, 0.3, 'en') for _ in range(8)]
+        wait(futures, timeout=10)
+        results = [f.result() for f in futures]
+        assert all(r['language'] == 'en' and r['summary'] for r in results)
+        stats = batcher.stats()
+        assert stats['completed'] == 8
+        assert stats['batches'] < 8
+        assert stats['max_batch_size'] <= 4
+        assert len(pipeline.calls) == stats['batches']
+    
+    def test_groups_by_compression(self, batcher):
+        """Test that different compression levels are never mixed in a batch."""
+        futures = [batcher.submit(TEXT, level, 'en') for level in (0.2, 0.5, 0.2, 0.5)]
+        wait(futures, timeout=10)
+        assert batcher.stats()['batches'] == 2
+    
+    def test_key_points(self, batcher):
+        """Test that key points are returned on request."""
+        result = batcher.submit(TEXT, 0.3, 'en', key_points=2).result(timeout=10)
+        assert len(result['key_points']) == 2
+    
+    def test_key_point_failure_affects_only_its_request(self, pipeline):
+        """Test that a failing post-processing step fails one request and keeps the worker running."""
+        class FlakySummarizer(Summarizer):
+            def extract_key_points(self, text, num_points=5):
+                if num_points == 3:
+                    raise ValueError("bad request")
+                return super().extract_key_points(text, num_points)
+        
+        pool = ModelPool(lambda name: pipeline)
+        batcher = MicroBatcher(lambda: FlakySummarizer(language='en', model_pool=pool),
+                               max_batch_size=4, max_wait=0.05)
+        try:
+            futures = [batcher.submit(TEXT, 0.3, 'en', key_points=n) for n in (2, 3, 2)]
+            wait(futures, timeout=10)
+            assert len(futures[0].result(timeout=0)['key_points']) == 2
+            with pytest.raises(ValueError):
+                futures[1].result(timeout=0)
+            assert len(futures[2].result(timeout=0)['key_points']) == 2
+            assert batcher.submit(TEXT, 0.3, 'en').result(timeout=10)['summary']
+            stats = batcher.stats()
+            assert stats['errors'] == 1
+            assert stats['completed'] == 3
+        finally:
+            batcher.close()
+    
+    def test_close_drains_queue(self, pipeline):
+        """Test that queued requests finish before the workers stop."""
+        pool = ModelPool(lambda name: pipeline)
+        batcher = MicroBatcher(lambda: Summarizer(language='en', model_pool=pool), max_wait=10)
+        future = batcher.submit(TEXT, 0.3, 'en')
+        batcher.close()
+        assert future.result(timeout=0)['summary']
+        with pytest.raises(RuntimeError):
+            batcher.submit(TEXT)
+    
+    def test_warm_up_loads_models(self, batcher):
+        """Test that warm-up makes the first request a pool hit."""
+        batcher.warm_up(['en'])
+        batcher.submit(TEXT, 0.3, 'en').result(timeout=10)
+        assert batcher.stats()['models']['loads'] == 1
+        assert batcher.stats()['models']['hits'] >= 1
+
+
+class TestHttpServer:
+    """Test cases for the HTTP front end."""
+    
+    @pytest.fixture
+    def url(self, batcher):
+        server = create_server(batcher, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f'http://127.0.0.1:{server.server_port}'
+        server.shutdown()
+        server.server_close()
+    
+    def _get(self, url):
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return json.loads(response.read())
+    
+    def test_health(self, url):
+        """Test the health endpoint."""
+        assert self._get(url + '/health') == {'status': 'ok'}
+    
+    def test_summarize_and_metrics(self, url):
+        """Test a summarization round trip and the metrics it produces."""
+        body = json.dumps({'text': TEXT, 'language': 'en', 'key_points': 1}).encode('utf-8')
+        request = urllib.request.Request(url + '/summarize', data=body, method='POST')
+        with urllib.request.urlopen(request, timeout=10) as response:
+            result = json.loads(response.read())
+        assert result['summary']
+        assert len(result['key_points']) == 1
+        metrics = self._get(url + '/metrics')
+        assert metrics['completed'] == 1
+        assert metrics['queue_depth'] == 0
+    
+    def test_prometheus_metrics(self, url):
+        """Test the Prometheus exposition endpoint."""
+        with urllib.request.urlopen(url + '/metrics/prometheus', timeout=10) as response:
+            text = response.read().decode('utf-8')
+            assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'edu_summarizer_server_queue_depth 0' in text
+    
+    def test_invalid_request(self, url):
+        """Test that malformed payloads are rejected."""
+        request = urllib.request.Request(url + '/summarize', data=b'{}', method='POST')
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=10)
+        assert error.value.code == 400
+    
+    @pytest.mark.parametrize('payload, message', [
+        ({'text': 123}, "'text' must be a non-empty string"),
+        ({'text': ["x"]}, "'text' must be a non-empty string"),
+        ({'text': "   "}, "'text' must be a non-empty string"),
+        ({'text': TEXT, 'compression': 7}, "'compression' must be greater than 0 and at most 1"),
+        ({'text': TEXT, 'compression': 0}, "'compression' must be greater than 0 and at most 1"),
+        ({'text': TEXT, 'language': ['en']}, "'language' must be a string"),
+    ])
+    def test_invalid_fields_rejected(self, url, payload, message):
+        """Test that wrongly typed or out-of-range fields get a 400 with the reason."""
+        body = json.dumps(payload).encode('utf-8')
+        request = urllib.request.Request(url + '/summarize', data=body, method='POST')
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=10)
+        assert error.value.code == 400
+        assert message in json.loads(error.value.read())['error']
@@ -0,0 +1,68 @@
+"""
+Startup-time regression tests for the CLI import path.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Cumulative import budget for ``src.cli`` in microseconds. Importing the CLI
+# loads click and numpy (for documents and the extractive engine) but never
+# torch or transformers; anything close to this budget means a model
+# framework slipped back onto the import path.
+IMPORT_BUDGET_US = 1_500_000
+
+HEAVY_MODULES = ('torch', 'transformers')
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _import_times(module: str) -> dict:
+    """Run ``python -X importtime`` and return cumulative times per module."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = [p.strip() for p in line[len('import time:'):].split('|')]
+        try:
+            times[parts[2]] = int(parts[1])
+        except ValueError:
+            # Header line
+            continue
+    return times
+
+
+class TestStartup:
+    """Test cases for CLI import cost."""
+    
+    def test_cli_does_not_import_heavy_modules(self):
+        """Importing the CLI must not pull in torch or transformers."""
+        times = _import_times('src.cli')
+        imported = {name.split('.')[0] for name in times}
+        for heavy in HEAVY_MODULES:
+            assert heavy not in imported
+    
+    def test_cli_import_within_budget(self):
+        """Cumulative import time of the CLI stays within budget."""
+        times = _import_times('src.cli')
+        assert 'src.cli' in times
+        assert times['src.cli'] < IMPORT_BUDGET_US
+    
+    def test_extractive_engine_does_not_import_torch(self):
+        """The extractive engine summarizes without loading torch."""
+        code = (
+            "import sys\n"
+            "from src.summarizer import Summarizer\n"
+            "s = Summarizer(language='en', engine='extractive')\n"
+            "summary, _ = s.summarize('One sentence. Two sentence. Three sentence.', 0.5)\n"
+            "assert summary\n"
+            "assert 'torch' not in sys.modules and 'transformers' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, check=True)
@@ -114,4 +114,363 @@ class TestSummarizer:
         text = "This is an English text for automatic language detection."
         summary, lang = summarizer.summarize(text, compression_level=0.3)
         assert lang in ['en', 'ru', 'de']  # Should detect a language
+    
+    def test_extractive_engine(self):
+        """Test that the extractive engine never loads a model."""
+        summarizer = Summarizer(language='en', engine='extractive')
+        text = "First sentence here. Second sentence here. Third sentence here. Fourth one."
+        summary, lang = summarizer.summarize(text, compression_level=0.5)
+        assert lang == 'en'
+        assert len(summary) > 0
+        assert summarizer.summarizer_pipeline is None
+    
+    def test_invalid_engine(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(ValueError):
+            Summarizer(engine='unknown')
+    
+    def test_backend_selection(self, monkeypatch):
+        """Test that models are built by the configured backend."""
+        from src import backends
+        from tests.stubs import StubPipeline
+        built = []
+        monkeypatch.setitem(
+            backends.BACKENDS, 'int8',
+            lambda name, device, local_files_only, cache_dir: built.append(name) or StubPipeline(name)
+        )
+        summarizer = Summarizer(language='en', backend='int8')
+        summary, _ = summarizer.summarize("First point here. Second point here. Third one.", 0.5)
+        assert summary
+        assert built == [Summarizer.MODELS['en']]
+        with pytest.raises(ValueError):
+            Summarizer(backend='tensorrt')
+    
+    def test_onnx_exports_follow_cache_dir(self, monkeypatch, tmp_path):
+        """Test that backends receive the configured cache directory for their exports."""
+        from src import backends
+        from src.cache import SummaryCache
+        from tests.stubs import StubPipeline
+        dirs = []
+        monkeypatch.setitem(
+            backends.BACKENDS, 'onnx',
+            lambda name, device, local_files_only, cache_dir: dirs.append(cache_dir) or StubPipeline(name)
+        )
+        text = "First point here. Second point here. Third one."
+        Summarizer(language='en', backend='onnx', cache_dir=str(tmp_path / 'explicit')).summarize(text, 0.5)
+        cache = SummaryCache(tmp_path / 'summaries')
+        Summarizer(language='en', backend='onnx', cache=cache).summarize(text, 0.5)
+        cache.close()
+        assert dirs == [str(tmp_path / 'explicit'), tmp_path / 'summaries']
+        assert backends.onnx_export_dir('org/model', tmp_path) == tmp_path / 'onnx' / 'org--model'
+    
+    def test_offline_mode_uses_local_models(self, monkeypatch, tmp_path):
+        """Test that offline mode resolves models locally and never allows downloads."""
+        from src import backends
+        from tests.stubs import StubPipeline
+        built = []
+        monkeypatch.setitem(
+            backends.BACKENDS, 'torch',
+            lambda name, device, local_files_only, cache_dir: built.append((name, local_files_only)) or StubPipeline(name)
+        )
+        local = tmp_path / Summarizer.MODELS['en'].replace('/', '--')
+        local.mkdir()
+        (local / 'config.json').write_text('{}')
+        summarizer = Summarizer(language='en', model_dir=str(tmp_path), offline=True)
+        summarizer.summarize("First point here. Second point here. Third one.", 0.5)
+        summarizer.summarize("Nothing local for German. Still offline. Falls back.", 0.5, language='de')
+        assert built == [(str(local), True), (Summarizer.MODELS['de'], True)]
+    
+    def test_failed_load_is_not_retried_per_call(self):
+        """Test that a failed model load is remembered instead of retried for every text."""
+        from src.model_pool import ModelPool
+        attempts = []
+        
+        def failing_loader(name):
+            attempts.append(name)
+            raise OSError("no network")
+        
+        summarizer = Summarizer(language='en', model_pool=ModelPool(failing_loader))
+        extractive = Summarizer(language='en', engine='extractive')
+        texts = [f"Point {i} is made. Another point follows. A third point ends." for i in range(5)]
+        for text in texts:
+            assert summarizer.summarize(text, 0.3)[0] == extractive.summarize(text, 0.3)[0]
+        summarizer.summarize_many(texts, 0.3)
+        assert attempts == [Summarizer.MODELS['en']]
+        assert summarizer.model_stats()['skipped_loads'] == 5
+    
+    def test_memory_budget_falls_back_to_smaller_model(self):
+        """Test that a model over the budget is replaced by the smaller variant."""
+        from src.model_pool import ModelPool
+        from tests.stubs import StubPipeline
+        large, small = Summarizer.MODELS['en'], Summarizer.SMALL_MODELS['en']
+        loaded = []
+        pool = ModelPool(
+            lambda name: loaded.append(name) or StubPipeline(name),
+            max_memory_bytes=150,
+            size_estimator=lambda pipeline: 200 if pipeline.name == large else 100
+        )
+        summarizer = Summarizer(language='en', model_pool=pool)
+        text = "First point here. Second point here. Third one."
+        for _ in range(2):
+            assert summarizer.summarize(text, 0.5)[0]
+        assert loaded == [large, small]
+        assert summarizer.model_name == small
+        # The pool alone decides what stays resident
+        assert summarizer.summarizer_pipeline is None
+        assert summarizer.model_stats()['resident'] == [small]
+        
+        extractive = Summarizer(language='en', engine='extractive')
+        no_variant = Summarizer(language='en', fallback_models={}, model_pool=pool)
+        assert no_variant.summarize(text, 0.5)[0] == extractive.summarize(text, 0.5)[0]
+    
+    def test_expected_model_bytes_from_local_weights(self, tmp_path):
+        """Test that the budget check estimates a model's size from its local weights."""
+        local = tmp_path / 'org--model'
+        local.mkdir()
+        (local / 'config.json').write_text('{}')
+        (local / 'model.safetensors').write_bytes(b'0' * 1000)
+        (local / 'pytorch_model.bin').write_bytes(b'0' * 1000)
+        torch_model = Summarizer(model_dir=str(tmp_path))
+        int8_model = Summarizer(model_dir=str(tmp_path), backend='int8')
+        assert torch_model._expected_model_bytes('org/model') == 1000
+        assert int8_model._expected_model_bytes('org/model') == 400
+        assert torch_model._expected_model_bytes('org/missing') is None
+
+
+class TestGenerationProfiles:
+    """Test cases for decoding profiles."""
+    
+    def _calls(self, profile, words=2000):
+        from src.model_pool import ModelPool
+        from tests.stubs import StubPipeline
+        pipeline = StubPipeline()
+        summarizer = Summarizer(language='en', profile=profile, model_pool=ModelPool(lambda n: pipeline))
+        summarizer.summarize("Word " * (words - 1) + "end.", 0.5, reduce=False)
+        return pipeline.calls
+    
+    def test_fast_profile_is_greedy_and_capped(self):
+        """Test that the fast profile decodes greedily with a length cap."""
+        _, kwargs = self._calls('fast')[0]
+        assert kwargs['num_beams'] == 1
+        assert kwargs['max_new_tokens'] == 128
+        assert 'early_stopping' not in kwargs
+    
+    def test_quality_profile_uses_beam_search(self):
+        """Test that the quality profile keeps beam search and the full target."""
+        _, kwargs = self._calls('quality', words=512)[0]
+        assert kwargs['num_beams'] == 4
+        assert kwargs['early_stopping'] is True
+        assert kwargs['max_new_tokens'] == 256
+    
+    def test_profile_threads_restored_after_generation(self, monkeypatch):
+        """Test that a profile's thread count only applies inside its context."""
+        import contextlib
+        import sys
+        import types
+        from src.profiles import get_profile, inference_context
+        
+        class FakeTorch(types.ModuleType):
+            threads = 16
+            
+            def get_num_threads(self):
+                return self.threads
+            
+            def set_num_threads(self, threads):
+                self.threads = threads
+            
+            def inference_mode(self):
+                return contextlib.nullcontext()
+        
+        torch = FakeTorch('torch')
+        monkeypatch.setitem(sys.modules, 'torch', torch)
+        with inference_context(get_profile('fast')):
+            assert torch.threads == get_profile('fast').threads
+        assert torch.threads == 16
+        with pytest.raises(RuntimeError):
+            with inference_context(get_profile('fast')):
+                raise RuntimeError("generation failed")
+        assert torch.threads == 16
+    
+    def test_profile_is_part_of_cache_key(self):
+        """Test that profiles do not share cached summaries."""
+        fast = Summarizer(profile='fast')._generation_params(True)
+        quality = Summarizer(profile='quality')._generation_params(True)
+        assert fast != quality
+    
+    def test_invalid_profile(self):
+        """Test that unknown profiles are rejected."""
+        with pytest.raises(ValueError):
+            Summarizer(profile='ludicrous')
+
 
+class TestSummarizeMany:
+    """Test cases for batched summarization."""
+    
+    def _summarizer(self, loaded):
+        from src.model_pool import ModelPool
+        from tests.stubs import StubPipeline
+        
+        def loader(name):
+            loaded.append(name)
+            return StubPipeline(name)
+        
+        return Summarizer(model_pool=ModelPool(loader, max_models=3))
+    
+    def test_results_in_input_order(self):
+        """Test that results line up with the inputs."""
+        summarizer = self._summarizer([])
+        texts = [f"Document number {i} talks about topic {i}. " * (i + 1) for i in range(10)]
+        results = summarizer.summarize_many(texts, 0.5, batch_size=3, language='en')
+        assert len(results) == 10
+        for i, (summary, lang) in enumerate(results):
+            assert lang == 'en'
+            # Each text keeps its own target length, so the shortest summary is just its first words
+            assert summary.startswith(f"Document number {i}")
+            assert f"number {(i + 1) % 10}" not in summary
+    
+    def test_varied_lengths_still_fill_batches(self):
+        """Test that texts of different lengths share calls while keeping their targets close."""
+        from src.model_pool import ModelPool
+        from tests.stubs import StubPipeline
+        pipeline = StubPipeline()
+        summarizer = Summarizer(model_pool=ModelPool(lambda name: pipeline))
+        # Every text would need its own call if targets had to match exactly
+        texts = [' '.join(f"word{j}" for j in range(100 + 7 * i)) + '.' for i in range(64)]
+        summarizer.summarize_many(texts, 0.3, batch_size=8, language='en')
+        assert len(pipeline.calls) <= 12
+        for batch, kwargs in pipeline.calls:
+            for text in batch:
+                exact = int(len(text.split()) * 0.3)
+                assert abs(kwargs['max_new_tokens'] - exact) <= exact / 8
+    
+    def test_groups_by_language(self):
+        """Test that each language model is loaded once."""
+        loaded = []
+        summarizer = self._summarizer(loaded)
+        texts = [
+            "This is an English text about machine learning and data.",
+            "Это русский текст о машинном обучении и данных.",
+            "Dies ist ein deutscher Text über maschinelles Lernen und Daten.",
+            "Another English text about neural networks and the models.",
+            "Ещё один русский текст о нейронных сетях и моделях.",
+        ]
+        results = summarizer.summarize_many(texts, 0.5)
+        assert [lang for _, lang in results] == ['en', 'ru', 'de', 'en', 'ru']
+        assert sorted(loaded) == sorted(set(loaded))
+        assert len(loaded) == 3
+    
+    def test_empty_texts(self):
+        """Test that empty inputs keep their slot."""
+        summarizer = self._summarizer([])
+        results = summarizer.summarize_many(["", "Some text here. And more."], 0.5, language='en')
+        assert results[0] == ("", "unknown")
+        assert results[1][0]
+    
+    def test_extractive_engine(self):
+        """Test batched summarization without a model."""
+        summarizer = Summarizer(language='en', engine='extractive')
+        results = summarizer.summarize_many(["One. Two. Three. Four."] * 3, 0.5)
+        assert all(summary for summary, _ in results)
+
+
+class TestAsyncApi:
+    """Test cases for asummarize and aextract_key_points."""
+    
+    TEXT = "Cells divide by mitosis. Mitosis has four phases. DNA is copied first. " * 4
+    
+    def _summarizer(self, delay=0.0, **kwargs):
+        import threading
+        import time
+        from src.model_pool import ModelPool
+        from tests.stubs import StubPipeline
+        
+        class SlowPipeline(StubPipeline):
+            active = 0
+            peak = 0
+            lock = threading.Lock()
+            
+            def __call__(self, inputs, **call_kwargs):
+                with self.lock:
+                    SlowPipeline.active += 1
+                    SlowPipeline.peak = max(SlowPipeline.peak, SlowPipeline.active)
+                time.sleep(delay)
+                with self.lock:
+                    SlowPipeline.active -= 1
+                return super().__call__(inputs, **call_kwargs)
+        
+        summarizer = Summarizer(model_pool=ModelPool(SlowPipeline), **kwargs)
+        return summarizer, SlowPipeline
+    
+    def test_matches_sync_api(self):
+        """Test that the async methods return what the sync ones do."""
+        import asyncio
+        summarizer = Summarizer(language='en', engine='extractive')
+        try:
+            assert asyncio.run(summarizer.asummarize(self.TEXT, 0.5)) == summarizer.summarize(self.TEXT, 0.5)
+            assert (asyncio.run(summarizer.aextract_key_points(self.TEXT, 2))
+                    == summarizer.extract_key_points(self.TEXT, 2))
+            assert asyncio.run(summarizer.asummarize("  ")) == ("", "unknown")
+        finally:
+            summarizer.close()
+    
+    def test_concurrency_limited_per_model(self):
+        """Test that concurrent requests never exceed the per-model limit."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=4)
+        summarizer, pipeline = self._summarizer(
+            delay=0.05, language='en', model_concurrency=2, executor=executor
+        )
+        
+        async def run():
+            return await asyncio.gather(*(summarizer.asummarize(self.TEXT) for _ in range(6)))
+        
+        try:
+            results = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert all(lang == 'en' and summary for summary, lang in results)
+        assert pipeline.peak == 2
+    
+    def test_timeout_keeps_slot_until_worker_finishes(self):
+        """Test that a timed-out request holds its model slot while still running."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=2)
+        summarizer, pipeline = self._summarizer(delay=0.2, language='en', executor=executor)
+        
+        async def run():
+            with pytest.raises(asyncio.TimeoutError):
+                await summarizer.asummarize(self.TEXT, timeout=0.05)
+            # The next request waits for the abandoned inference instead of overlapping it
+            return await summarizer.asummarize(self.TEXT, timeout=5)
+        
+        try:
+            summary, _ = asyncio.run(run())
+        finally:
+            executor.shutdown()
+        assert summary
+        assert pipeline.peak == 1
+    
+    def test_cancelled_queued_request_never_runs(self):
+        """Test that cancelling a queued request skips its inference."""
+        import asyncio
+        summarizer, pipeline = self._summarizer(delay=0.1, language='en')
+        calls = []
+        
+        async def run():
+            first = asyncio.ensure_future(summarizer.asummarize(self.TEXT))
+            await asyncio.sleep(0.02)
+            second = asyncio.ensure_future(summarizer.asummarize(self.TEXT + " Extra."))
+            await asyncio.sleep(0.02)
+            second.cancel()
+            await first
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            calls.extend(summarizer.model_pool.get(Summarizer.MODELS['en']).calls)
+        
+        try:
+            asyncio.run(run())
+        finally:
+            summarizer.close()
+        assert len(calls) == 1